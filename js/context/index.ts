@@ -1,3 +1,5 @@
+import type { AnyModel } from '@anywidget/types';
+
 import { AsyncDuckDBConnection } from 'https://cdn.jsdelivr.net/npm/@duckdb/duckdb-wasm@1.29.0/+esm';
 
 import { wasmConnector } from 'https://cdn.jsdelivr.net/npm/@uwdata/mosaic-core@0.16.2/+esm';
@@ -6,12 +8,24 @@ import { InstantiateContext } from 'https://cdn.jsdelivr.net/npm/@uwdata/mosaic-
 
 import { INPUTS } from '../inputs';
 import { initDuckdb, waitForTable } from './duckdb';
+import { KernelConnector } from './kernel';
 import { ErrorInfo, initializeErrorHandling } from '../util/errors.js';
 import { sleep } from '../util/async.js';
 
+interface QueryMode {
+    selection: string;
+    mode: 'index' | 'scan';
+}
+
 class VizContext extends InstantiateContext {
-    private readonly tables_ = new Set<string>();
+    private readonly tables_ = new Map<string, Promise<void>>();
+    private readonly tableVersions_ = new Map<string, number>();
     private unhandledErrors_: ErrorInfo[] = [];
+    private kernelConnector_?: KernelConnector;
+    private readonly models_: AnyModel[] = [];
+    private readonly queryModes_ = new WeakMap<object, QueryMode>();
+    private readonly clientModels_ = new WeakMap<object, AnyModel>();
+    private readonly reportedParams_ = new WeakSet<object>();
 
     constructor(
         private readonly conn_: AsyncDuckDBConnection,
@@ -20,27 +34,199 @@ class VizContext extends InstantiateContext {
         super({ plotDefaults });
         this.api = { ...this.api, ...INPUTS };
         this.coordinator.databaseConnector(wasmConnector({ connection: this.conn_ }));
+        this.instrumentPreaggregation();
     }
 
-    async insertTable(table: string, data: Uint8Array) {
-        // just wait for it if we already have it
-        if (this.tables_.has(table)) {
-            await this.waitForTable(table);
+    addModel(model: AnyModel): () => void {
+        // rendered widgets (used to report selection state to the kernel)
+        this.models_.push(model);
+        return () => {
+            this.models_.splice(this.models_.indexOf(model), 1);
+        };
+    }
+
+    addClients(model: AnyModel, el: HTMLElement) {
+        // record the widget that rendered each client (query stats for a
+        // client are reported through the widget that owns it)
+        for (const node of [el, ...Array.from(el.querySelectorAll('*'))]) {
+            const value = (node as any).value;
+            if (Array.isArray(value?.marks)) {
+                for (const mark of value.marks) {
+                    this.clientModels_.set(mark, model);
+                }
+            } else if (value && this.coordinator.clients.has(value)) {
+                this.clientModels_.set(value, model);
+            }
+        }
+    }
+
+    activatePreaggregation(el: HTMLElement, selections: string[]) {
+        // activate interactors for selections that pre-aggregate so that
+        // their indexes are built before interaction begins
+        if (selections.length === 0) {
             return;
         }
+        for (const node of [el, ...Array.from(el.querySelectorAll('*'))]) {
+            const interactors = (node as any).value?.interactors;
+            if (Array.isArray(interactors)) {
+                for (const interactor of interactors) {
+                    const name = this.selectionName(interactor.selection);
+                    if (name && selections.includes(name)) {
+                        interactor.activate?.();
+                    }
+                }
+            }
+        }
+    }
+
+    reportState() {
+        // report selection clauses and param values to the kernel as they
+        // change (so they can be evaluated in python)
+        for (const [name, param] of this.activeParams ?? new Map()) {
+            if (this.reportedParams_.has(param)) {
+                continue;
+            }
+            this.reportedParams_.add(param);
+            param.addEventListener('value', () => {
+                const model = this.models_[this.models_.length - 1];
+                if (Array.isArray(param.clauses)) {
+                    model?.send({
+                        type: 'selection_state',
+                        selection: name,
+                        predicates: param.clauses
+                            .filter((clause: any) => clause.predicate != null)
+                            .map((clause: any) => String(clause.predicate)),
+                    });
+                } else {
+                    model?.send({ type: 'param_value', param: name, value: param.value });
+                }
+            });
+        }
+    }
+
+    private instrumentPreaggregation() {
+        // record whether client updates are served by a pre-aggregated
+        // index or a full table scan (along with their duration). mosaic
+        // doesn't expose this so we wrap its (internal) preaggregator and
+        // updateClient, and record nothing if they aren't available
+        const coordinator = this.coordinator as any;
+        const preaggregator = coordinator.preaggregator;
+        if (typeof preaggregator?.request !== 'function') {
+            return;
+        }
+        const request = preaggregator.request.bind(preaggregator);
+        preaggregator.request = (client: object, selection: unknown, activeClause: unknown) => {
+            const info = request(client, selection, activeClause);
+            const name = this.selectionName(selection);
+            if (name) {
+                this.queryModes_.set(client, { selection: name, mode: info ? 'index' : 'scan' });
+            }
+            return info;
+        };
+        const updateClient = coordinator.updateClient.bind(coordinator);
+        coordinator.updateClient = async (client: object, query: unknown, priority: unknown) => {
+            const start = performance.now();
+            try {
+                return await updateClient(client, query, priority);
+            } finally {
+                const queryMode = this.queryModes_.get(client);
+                if (queryMode) {
+                    this.queryModes_.delete(client);
+                    this.clientModels_.get(client)?.send({
+                        type: 'selection_stats',
+                        ...queryMode,
+                        ms: performance.now() - start,
+                    });
+                }
+            }
+        };
+    }
+
+    private selectionName(selection: unknown): string | undefined {
+        for (const [name, param] of this.activeParams ?? new Map()) {
+            if (param === selection) {
+                return name;
+            }
+        }
+        return undefined;
+    }
 
-        // add to list of tables
-        this.tables_.add(table);
+    async insertTable(table: string, data: Uint8Array, version: number = 0) {
+        // tables are addressed by their content, so if we already have (or
+        // are currently inserting) this table then just wait for it
+        const existing = this.tables_.get(table);
+        if (existing) {
+            await existing;
+            // replace the table if it is missing rows appended since it was
+            // inserted (we may not have received the appended rows)
+            if ((this.tableVersions_.get(table) ?? 0) < version) {
+                this.tableVersions_.set(table, version);
+                const replace = (async () => {
+                    await this.conn_.query(`DROP TABLE IF EXISTS "${table}"`);
+                    await this.conn_.insertArrowFromIPCStream(data, { name: table, create: true });
+                })();
+                this.tables_.set(table, replace);
+                await replace;
+                this.requeryTable(table);
+            }
+            return;
+        }
 
         // insert table into database
-        await this.conn_?.insertArrowFromIPCStream(data, {
+        this.tableVersions_.set(table, version);
+        const insert = this.conn_.insertArrowFromIPCStream(data, {
             name: table,
             create: true,
         });
+        this.tables_.set(table, insert);
+        await insert;
     }
 
     async waitForTable(table: string) {
-        await waitForTable(this.conn_, table);
+        // wait on the insert if it was initiated by this context
+        const existing = this.tables_.get(table);
+        if (existing) {
+            await existing;
+        } else {
+            await waitForTable(this.conn_, table);
+        }
+    }
+
+    async appendTable(table: string, version: number, data: Uint8Array) {
+        // each widget displaying the table receives the rows, so only
+        // insert them once
+        await this.waitForTable(table);
+        if ((this.tableVersions_.get(table) ?? 0) >= version) {
+            return;
+        }
+        this.tableVersions_.set(table, version);
+        await this.conn_.insertArrowFromIPCStream(data, { name: table, create: false });
+        this.requeryTable(table);
+    }
+
+    requeryTable(table: string) {
+        // invalidate cached queries and re-query clients of the table
+        this.coordinator.clear({ clients: false, cache: true });
+        for (const client of this.coordinator.clients) {
+            try {
+                if (String(client.query([])).includes(table)) {
+                    client.requestQuery();
+                }
+            } catch {
+                // clients that can't produce a query don't read the table
+            }
+        }
+    }
+
+    useKernel(model: AnyModel): () => void {
+        // execute queries in the python kernel rather than in the browser
+        // (this applies to every widget on the page, so the kernel also
+        // registers the tables sent to widgets using the browser backend)
+        if (!this.kernelConnector_) {
+            this.kernelConnector_ = new KernelConnector();
+            this.coordinator.databaseConnector(this.kernelConnector_);
+        }
+        return this.kernelConnector_.addModel(model);
     }
 
     recordUnhandledError(error: ErrorInfo) {
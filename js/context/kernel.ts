@@ -0,0 +1,73 @@
+import type { AnyModel } from '@anywidget/types';
+
+import { decodeIPC } from 'https://cdn.jsdelivr.net/npm/@uwdata/mosaic-core@0.16.2/+esm';
+
+interface QueryRequest {
+    type?: 'exec' | 'arrow' | 'json';
+    sql: string;
+}
+
+interface QueryResultMessage {
+    type: 'query_result';
+    id: number;
+    data?: unknown;
+    error?: string;
+}
+
+interface PendingQuery {
+    type: 'exec' | 'arrow' | 'json';
+    resolve: (value: unknown) => void;
+    reject: (reason: Error) => void;
+}
+
+// mosaic database connector that executes queries in the python kernel
+// (sending them over the comm of a widget that is currently rendered)
+export class KernelConnector {
+    private readonly models_: AnyModel[] = [];
+    private readonly pending_ = new Map<number, PendingQuery>();
+    private nextId_ = 0;
+
+    addModel(model: AnyModel): () => void {
+        const onCustomMessage = (msg: QueryResultMessage, buffers: DataView[]) => {
+            if (msg.type === 'query_result') {
+                this.handleResult(msg, buffers);
+            }
+        };
+        model.on('msg:custom', onCustomMessage);
+        this.models_.push(model);
+        return () => {
+            model.off('msg:custom', onCustomMessage);
+            this.models_.splice(this.models_.indexOf(model), 1);
+        };
+    }
+
+    query({ type = 'arrow', sql }: QueryRequest): Promise<unknown> {
+        const model = this.models_[this.models_.length - 1];
+        if (!model) {
+            return Promise.reject(new Error('No connection to the Python kernel.'));
+        }
+        const id = this.nextId_++;
+        return new Promise((resolve, reject) => {
+            this.pending_.set(id, { type, resolve, reject });
+            model.send({ type: 'query', id, sql, query_type: type });
+        });
+    }
+
+    private handleResult(msg: QueryResultMessage, buffers: DataView[]) {
+        const pending = this.pending_.get(msg.id);
+        if (!pending) {
+            return;
+        }
+        this.pending_.delete(msg.id);
+        if (msg.error !== undefined) {
+            pending.reject(new Error(msg.error));
+        } else if (pending.type === 'arrow') {
+            const buffer = buffers[0];
+            pending.resolve(
+                decodeIPC(new Uint8Array(buffer.buffer, buffer.byteOffset, buffer.byteLength))
+            );
+        } else {
+            pending.resolve(msg.data);
+        }
+    }
+}
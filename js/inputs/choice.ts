@@ -15,8 +15,8 @@ import {
 import { isObject } from '../util/object';
 
 import { Input, InputOptions } from './input';
-import { Option } from './types';
-import { setupActivationListeners } from './util';
+import { Option, Typeahead } from './types';
+import { setupActivationListeners, typeaheadQuery } from './util';
 
 export interface ChoiceInputOptions extends InputOptions {
     from?: string;
@@ -24,6 +24,7 @@ export interface ChoiceInputOptions extends InputOptions {
     options?: Array<Option>;
     field?: string;
     label?: string;
+    typeahead?: Typeahead;
 }
 
 export abstract class ChoiceInput extends Input {
@@ -65,9 +66,10 @@ export abstract class ChoiceInput extends Input {
     }
 
     query(filter: FilterExpr[] = []): SelectQuery | null {
-        const { from, column } = this.options_;
+        const { from, column, typeahead } = this.options_;
 
-        if (!from) {
+        // typeahead options are queried as the user types
+        if (!from || typeahead) {
             return null;
         }
 
@@ -96,6 +98,17 @@ export abstract class ChoiceInput extends Input {
         return values.map(v => ({ value: v }));
     }
 
+    // query options that start with text (for typeahead inputs)
+    protected async typeaheadOptions(text: string): Promise<Option[]> {
+        const { from, column, typeahead } = this.options_;
+        if (!from || !column || !typeahead) {
+            return [];
+        }
+        const filter = this.filterBy?.predicate(this);
+        const query = typeaheadQuery(from, column, text, typeahead, filter);
+        return this.queryResultOptions(await this.coordinator!.query(query));
+    }
+
     protected setOptions(options: Option[]) {
         this.setData(options.map(opt => (isObject(opt) ? opt : { value: opt })));
         this.update();
@@ -3,12 +3,13 @@ import {
     isParam,
     isSelection,
     SelectionClause,
+    toDataColumns,
 } from 'https://cdn.jsdelivr.net/npm/@uwdata/mosaic-core@0.16.2/+esm';
 import { FilterExpr, Query } from 'https://cdn.jsdelivr.net/npm/@uwdata/mosaic-sql@0.16.2/+esm';
 import { Input, InputOptions } from './input';
-import { setupActivationListeners } from './util';
+import { setupActivationListeners, typeaheadQuery } from './util';
 import { generateId } from '../util/id';
-import { kInputSearch, kSidebarFullwidth } from './types';
+import { kInputSearch, kSidebarFullwidth, kTypeaheadDelay, Typeahead } from './types';
 
 export interface SearchOptions extends InputOptions {
     from: string;
@@ -18,6 +19,7 @@ export interface SearchOptions extends InputOptions {
     placeholder?: string;
     field?: string;
     width?: number;
+    typeahead?: Typeahead;
 }
 
 export class Search extends Input {
@@ -25,6 +27,8 @@ export class Search extends Input {
     private readonly id_: string = generateId();
     private data_: Array<{ list: string }> = [];
     private datalist_?: HTMLDataListElement;
+    private typeaheadTimer_?: ReturnType<typeof setTimeout>;
+    private typeaheadQueries_ = 0;
 
     constructor(protected readonly options_: SearchOptions) {
         super(options_.filterBy);
@@ -55,6 +59,15 @@ export class Search extends Input {
         // track changes to search box
         this.input_.addEventListener('input', () => {
             this.publish(this.input_.value);
+
+            // query autocomplete values once typing pauses
+            if (this.options_.typeahead) {
+                clearTimeout(this.typeaheadTimer_);
+                this.typeaheadTimer_ = setTimeout(
+                    () => this.queryTypeahead(this.input_.value),
+                    kTypeaheadDelay
+                );
+            }
         });
 
         // track changes to param
@@ -93,6 +106,10 @@ export class Search extends Input {
     }
 
     query(filter: FilterExpr[] = []) {
+        // typeahead values are queried as the user types
+        if (this.options_.typeahead) {
+            return null;
+        }
         return Query.from(this.options_.from)
             .select({ list: this.options_.column })
             .distinct()
@@ -104,6 +121,26 @@ export class Search extends Input {
         return this;
     }
 
+    // query autocomplete values that start with text (ignoring results
+    // for text that has since changed)
+    private async queryTypeahead(text: string) {
+        const { from, column, typeahead } = this.options_;
+        const id = ++this.typeaheadQueries_;
+        const filter = this.filterBy?.predicate(this);
+        try {
+            const data = await this.coordinator!.query(
+                typeaheadQuery(from, column, text, typeahead!, filter)
+            );
+            if (id === this.typeaheadQueries_) {
+                const values = toDataColumns(data).columns.value as string[];
+                this.data_ = values.map(value => ({ list: value }));
+                this.update();
+            }
+        } catch (error) {
+            console.error(error);
+        }
+    }
+
     update(): this {
         const list = document.createElement('datalist');
         const id = `${this.id_}_list`;
@@ -1,7 +1,7 @@
 import { TomSettings } from 'tom-select/dist/esm/types/settings.js';
 import { generateId } from '../util/id';
 import { ChoiceInput, ChoiceInputOptions } from './choice';
-import { kSidebarFullwidth } from './types';
+import { kSidebarFullwidth, kTypeaheadDelay } from './types';
 
 import TomSelect from 'https://cdn.jsdelivr.net/npm/tom-select@2.4.3/+esm';
 import { isSelection } from 'https://cdn.jsdelivr.net/npm/@uwdata/mosaic-core@0.16.2/+esm';
@@ -69,11 +69,26 @@ export class Select extends ChoiceInput {
         // listeners
         this.setupParamListener();
         this.setupActivationListeners(this.select_);
+
+        // typeahead options are queried as the user types (so there is no
+        // query result to wait for before creating the menu)
+        if (options.typeahead) {
+            const initialValues = [this.initialValue_ ?? []].flat();
+            this.setData([
+                ...(this.allowEmptyOption() ? [{ value: '', label: 'All' }] : []),
+                ...initialValues.map(value => ({ value })),
+            ]);
+            this.update();
+        }
+    }
+
+    private allowEmptyOption() {
+        return !this.multiple_ && this.allowEmpty_;
     }
 
     queryResult(data: any): this {
         if (this.options_.options === undefined) {
-            if (this.multiple_ || !this.allowEmpty_) {
+            if (!this.allowEmptyOption()) {
                 this.setData(this.queryResultOptions(data));
                 return this;
             } else {
@@ -104,8 +119,10 @@ export class Select extends ChoiceInput {
             };
             if (!this.select_.multiple) {
                 config.allowEmptyOption = this.allowEmpty_;
-                // @ts-ignore
-                config.controlInput = null;
+                if (!this.options_.typeahead) {
+                    // @ts-ignore
+                    config.controlInput = null;
+                }
             } else {
                 config.plugins = {
                     remove_button: {
@@ -114,6 +131,32 @@ export class Select extends ChoiceInput {
                 };
             }
 
+            if (this.options_.typeahead) {
+                config.preload = 'focus';
+                config.loadThrottle = kTypeaheadDelay;
+                config.shouldLoad = () => true;
+                config.load = (query, callback) => {
+                    this.typeaheadOptions(query)
+                        .then(options => {
+                            if (this.allowEmptyOption()) {
+                                options = [{ value: '', label: 'All' }, ...options];
+                            }
+
+                            // replace previously loaded options (selected
+                            // options are retained)
+                            this.tomSelect_?.clearOptions();
+                            callback(
+                                options.map(o => ({ value: o.value, text: o.label || o.value })),
+                                []
+                            );
+                        })
+                        .catch(error => {
+                            console.error(error);
+                            callback([], []);
+                        });
+                };
+            }
+
             this.tomSelect_ = new TomSelect(this.select_, config);
 
             if (this.multiple_) {
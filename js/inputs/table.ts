@@ -82,6 +82,9 @@ import {
     SetFilterModel,
     ICombinedSimpleModel,
     RowSelectionOptions,
+    IDatasource,
+    IGetRowsParams,
+    IRowNode,
 } from 'https://cdn.jsdelivr.net/npm/ag-grid-community@33.3.2/+esm';
 
 import * as d3Format from 'https://cdn.jsdelivr.net/npm/d3-format@3.1.0/+esm';
@@ -96,6 +99,9 @@ import { AggregateNode, ExprValue } from '@uwdata/mosaic-sql';
 const kAutoRowCount = 12;
 const kAutoRowMaxHeight = 380;
 
+// Number of rows queried at a time by the server row model
+const kDefaultBlockSize = 100;
+
 type Transform = Record<string, any>;
 
 type Channel = string | Transform | boolean | number | undefined | Array<boolean | number>;
@@ -197,10 +203,14 @@ export interface TableOptions extends InputOptions {
         | 'single_checkbox'
         | 'multiple_checkbox'
         | 'none';
+    row_model?: 'client' | 'server';
+    block_size?: number;
     style?: TableStyle;
     auto_filling?: boolean;
 }
 
+type ColumnData = { numRows: number; columns: Record<string, Array<unknown>> };
+
 interface ColSortModel {
     colId: string;
     sort: 'asc' | 'desc' | null | undefined;
@@ -220,11 +230,16 @@ export class Table extends Input {
     private sortModel_: ColSortModel[] = [];
     private filterModel_: FilterModel = {};
 
-    private data_: { numRows: number; columns: Record<string, Array<unknown>> } = {
+    private data_: ColumnData = {
         numRows: 0,
         columns: {},
     };
 
+    // server row model state (the external filter and the filtered row count)
+    private filter_: FilterExpr[] = [];
+    private rowCount_ = -1;
+    private countOnly_ = false;
+
     constructor(protected readonly options_: TableOptions) {
         super(options_.filter_by);
 
@@ -302,6 +317,19 @@ export class Table extends Input {
         return clausePoints(fields, values, { source: this });
     }
 
+    // selection clause for rows loaded by the server row model (which
+    // aren't available in data_ so are read from the row nodes)
+    private nodesClause(nodes: IRowNode[] = []) {
+        const columns = this.getDatabaseColumns();
+        const fields = columns.map(column => column.column_id);
+        const values = nodes.map(node => columns.map(column => node.data?.[column.column_name]));
+        return clausePoints(fields, values, { source: this });
+    }
+
+    private serverRowModel() {
+        return this.options_.row_model === 'server';
+    }
+
     // mosaic calls this and initialization to let us fetch the schema
     // and do related setup
     async prepare() {
@@ -371,6 +399,22 @@ export class Table extends Input {
     // mosaic calls this every time it needs to show data to find
     // out what query we want to run
     query(filter: FilterExpr[] = []) {
+        if (this.serverRowModel()) {
+            // only count rows here, the datasource queries the rows being viewed
+            this.filter_ = filter;
+            return Query.from(this.rowsQuery(filter, this.filterModel_, [])).select({
+                count: count(),
+            });
+        }
+        return this.rowsQuery(filter, this.filterModel_, this.sortModel_);
+    }
+
+    private rowsQuery(
+        filter: FilterExpr[],
+        filterModel: FilterModel,
+        sortModel: ColSortModel[],
+        range?: { offset: number; limit: number }
+    ) {
         const selectItems: Record<string, ExprNode | string> = {};
         const groupBy: string[] = [];
         let has_aggregate = false;
@@ -403,11 +447,11 @@ export class Table extends Input {
         query = query.where(...filter);
 
         // apply the filter model
-        Object.keys(this.filterModel_).forEach(columnName => {
+        Object.keys(filterModel).forEach(columnName => {
             const col = this.columnsByName_[columnName] || {};
             if (col.type !== 'literal') {
                 const useHaving = col.type === 'aggregate';
-                const filter = this.filterModel_[columnName] as SupportedFilter;
+                const filter = filterModel[columnName] as SupportedFilter;
                 const expression = filterExpression(columnName, filter, query);
                 if (expression) {
                     if (useHaving) {
@@ -420,8 +464,8 @@ export class Table extends Input {
         });
 
         // Apply sorting
-        if (this.sortModel_.length > 0) {
-            this.sortModel_.forEach(sort => {
+        if (sortModel.length > 0) {
+            sortModel.forEach(sort => {
                 const col = this.columnsByName_[sort.colId] || {};
                 if (col.type !== 'literal') {
                     query = query.orderby(sort.sort === 'asc' ? asc(sort.colId) : desc(sort.colId));
@@ -429,44 +473,113 @@ export class Table extends Input {
             });
         }
 
+        // Query a window of rows. Windows are only consistent if rows are
+        // read in a deterministic order, so break ties in the sort on the
+        // columns (grouped rows are unique by their group columns, and
+        // ungrouped rows which tie on every column are interchangeable)
+        if (range) {
+            query = query.orderby(...groupBy.map(c => asc(c)));
+            query = query.limit(range.limit).offset(range.offset);
+        }
+
         return query;
     }
 
     // mosaic returns the results of the query() in this function.
     queryResult(data: any) {
-        this.data_ = toDataColumns(data);
+        if (this.serverRowModel()) {
+            this.rowCount_ = Number(toDataColumns(data).columns.count[0]);
+        } else {
+            this.data_ = toDataColumns(data);
+        }
         return this;
     }
 
     // requests a client UI update (e.g. to reflect results from a query)
     update() {
-        this.updateGrid(null);
+        if (this.serverRowModel()) {
+            this.updateServerGrid();
+        } else {
+            this.updateGrid(null);
+        }
         return this;
     }
 
-    private updateGrid = throttle(async () => {
+    private updateServerGrid() {
         if (!this.grid_) {
             return;
         }
 
-        // convert column-based data to row-based data for ag-grid
+        if (!this.options_.auto_filling && typeof this.options_.height !== 'number') {
+            this.element.style.height = `${kAutoRowMaxHeight}px`;
+        }
+
+        if (this.grid_.getGridOption('datasource') === undefined) {
+            // the first block is queried once the datasource is set
+            this.grid_.setGridOption('datasource', this.createDatasource());
+        } else {
+            this.grid_.setRowCount(this.rowCount_, true);
+
+            // the grid reloads rows itself when its filter model changes,
+            // otherwise the external filter has changed so reload them
+            if (!this.countOnly_) {
+                this.grid_.purgeInfiniteCache();
+            }
+        }
+        this.countOnly_ = false;
+    }
+
+    private createDatasource(): IDatasource {
+        return {
+            getRows: async (params: IGetRowsParams) => {
+                try {
+                    const limit = params.endRow - params.startRow;
+                    const query = this.rowsQuery(
+                        this.filter_,
+                        params.filterModel,
+                        params.sortModel,
+                        { offset: params.startRow, limit }
+                    );
+                    const data = toDataColumns(await this.coordinator!.query(query));
+                    const rows = this.toRows(data, params.startRow);
+                    const lastRow =
+                        rows.length < limit ? params.startRow + rows.length : this.rowCount_;
+                    params.successCallback(rows, lastRow);
+                } catch (e) {
+                    console.error(e);
+                    params.failCallback();
+                }
+            },
+        };
+    }
+
+    // convert column-based data to row-based data for ag-grid
+    private toRows(data: ColumnData, offset: number = 0) {
         const rowData: any[] = [];
-        for (let i = 0; i < this.data_.numRows; i++) {
+        for (let i = 0; i < data.numRows; i++) {
             const row: any = {};
             this.columns_.forEach(({ column_name, column }) => {
                 if (Array.isArray(column)) {
-                    const index = i % column.length;
+                    const index = (offset + i) % column.length;
                     row[column_name] = column[index];
                 } else if (typeof column === 'boolean' || typeof column === 'number') {
                     row[column_name] = column;
                 } else {
-                    row[column_name] = this.data_.columns[column_name][i];
+                    row[column_name] = data.columns[column_name][i];
                 }
             });
 
             rowData.push(row);
         }
+        return rowData;
+    }
+
+    private updateGrid = throttle(async () => {
+        if (!this.grid_) {
+            return;
+        }
 
+        const rowData = this.toRows(this.data_);
         this.grid_.setGridOption('rowData', rowData);
         if (this.data_.numRows < kAutoRowCount && this.options_.height === undefined) {
             this.grid_.setGridOption('domLayout', 'autoHeight');
@@ -504,7 +617,11 @@ export class Table extends Input {
 
             selectedRowBackgroundColor: this.options_.style?.selected_row_background_color,
         });
-        const domLayout = this.options_.height === 'auto' ? 'autoHeight' : undefined;
+        // (the server row model loads rows as they are scrolled into view
+        // so the table can't be sized to fit all of them)
+        const serverRowModel = this.serverRowModel();
+        const domLayout =
+            this.options_.height === 'auto' && !serverRowModel ? 'autoHeight' : undefined;
 
         // initialize grid options
         return {
@@ -523,7 +640,9 @@ export class Table extends Input {
             rowHeight: options.row_height,
             domLayout,
             columnDefs: [],
-            rowData: [],
+            rowModelType: serverRowModel ? 'infinite' : 'clientSide',
+            cacheBlockSize: serverRowModel ? options.block_size || kDefaultBlockSize : undefined,
+            rowData: serverRowModel ? undefined : [],
             rowSelection: explicitSelection,
             suppressCellFocus: true,
             enableCellTextSelection: true,
@@ -532,6 +651,13 @@ export class Table extends Input {
                 // Capture the filter model for server-side use
                 this.filterModel_ = this.grid_?.getFilterModel() || {};
 
+                // With the server row model the grid reloads its rows, so
+                // we only need to query the new row count
+                if (serverRowModel) {
+                    this.countOnly_ = true;
+                    this.rowCount_ = -1;
+                }
+
                 // Trigger server-side query
                 this.requestQuery();
             },
@@ -544,8 +670,11 @@ export class Table extends Input {
                         .map(col => ({ colId: col.colId, sort: col.sort }));
                     this.sortModel_ = sortModel;
 
-                    // requery using the new sort model
-                    this.requestQuery();
+                    // requery using the new sort model (the server row
+                    // model reloads its rows with the sort model itself)
+                    if (!serverRowModel) {
+                        this.requestQuery();
+                    }
                 }
             },
             onSelectionChanged: event => {
@@ -557,7 +686,11 @@ export class Table extends Input {
                             .filter(n => n !== null);
 
                         // Update the selection clause in the target selection
-                        this.options_.as.update(this.clause(rowIndices));
+                        this.options_.as.update(
+                            serverRowModel
+                                ? this.nodesClause(event.selectedNodes)
+                                : this.clause(rowIndices)
+                        );
                     }
                 }
             },
@@ -570,7 +703,11 @@ export class Table extends Input {
                         rowIndex !== this.currentRow_
                     ) {
                         this.currentRow_ = rowIndex;
-                        this.options_.as.update(this.clause([rowIndex]));
+                        this.options_.as.update(
+                            serverRowModel
+                                ? this.nodesClause([event.node])
+                                : this.clause([rowIndex])
+                        );
                     }
                 }
             },
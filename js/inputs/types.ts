@@ -2,3 +2,7 @@ export const kSidebarFullwidth = 'sidebar-fullwidth';
 export const kInputSearch = 'input-search';
 
 export type Option = { value: string; label?: string };
+
+// Options queried as the user types (debounced by kTypeaheadDelay ms)
+export type Typeahead = { limit: number; index?: boolean };
+export const kTypeaheadDelay = 250;
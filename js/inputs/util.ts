@@ -1,6 +1,13 @@
+import {
+    column,
+    FilterExpr,
+    literal,
+    Query,
+    sql,
+} from 'https://cdn.jsdelivr.net/npm/@uwdata/mosaic-sql@0.16.2/+esm';
 import { generateId } from '../util/id';
 import { Input } from './input';
-import { Option } from './types';
+import { Option, Typeahead } from './types';
 
 export function createFieldset(legend?: string): HTMLFieldSetElement {
     const fieldset = window.document.createElement('fieldset');
@@ -52,6 +59,28 @@ export function createLabeledInput(
     return { inputLabel, input };
 }
 
+// query (up to typeahead.limit) values of a column that start with text
+export function typeaheadQuery(
+    from: string,
+    name: string,
+    text: string,
+    typeahead: Typeahead,
+    filter?: FilterExpr
+) {
+    const pattern = text.replace(/[!%_]/g, c => `!${c}`) + '%';
+    const query = Query.from(from)
+        .select({ value: name })
+        .where(
+            filter ?? [],
+            sql`CAST(${column(name)} AS VARCHAR) ILIKE ${literal(pattern)} ESCAPE '!'`
+        )
+        .orderby(name)
+        .limit(typeahead.limit);
+
+    // indexes are already distinct
+    return typeahead.index ? query : query.distinct();
+}
+
 export function setupActivationListeners(input: Input, element: HTMLElement) {
     // trigger selection activation
     element.addEventListener('pointerenter', evt => {
@@ -20,9 +20,23 @@ import { installTextCollisionHandler } from '../plot/text-collision';
 import { applyTickFormatting } from '../plot/ticks';
 import { installLegendHandler, legendPaddingRegion } from '../plot/legend';
 
+// tables are sent as binary buffers (which arrive as a DataView) or as
+// base64 encoded strings (when embedded in standalone html)
+type TableData = string | DataView | ArrayBuffer | Uint8Array;
+
 interface MosaicProps {
-    tables: Record<string, string>;
+    tables: Record<string, TableData>;
+    table_versions: Record<string, number>;
     spec: string;
+    query_backend: 'browser' | 'kernel';
+    preaggregate: string[];
+    warnings: string[];
+}
+
+interface AppendMessage {
+    type: 'append';
+    table: string;
+    version: number;
 }
 
 async function render({ model, el }: RenderProps<MosaicProps>) {
@@ -37,9 +51,16 @@ async function render({ model, el }: RenderProps<MosaicProps>) {
     // handle tick formatting
     applyTickFormatting(spec);
 
+    // register with the context (for reporting selection state)
+    const removeModel = ctx.addModel(model);
+
+    // route queries to the kernel if requested
+    const removeKernelModel =
+        model.get('query_backend') === 'kernel' ? ctx.useKernel(model) : undefined;
+
     // insert/wait for tables to be ready
-    const tables: Record<string, string> = model.get('tables') || {};
-    await syncTables(ctx, tables);
+    const tables: Record<string, TableData> = model.get('tables') || {};
+    await syncTables(ctx, tables, model.get('table_versions') || {});
 
     // render mosaic spec
     el.classList.add('mosaic-widget');
@@ -66,6 +87,9 @@ async function render({ model, el }: RenderProps<MosaicProps>) {
             el.innerHTML = '';
             el.appendChild(specEl);
 
+            // display warnings (e.g. downsampled data)
+            displayWarnings(el, model.get('warnings') || []);
+
             // For plots, replace the tooltip implementation with
             // our own implementation
             installPlotTooltips(specEl);
@@ -77,6 +101,14 @@ async function render({ model, el }: RenderProps<MosaicProps>) {
             // install legend handlers
             installLegendHandler(specEl, !renderOptions.autoFill);
 
+            // build indexes for selections that pre-aggregate (reporting
+            // query stats for our clients through our model)
+            ctx.addClients(model, specEl);
+            ctx.activatePreaggregation(specEl, model.get('preaggregate') || []);
+
+            // report selection and param state to the kernel
+            ctx.reportState();
+
             await displayUnhandledErrors(ctx, el);
         } catch (e: unknown) {
             console.error(e);
@@ -86,13 +118,27 @@ async function render({ model, el }: RenderProps<MosaicProps>) {
     };
     await renderSpec();
 
+    // insert rows appended to tables (clients then re-query)
+    const onCustomMessage = async (msg: AppendMessage, buffers: DataView[]) => {
+        if (msg.type === 'append') {
+            if (buffers.length > 0) {
+                await ctx.appendTable(msg.table, msg.version, tableBytes(buffers[0]));
+            } else {
+                // kernel backend tables are updated in the kernel
+                ctx.requeryTable(msg.table);
+            }
+        }
+    };
+    model.on('msg:custom', onCustomMessage);
+
     // if we are doing auto-fill then re-render when size changes
+    let resizeObserver: ResizeObserver | undefined;
     if (renderOptions.autoFill && !isInputSpec(spec)) {
         let lastContainerWidth = el.clientWidth;
         let lastContainerHeight = el.clientHeight;
 
         // re-render on container size changed
-        const resizeObserver = new ResizeObserver(
+        resizeObserver = new ResizeObserver(
             throttle(async () => {
                 if (
                     lastContainerWidth !== el.clientWidth ||
@@ -105,27 +151,28 @@ async function render({ model, el }: RenderProps<MosaicProps>) {
             })
         );
         resizeObserver.observe(el);
-
-        // cleanup resize observer on disconnect
-        return () => {
-            resizeObserver.disconnect();
-        };
     }
+
+    // cleanup message handlers and resize observer on disconnect
+    return () => {
+        model.off('msg:custom', onCustomMessage);
+        removeKernelModel?.();
+        removeModel();
+        resizeObserver?.disconnect();
+    };
 }
 
 // insert/wait for tables to be ready
-async function syncTables(ctx: VizContext, tables: Record<string, string>) {
-    for (const [tableName, base64Data] of Object.entries(tables)) {
-        if (base64Data) {
-            // decode base64 to bytes
-            const binaryString = atob(base64Data);
-            const bytes = new Uint8Array(binaryString.length);
-            for (let i = 0; i < binaryString.length; i++) {
-                bytes[i] = binaryString.charCodeAt(i);
-            }
-
+async function syncTables(
+    ctx: VizContext,
+    tables: Record<string, TableData>,
+    versions: Record<string, number>
+) {
+    for (const [tableName, tableData] of Object.entries(tables)) {
+        const bytes = tableBytes(tableData);
+        if (bytes.byteLength > 0) {
             // insert table into context
-            await ctx.insertTable(tableName, bytes);
+            await ctx.insertTable(tableName, bytes, versions[tableName] ?? 0);
         } else {
             // wait for table if no data provided
             await ctx.waitForTable(tableName);
@@ -133,6 +180,33 @@ async function syncTables(ctx: VizContext, tables: Record<string, string>) {
     }
 }
 
+function tableBytes(tableData: TableData): Uint8Array {
+    if (typeof tableData === 'string') {
+        return base64ToBytes(tableData);
+    } else if (tableData instanceof Uint8Array) {
+        return tableData;
+    } else if (ArrayBuffer.isView(tableData)) {
+        // binary buffers arrive as a view (use its bytes without copying)
+        return new Uint8Array(tableData.buffer, tableData.byteOffset, tableData.byteLength);
+    } else {
+        return new Uint8Array(tableData);
+    }
+}
+
+function base64ToBytes(base64Data: string): Uint8Array {
+    // use native decoding where available
+    const fromBase64 = (Uint8Array as any).fromBase64;
+    if (typeof fromBase64 === 'function') {
+        return fromBase64(base64Data) as Uint8Array;
+    }
+    const binaryString = atob(base64Data);
+    const bytes = new Uint8Array(binaryString.length);
+    for (let i = 0; i < binaryString.length; i++) {
+        bytes[i] = binaryString.charCodeAt(i);
+    }
+    return bytes;
+}
+
 interface RenderOptions {
     autoFill: boolean;
     autoFillScrolling: boolean;
@@ -258,6 +332,15 @@ async function astToDOM(ast: SpecNode, ctx: InstantiateContext) {
     return ast.root.instantiate(ctx);
 }
 
+function displayWarnings(el: HTMLElement, warnings: string[]) {
+    for (const warning of warnings) {
+        const warningEl = document.createElement('div');
+        warningEl.className = 'viz-warning';
+        warningEl.textContent = warning;
+        el.insertBefore(warningEl, el.firstChild);
+    }
+}
+
 async function displayUnhandledErrors(ctx: VizContext, widgetEl: HTMLElement) {
     // empty plot divs indicate a possible unhandled error, look for these
     // and then attempt to collect and display unhandled errors
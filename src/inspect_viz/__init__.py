@@ -1,12 +1,16 @@
 from ._core import (
+    ColumnStats,
     Component,
     Data,
+    DataCacheStats,
     Options,
     Param,
     ParamValue,
     Selection,
+    SelectionStats,
     options,
     options_context,
+    session,
 )
 
 try:
@@ -17,12 +21,16 @@ except ImportError:
 
 __all__ = [
     "Data",
+    "DataCacheStats",
+    "ColumnStats",
     "Param",
     "ParamValue",
     "Selection",
+    "SelectionStats",
     "Component",
     "options",
     "options_context",
+    "session",
     "Options",
     "__version__",
 ]
@@ -1,18 +1,24 @@
 # ruff: noqa: F401
 
+from ._cache import DataCacheStats
 from ._options import Options, options, options_context
+from ._session import session
 from .component import Component
-from .data import Data
+from .data import ColumnStats, Data
 from .param import Param, ParamValue
-from .selection import Selection
+from .selection import Selection, SelectionStats
 
 __all__ = [
     "Data",
+    "DataCacheStats",
+    "ColumnStats",
     "Param",
     "ParamValue",
     "Selection",
+    "SelectionStats",
     "Component",
     "Options",
     "options",
     "options_context",
+    "session",
 ]
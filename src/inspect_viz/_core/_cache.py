@@ -0,0 +1,161 @@
+import hashlib
+import os
+import tempfile
+from os import PathLike
+from typing import Callable, Sequence, TypedDict
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ._options import options
+
+# bump when the way files are read changes (invalidates existing entries)
+CACHE_VERSION = 1
+CACHE_EXT = ".arrows"
+
+
+class DataCacheStats(TypedDict):
+    """Statistics for the data file cache (see `Options.data_cache`)."""
+
+    hits: int
+    """Files read from the cache (in this process)."""
+
+    misses: int
+    """Files read from their source and then cached (in this process)."""
+
+    entries: int
+    """Number of files in the cache."""
+
+    bytes: int
+    """Total size of files in the cache."""
+
+    max_bytes: int
+    """Maximum size of files in the cache."""
+
+
+_hits = 0
+_misses = 0
+
+
+def cached_table(
+    path: str | PathLike[str],
+    columns: Sequence[str] | None,
+    filter: pc.Expression | None,
+    read: Callable[[], pa.Table],
+) -> tuple[pa.Table, pa.Buffer | None]:
+    """Read a table through the data file cache (if it is enabled).
+
+    Returns the table and (when read from the cache) the memory mapped ipc
+    stream it was read from.
+
+    Args:
+       path: Source file.
+       columns: Columns read from the file.
+       filter: Filter applied when reading the file.
+       read: Function that reads the table from the source file.
+    """
+    global _hits, _misses
+
+    cache_dir = options.data_cache
+    if cache_dir is None:
+        return read(), None
+
+    # memory map the cached ipc stream if we have it
+    cache_file = os.path.join(cache_dir, _cache_key(path, columns, filter) + CACHE_EXT)
+    cached = _read_cache_file(cache_file)
+    if cached is not None:
+        os.utime(cache_file)  # mark as recently used
+        _hits += 1
+        return cached
+
+    # read from source and cache (then use the cached file so that the
+    # table is memory mapped and laid out the same as on subsequent reads)
+    _misses += 1
+    table = read()
+    os.makedirs(cache_dir, exist_ok=True)
+    _write_cache_file(cache_file, table)
+    _evict(cache_dir, options.data_cache_size)
+    cached = _read_cache_file(cache_file)
+    return cached if cached is not None else (table, None)
+
+
+def cache_stats() -> DataCacheStats:
+    entries = _cache_entries(options.data_cache) if options.data_cache else []
+    return DataCacheStats(
+        hits=_hits,
+        misses=_misses,
+        entries=len(entries),
+        bytes=sum(size for _, size, _ in entries),
+        max_bytes=options.data_cache_size,
+    )
+
+
+def _cache_key(
+    path: str | PathLike[str],
+    columns: Sequence[str] | None,
+    filter: pc.Expression | None,
+) -> str:
+    stat = os.stat(path)
+    key = "\0".join(
+        [
+            str(CACHE_VERSION),
+            os.path.abspath(path),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            repr(list(columns)) if columns is not None else "",
+            str(filter) if filter is not None else "",
+        ]
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _read_cache_file(cache_file: str) -> tuple[pa.Table, pa.Buffer] | None:
+    try:
+        stream = pa.memory_map(cache_file).read_buffer()
+        return pa.ipc.open_stream(stream).read_all(), stream
+    except (OSError, pa.ArrowInvalid):
+        return None  # not cached, evicted, or incomplete
+
+
+def _write_cache_file(cache_file: str, table: pa.Table) -> None:
+    # write to a temp file and then move into place so that readers never
+    # see a partially written file (the cache is best effort so errors like
+    # a full disk just mean the table isn't cached)
+    fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    os.close(fd)
+    try:
+        with pa.OSFile(temp_file, "wb") as sink:
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                for batch in table.to_batches():
+                    writer.write_batch(batch)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def _evict(cache_dir: str, max_bytes: int) -> None:
+    # remove least recently used files until we are within max_bytes
+    entries = sorted(_cache_entries(cache_dir), key=lambda entry: entry[2])
+    total = sum(size for _, size, _ in entries)
+    for file, size, _ in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(file)
+            total -= size
+        except OSError:
+            pass  # in use (windows) or already removed
+
+
+def _cache_entries(cache_dir: str) -> list[tuple[str, int, float]]:
+    entries: list[tuple[str, int, float]] = []
+    if os.path.isdir(cache_dir):
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(CACHE_EXT):
+                try:
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+                except OSError:
+                    pass
+    return entries
@@ -5,8 +5,11 @@ from typing import Iterator, Literal, TypedDict
 from typing_extensions import Unpack
 
 
-class OptionsArgs(TypedDict):
+class OptionsArgs(TypedDict, total=False):
     output_format: Literal["auto", "js", "png"]
+    query_backend: Literal["browser", "kernel"]
+    data_cache: str | None
+    data_cache_size: int
 
 
 class Options(SimpleNamespace):
@@ -21,8 +24,40 @@ class Options(SimpleNamespace):
     be disabled in this case).
     """
 
+    query_backend: Literal["browser", "kernel"]
+    """Where queries from interactive components are executed.
 
-options: Options = Options(output_format="auto")
+    Defaults to "browser", which sends data to DuckDB running in the browser.
+    Specify "kernel" to instead run queries using DuckDB in the Python kernel
+    (only query results are sent to the browser, so this works for data that
+    is too large to send to the browser). Requires the `duckdb` package, and
+    is not used for output that is published without a kernel (e.g. Quarto
+    documents or `to_html()`).
+    """
+
+    data_cache: str | None
+    """Directory for caching data read from files.
+
+    Defaults to `None` (no caching). When specified, data read by
+    `Data.from_file()` and `Data.from_files()` is cached as Arrow IPC (keyed
+    by file path, size, modification time, and read options) and memory
+    mapped when the file is read again (e.g. after a kernel restart). Use
+    `Data.cache_stats()` to check cache usage.
+    """
+
+    data_cache_size: int
+    """Maximum size of the data cache in bytes (defaults to 5 GB).
+
+    Least recently used files are removed when the cache exceeds this size.
+    """
+
+
+options: Options = Options(
+    output_format="auto",
+    query_backend="browser",
+    data_cache=None,
+    data_cache_size=5 * 1024**3,
+)
 """Inspect Viz global options."""
 
 
@@ -0,0 +1,106 @@
+import threading
+import weakref
+from typing import Any, Literal, cast
+
+import pyarrow as pa
+from pydantic import JsonValue
+from pydantic_core import to_jsonable_python
+
+from .._util.instances import InstanceRegistry, current_registry
+from .data import Data, _ipc_stream_buffer
+
+QueryType = Literal["exec", "arrow", "json"]
+
+
+def kernel_query(sql: str, query_type: QueryType) -> pa.Buffer | JsonValue:
+    """Execute a query from a widget against data in the Python kernel.
+
+    Args:
+       sql: SQL query.
+       query_type: "exec" (no result), "arrow" (arrow ipc stream), or "json"
+          (list of row objects).
+    """
+    table = _kernel_execute(sql, fetch=query_type != "exec")
+    if table is None:
+        return None
+    elif query_type == "arrow":
+        return _ipc_stream_buffer(table)
+    else:
+        return cast(JsonValue, to_jsonable_python(table.to_pylist()))
+
+
+def kernel_table(sql: str) -> pa.Table:
+    """Execute a query against data in the Python kernel.
+
+    Args:
+       sql: SQL query.
+    """
+    return cast(pa.Table, _kernel_execute(sql, fetch=True))
+
+
+def _kernel_execute(sql: str, fetch: bool) -> pa.Table | None:
+    # widget messages may be handled on other threads, so queries are
+    # executed one at a time
+    with _lock:
+        database = _kernel_database()
+        connection = database.connection
+
+        # register (or re-register after appends) the data sources. the
+        # kernel backend answers queries for every widget on the page, so
+        # projections of data sent to widgets using the browser backend
+        # are also registered
+        for data in Data._get_tables().values():
+            version = (weakref.ref(data), data._version)
+            for table in [data.table, *data._projections]:
+                if database.registered.get(table) != version:
+                    connection.register(table, data._get_table(table))
+                    database.registered[table] = version
+
+        # unregister data that has been released
+        for table, (ref, _) in list(database.registered.items()):
+            if ref() is None:
+                connection.unregister(table)
+                del database.registered[table]
+
+        # execute query (fetching the result before another query can run)
+        result = connection.execute(sql)
+        if not fetch:
+            return None
+        # (arrow() returns a table or record batch reader depending on version)
+        return pa.table(result.arrow())
+
+
+def kernel_connection() -> Any:
+    """DuckDB connection for the current session."""
+    with _lock:
+        return _kernel_database().connection
+
+
+class _KernelDatabase:
+    def __init__(self, connection: Any) -> None:
+        self.connection = connection
+        self.registered: dict[str, tuple[weakref.ref[Data], int]] = {}
+
+
+# each session queries its own data (so has its own database, which is
+# released along with the session)
+_databases: weakref.WeakKeyDictionary[InstanceRegistry, _KernelDatabase] = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.RLock()
+
+
+def _kernel_database() -> _KernelDatabase:
+    registry = current_registry()
+    database = _databases.get(registry)
+    if database is None:
+        try:
+            import duckdb
+        except ImportError:
+            raise ModuleNotFoundError(
+                "The 'kernel' query backend requires the duckdb package. Install with:\n\npip install duckdb"
+            ) from None
+
+        database = _KernelDatabase(duckdb.connect())
+        _databases[registry] = database
+    return database
@@ -0,0 +1,22 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from .._util.instances import InstanceRegistry, registry_context
+
+
+@contextmanager
+def session() -> Iterator[None]:
+    """Context manager for a session that scopes data, params, and selections.
+
+    Data, params, and selections created within a session are visible only
+    to components created within it (components continue to use their
+    session when rendered or interacted with after it exits). Sessions are
+    isolated across threads and async tasks, so are useful in long running
+    processes that create visualizations for concurrent requests.
+
+    Data is released once no longer referenced (by your code or by
+    components) whether or not it was created within a session. Params and
+    selections are released along with their session.
+    """
+    with registry_context(InstanceRegistry()):
+        yield
@@ -1,40 +1,53 @@
 import base64
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import Any, Literal, TypeAlias, cast
 
+import pyarrow as pa
 import traitlets
 from anywidget import AnyWidget
-from pydantic import JsonValue
+from pydantic import BaseModel, JsonValue
 from pydantic_core import to_json, to_jsonable_python
 
 from .._util.constants import WIDGETS_DIR
+from .._util.instances import current_registry, registry_context
 from .._util.marshall import dict_remove_none
 from .._util.platform import quarto_png, running_in_colab, running_in_quarto
 from ._options import options
+from ._query import kernel_connection, kernel_query
 from .data import Data
+from .param import PARAM_PREFIX
 from .param import Param as VizParam
+from .selection import SELECTION_PREFIX
 from .selection import Selection as VizSelection
 
+TableBytes: TypeAlias = bytes | memoryview | pa.Buffer
 
-class TablesData(traitlets.TraitType[dict[str, str], dict[str, str | bytes]]):
+
+class TablesData(
+    traitlets.TraitType[dict[str, str | memoryview], dict[str, str | TableBytes]]
+):
     """Custom traitlet for handling multiple table/data pairs.
 
-    Accepts a dict of {table_name: bytes_data} and serializes it as JSON
-    with base64-encoded data values for transmission to the frontend.
+    Accepts a dict of {table_name: bytes_data} or {table_name: base64_data}.
+    Bytes are transmitted to the frontend as binary buffers (avoiding the
+    size and decoding overhead of base64). Base64 strings are transmitted
+    as-is (used when embedding tables in standalone HTML).
     """
 
     info_text = "a dict of table names to data bytes"
 
-    def validate(self, obj: Any, value: Any) -> dict[str, str]:
+    def validate(self, obj: Any, value: Any) -> dict[str, str | memoryview]:
         if not isinstance(value, dict):
             self.error(obj, value)
 
-        # Convert bytes values to base64 strings for JSON serialization
-        serialized = {}
+        # Expose bytes values as memoryviews (which the widget comm
+        # separates from the JSON state and sends as binary buffers)
+        serialized: dict[str, str | memoryview] = {}
         for key, data in value.items():
-            if isinstance(data, bytes):
-                serialized[key] = base64.b64encode(data).decode("utf-8")
+            if isinstance(data, (bytes, memoryview, pa.Buffer)):
+                serialized[key] = memoryview(data)
             elif isinstance(data, str):
                 # Already base64 encoded
                 serialized[key] = data
@@ -44,8 +57,30 @@ class TablesData(traitlets.TraitType[dict[str, str], dict[str, str | bytes]]):
         return serialized
 
 
+class SpecNode:
+    """Part of a component spec that is not displayed on its own.
+
+    Marks, interactors, and legends are only ever displayed within a plot
+    (or layout), so unlike `Component` they are plain (slotted) objects
+    rather than widgets. Their config is included in the spec of the
+    component that displays them.
+    """
+
+    __slots__ = ("_config", "_data")
+
+    def __init__(self, config: dict[str, JsonValue]) -> None:
+        self._config = config
+
+        # hold the data we reference (data is released once unreferenced)
+        self._data = spec_data(config)
+
+    @property
+    def config(self) -> dict[str, JsonValue]:
+        return self._config
+
+
 class Component(AnyWidget):
-    """Data visualization component (input, plot, mark, table, layout, etc.).
+    """Data visualization component (input, plot, table, layout, etc.).
 
     Visualization components are Jupyter widgets that can be used in
     any notebook or Jupyter based publishing system.
@@ -86,6 +121,18 @@ class Component(AnyWidget):
 
         super().__init__()
         self._config = config
+        self._payload_tables: dict[str, str] | None = None
+
+        # hold the data we reference (data is released once unreferenced)
+        # and the session to resolve data, params, and selections within
+        self._data = spec_data(config)
+        self._registry = current_registry()
+
+        # handle queries for the kernel query backend
+        self.on_msg(self._handle_message)
+
+        # record column references for data that resolves them automatically
+        reference_spec_columns(config)
 
         # eager bind as requested -- basically, in any environment where
         # _repr_mimebundle_ might is not called (e.g. colab) we need to
@@ -96,9 +143,18 @@ class Component(AnyWidget):
                 self.spec = self._create_spec()
             if bind_tables:
                 if bind_tables is True:
-                    self.tables = all_tables(collect=False)
+                    self.tables = spec_tables(
+                        self._config,
+                        collect=False,
+                        payload_tables=self._spec_payload_tables(),
+                    )
                 else:
-                    self.tables = all_tables_empty()
+                    self.tables = spec_tables_empty(
+                        self._config, payload_tables=self._spec_payload_tables()
+                    )
+                self.table_versions = spec_table_versions(
+                    self._config, payload_tables=self._spec_payload_tables()
+                )
 
     @property
     def config(self) -> dict[str, JsonValue]:
@@ -126,21 +182,102 @@ class Component(AnyWidget):
             else:
                 return None
 
-        # standard js output
+        # standard js output (quarto documents have no kernel to query)
         else:
-            return self._mimebundle(collect=running_in_quarto(), **kwargs)
+            return self._mimebundle(
+                collect=running_in_quarto(),
+                query_backend="browser"
+                if running_in_quarto()
+                else options.query_backend,
+                **kwargs,
+            )
 
     def _mimebundle(
-        self, *, collect: bool, **kwargs: Any
+        self,
+        *,
+        collect: bool,
+        binary: bool = True,
+        query_backend: Literal["browser", "kernel"] = "browser",
+        **kwargs: Any,
     ) -> tuple[dict[str, Any], dict[str, Any]] | None:
-        # set current tables
-        self.tables = all_tables(collect=collect)
+        # resolve params, selections, and data in the session we were created in
+        with registry_context(self._registry):
+            # set tables referenced by the spec (the kernel backend queries
+            # tables in the kernel so doesn't send them)
+            self.query_backend = query_backend
+            if query_backend == "kernel":
+                kernel_connection()
+                self.tables = {}
+                self.table_versions = {}
+            else:
+                self.tables = spec_tables(
+                    self._config,
+                    collect=collect,
+                    binary=binary,
+                    payload_tables=self._spec_payload_tables(),
+                )
+                self.table_versions = spec_table_versions(
+                    self._config, payload_tables=self._spec_payload_tables()
+                )
+
+            # ensure spec
+            if not self.spec:
+                self.spec = self._create_spec()
 
-        # ensure spec
-        if not self.spec:
-            self.spec = self._create_spec()
+            # warnings to display (e.g. downsampled data)
+            self.warnings = [
+                warning
+                for data in spec_data(self._config)
+                if (warning := data._sample_warning()) is not None
+            ]
+
+            # selections to build pre-aggregated indexes for
+            self.preaggregate = [
+                selection.id
+                for selection in spec_selections(self._config)
+                if selection.preaggregate
+            ]
+
+            # register to receive rows appended to our data
+            for data in spec_data(self._config):
+                data._add_widget(self)
+
+            return super()._repr_mimebundle_(**kwargs)
+
+    def _send_rows(self, table: str, version: int, rows: pa.Buffer | None) -> None:
+        self.send(
+            {"type": "append", "table": table, "version": version},
+            buffers=[memoryview(rows)] if rows is not None else None,
+        )
 
-        return super()._repr_mimebundle_(**kwargs)
+    def _handle_message(
+        self, _widget: Any, content: dict[str, Any], buffers: list[bytes]
+    ) -> None:
+        # handle messages in the session we were created in
+        with registry_context(self._registry):
+            if content.get("type") == "selection_stats":
+                for selection in VizSelection._get_all():
+                    if selection.id == content["selection"]:
+                        selection._record_query(content["mode"], content["ms"])
+            elif content.get("type") == "selection_state":
+                for selection in VizSelection._get_all():
+                    if selection.id == content["selection"]:
+                        selection._record_clauses(content["predicates"])
+            elif content.get("type") == "param_value":
+                for param in VizParam._get_all():
+                    if param.id == content["param"]:
+                        param._record_value(content["value"])
+            elif content.get("type") == "query":
+                message: dict[str, Any] = {"type": "query_result", "id": content["id"]}
+                try:
+                    result = kernel_query(content["sql"], content["query_type"])
+                except Exception as ex:
+                    self.send(message | {"error": str(ex)})
+                    return
+                if isinstance(result, pa.Buffer):
+                    self.send(message, buffers=[memoryview(result)])
+                else:
+                    self.send(message | {"data": result})
 
     _esm = WIDGETS_DIR / "mosaic.js"
     _css: str = ""
@@ -155,49 +292,198 @@ class Component(AnyWidget):
     _css_legend: Path = WIDGETS_DIR / "legend.css"
 
     tables = TablesData({}).tag(sync=True)
+    table_versions = traitlets.Dict(value_trait=traitlets.Int()).tag(sync=True)
     spec = traitlets.CUnicode("").tag(sync=True)
+    query_backend = traitlets.Unicode("browser").tag(sync=True)
+    preaggregate = traitlets.List(traitlets.Unicode()).tag(sync=True)
+    warnings = traitlets.List(traitlets.Unicode()).tag(sync=True)
+
+    def _spec_payload_tables(self) -> dict[str, str]:
+        # resolve payload tables once so the spec and tables always agree
+        # (the kernel backend queries the full tables)
+        if self._payload_tables is None:
+            if self.query_backend == "kernel":
+                self._payload_tables = {
+                    data.table: data.table for data in spec_data(self._config)
+                }
+            else:
+                self._payload_tables = spec_payload_tables(self._config)
+        return self._payload_tables
 
     def _create_spec(self) -> str:
         from ..plot._defaults import plot_defaults_as_camel
 
-        # base spec
-        spec = self._config.copy()
+        # base spec (referencing payload tables)
+        payload_tables = {
+            table: payload_table
+            for table, payload_table in self._spec_payload_tables().items()
+            if table != payload_table
+        }
+        if payload_tables:
+            spec = cast(
+                dict[str, JsonValue], _spec_rename_tables(self._config, payload_tables)
+            )
+        else:
+            spec = self._config.copy()
 
         # add plot defaults
         spec["plotDefaults"] = plot_defaults_as_camel()
 
-        # add current params
-        spec["params"] = all_params()
+        # add params referenced by the spec
+        spec["params"] = spec_params(self._config)
 
         # to json
         return to_json(spec, exclude_none=True).decode()
 
 
-def all_tables(*, collect: bool) -> dict[str, str | bytes]:
-    all_data: dict[str, str | bytes] = {}
-    for data in Data._get_all():
-        all_data[data.table] = data._collect_data() if collect else data._get_data()
-    return all_data
+def spec_tables(
+    config: JsonValue,
+    *,
+    collect: bool,
+    binary: bool = True,
+    payload_tables: dict[str, str] | None = None,
+) -> dict[str, str | TableBytes]:
+    payload_tables = payload_tables or spec_payload_tables(config)
+    tables: dict[str, str | TableBytes] = {}
+    for data in spec_data(config):
+        name = payload_tables[data.table]
+        table = data._collect_data(name) if collect else data._get_data(name)
+        tables[name] = table if binary else base64.b64encode(table).decode()
+    return tables
+
+
+def spec_tables_empty(
+    config: JsonValue, payload_tables: dict[str, str] | None = None
+) -> dict[str, str | TableBytes]:
+    payload_tables = payload_tables or spec_payload_tables(config)
+    tables: dict[str, str | TableBytes] = {}
+    for data in spec_data(config):
+        # projected tables are specific to this spec so we can't rely on
+        # another component to send them
+        name = payload_tables[data.table]
+        tables[name] = bytes() if name == data.table else data._get_data(name)
+    return tables
+
+
+def spec_table_versions(
+    config: JsonValue, payload_tables: dict[str, str] | None = None
+) -> dict[str, int]:
+    """Versions (number of appends) of tables sent for a component config.
+
+    Contexts which already have an older version of a table (inserted by
+    a widget displayed before rows were appended) replace it.
+    """
+    payload_tables = payload_tables or spec_payload_tables(config)
+    return {payload_tables[data.table]: data._version for data in spec_data(config)}
+
 
+def spec_payload_tables(config: JsonValue) -> dict[str, str]:
+    """Names of tables to send for data referenced by a component config."""
+    return {data.table: data._payload_table() for data in spec_data(config)}
 
-def all_tables_empty() -> dict[str, str | bytes]:
-    all_data: dict[str, str | bytes] = {}
-    for data in Data._get_all():
-        all_data[data.table] = bytes()
-    return all_data
 
+def spec_data(config: JsonValue) -> list[Data]:
+    """Data sources referenced by a component config.
+
+    Marks, inputs, and tables all reference their data source with a
+    `from` key (at any depth of the config). Selections referenced via
+    `filterBy` or `as` don't require their own tables as their clauses
+    are evaluated against the columns of the referencing table.
+    """
+    tables = _spec_table_names(config)
+    return [data for table, data in Data._get_tables().items() if table in tables]
 
-def all_params() -> dict[str, JsonValue]:
-    all_params: dict[str, Any] = {}
 
-    for param in VizParam._get_all():
+def reference_spec_columns(config: JsonValue) -> None:
+    """Record columns referenced by a config with data using auto columns.
+
+    References are recorded from all configs (not just those drawing from
+    the data) as selection clauses from inputs on other data may filter the
+    data by column name.
+    """
+    auto_data = [data for data in Data._get_all() if data._auto_columns]
+    if not auto_data:
+        return
+
+    strings = _spec_strings(config)
+    tokens = {token for string in strings for token in re.findall(r"\w+", string)}
+    all_columns = _spec_all_columns_tables(config)
+    for data in auto_data:
+        # (data yet to resolve its table isn't referenced by table name)
+        if data._table in all_columns:
+            data._reference_all_columns()
+        else:
+            data._reference_columns(strings, tokens)
+
+
+def _spec_strings(config: Any, strings: set[str] | None = None) -> set[str]:
+    strings = strings if strings is not None else set()
+    if isinstance(config, BaseModel):
+        _spec_strings(config.model_dump(), strings)
+    elif isinstance(config, dict):
+        for value in config.values():
+            _spec_strings(value, strings)
+    elif isinstance(config, list):
+        for value in config:
+            _spec_strings(value, strings)
+    elif isinstance(config, str):
+        strings.add(config)
+    return strings
+
+
+def _spec_all_columns_tables(config: Any, tables: set[str] | None = None) -> set[str]:
+    # tables displayed without an explicit column list require all columns
+    tables = tables if tables is not None else set()
+    if isinstance(config, dict):
+        if config.get("input") == "table" and not config.get("columns"):
+            tables.add(str(config.get("from")))
+        for value in config.values():
+            _spec_all_columns_tables(value, tables)
+    elif isinstance(config, list):
+        for value in config:
+            _spec_all_columns_tables(value, tables)
+    return tables
+
+
+def _spec_rename_tables(config: Any, tables: dict[str, str]) -> Any:
+    if isinstance(config, dict):
+        return {
+            key: tables.get(value, value)
+            if key == "from" and isinstance(value, str)
+            else _spec_rename_tables(value, tables)
+            for key, value in config.items()
+        }
+    elif isinstance(config, list):
+        return [_spec_rename_tables(value, tables) for value in config]
+    else:
+        return config
+
+
+def _spec_table_names(config: Any, tables: set[str] | None = None) -> set[str]:
+    tables = tables if tables is not None else set()
+    if isinstance(config, dict):
+        for key, value in config.items():
+            if key == "from" and isinstance(value, str):
+                tables.add(value)
+            else:
+                _spec_table_names(value, tables)
+    elif isinstance(config, list):
+        for value in config:
+            _spec_table_names(value, tables)
+    return tables
+
+
+def spec_params(config: JsonValue) -> dict[str, JsonValue]:
+    """Definitions of the params and selections referenced by a component config."""
+    params: dict[str, Any] = {}
+    for param in _spec_params(config):
         if isinstance(param.default, datetime):
-            all_params[param.id] = dict(select="value", date=param.default.isoformat())
+            params[param.id] = dict(select="value", date=param.default.isoformat())
         else:
-            all_params[param.id] = dict(select="value", value=param.default)
+            params[param.id] = dict(select="value", value=param.default)
 
-    for selection in VizSelection._get_all():
-        all_params[selection.id] = dict_remove_none(
+    for selection in spec_selections(config):
+        params[selection.id] = dict_remove_none(
             dict(
                 select=selection.select,
                 cross=selection.cross,
@@ -206,4 +492,45 @@ def all_params() -> dict[str, JsonValue]:
             )
         )
 
-    return cast(dict[str, JsonValue], to_jsonable_python(all_params, exclude_none=True))
+    return cast(dict[str, JsonValue], to_jsonable_python(params, exclude_none=True))
+
+
+def spec_selections(config: JsonValue) -> list[VizSelection]:
+    """Selections referenced by a component config.
+
+    Includes selections included by referenced selections (as their clauses
+    are relayed to the referencing selection).
+    """
+    ids = _spec_param_ids(config)
+    selections = {
+        selection.id: selection
+        for selection in VizSelection._get_all()
+        if selection.id in ids
+    }
+    pending = list(selections.values())
+    while pending:
+        include = pending.pop().include
+        for included in include if isinstance(include, list) else [include]:
+            if included is not None and included.id not in selections:
+                selections[included.id] = included
+                pending.append(included)
+    return list(selections.values())
+
+
+def _spec_params(config: JsonValue) -> list[VizParam]:
+    ids = _spec_param_ids(config)
+    return [param for param in VizParam._get_all() if param.id in ids]
+
+
+def _spec_param_ids(config: JsonValue) -> set[str]:
+    # params and selections are referenced as "$<id>", either directly or
+    # embedded in expressions (e.g. sql() transforms)
+    return {
+        id
+        for string in _spec_strings(config)
+        if "$" in string
+        for id in _PARAM_REFERENCE.findall(string)
+    }
+
+
+_PARAM_REFERENCE = re.compile(rf"\$((?:{PARAM_PREFIX}|{SELECTION_PREFIX})\w+)")
@@ -1,19 +1,57 @@
+import glob
+import hashlib
+import math
 import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
-from typing import Any, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Sequence, TypedDict, Union, cast
 
 import narwhals as nw
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
 from narwhals import Boolean, String
 from narwhals.typing import IntoDataFrame
 from pydantic import JsonValue
-from shortuuid import uuid
 
-from .._util.instances import get_instances, track_instance
+from .._util.instances import (
+    current_registry,
+    get_instances,
+    registry_context,
+    track_instance,
+)
+from ._cache import DataCacheStats, cache_stats, cached_table
+from ._options import options
 from .param import Param
 from .selection import Selection
 
+if TYPE_CHECKING:
+    from .component import Component
+
+
+class ColumnStats(TypedDict):
+    """Statistics for a data column (see `Data.column_stats()`)."""
+
+    dtype: str
+    """Data type of column."""
+
+    min: Any
+    """Minimum value (`None` if the column has no values or is not orderable)."""
+
+    max: Any
+    """Maximum value (`None` if the column has no values or is not orderable)."""
+
+    unique: list[Any]
+    """Distinct values (in order of appearance)."""
+
+    null_count: int
+    """Number of null values."""
+
 
 class Data:
     """Data source for visualizations.
@@ -22,53 +60,250 @@ class Data:
     """
 
     @classmethod
-    def from_dataframe(cls, df: IntoDataFrame) -> "Data":
+    def from_dataframe(
+        cls,
+        df: IntoDataFrame,
+        columns: Sequence[str] | Literal["auto"] | None = None,
+        max_rows: int | None = None,
+        sample: str = "uniform",
+    ) -> "Data":
         """Create `Data` from a standard Python data frame (e.g. Pandas, Polars, PyArrow, etc.).
 
         Args:
            df: Data frame to read.
+           columns: Columns to include (defaults to all columns). Pass "auto" to send only the columns referenced by visualizations to the browser.
+           max_rows: Maximum number of rows to include (larger data is downsampled using the `sample` strategy).
+           sample: Strategy for downsampling data with more than `max_rows`: "uniform" (random rows), "reservoir" (random rows sampled in a single pass over record batches), or "stratified:<column>" (random rows from each distinct value of `column` in proportion to its frequency).
         """
-        return Data(df)
+        return Data(df, columns=columns, max_rows=max_rows, sample=sample)
 
     @classmethod
-    def from_file(cls, file: Union[str, PathLike[str]]) -> "Data":
+    def from_file(
+        cls,
+        file: Union[str, PathLike[str]],
+        columns: Sequence[str] | Literal["auto"] | None = None,
+        filter: pc.Expression | None = None,
+        max_rows: int | None = None,
+        sample: str = "uniform",
+    ) -> "Data":
         """Create `Data` from a data file (e.g. csv, parquet, feather, etc.).
 
         Args:
-           file: File to read data from. Supported formats include csv, json, xslx, parquet, feather, sas7bdat, dta, and fwf.
+           file: File to read data from. Supported formats include csv, json, xslx, parquet, feather, arrow, sas7bdat, dta, and fwf.
+           columns: Columns to include (defaults to all columns). Pass "auto" to send only the columns referenced by visualizations to the browser.
+           filter: Filter expression for rows to include (e.g. `pc.field("score") > 0.5`, where `pc` is `pyarrow.compute`). For parquet files the filter is applied to row group statistics so that non-matching row groups are not read.
+           max_rows: Maximum number of rows to include (larger data is downsampled using the `sample` strategy).
+           sample: Strategy for downsampling data with more than `max_rows`: "uniform" (random rows), "reservoir" (random rows sampled in a single pass over record batches), or "stratified:<column>" (random rows from each distinct value of `column` in proportion to its frequency).
         """
-        return Data(file)
+        if filter is None:
+            return Data(file, columns=columns, max_rows=max_rows, sample=sample)
+        else:
+            df, _ = _read_file(file, columns=_explicit_columns(columns), filter=filter)
+            return Data(df, columns=columns, max_rows=max_rows, sample=sample)
 
-    def __init__(self, data: Union[IntoDataFrame, str, PathLike[str]]) -> None:
-        # assign a unique table name
-        self._table = uuid()
+    @classmethod
+    def from_files(
+        cls,
+        files: Union[str, PathLike[str], Sequence[Union[str, PathLike[str]]]],
+        columns: Sequence[str] | Literal["auto"] | None = None,
+        filter: pc.Expression | None = None,
+        source_file: bool = False,
+        max_rows: int | None = None,
+        sample: str = "uniform",
+    ) -> "Data":
+        """Create `Data` from multiple data files (e.g. parquet shards).
+
+        Files are read in parallel and must share a compatible schema (numeric types are widened and missing columns are filled with nulls as required).
 
-        # create a default selection
-        self._selection = Selection(select="intersect", unique=self._table)
+        Args:
+           files: Glob pattern (e.g. `"logs/**/*.parquet"`) or list of files to read data from. Supported formats are the same as for `from_file()`.
+           columns: Columns to include (defaults to all columns). Pass "auto" to send only the columns referenced by visualizations to the browser.
+           filter: Filter expression for rows to include (e.g. `pc.field("score") > 0.5`, where `pc` is `pyarrow.compute`).
+           source_file: Include a `source_file` column with the file each row was read from.
+           max_rows: Maximum number of rows to include (larger data is downsampled using the `sample` strategy).
+           sample: Strategy for downsampling data with more than `max_rows`: "uniform" (random rows), "reservoir" (random rows sampled in a single pass over record batches), or "stratified:<column>" (random rows from each distinct value of `column` in proportion to its frequency).
+        """
+        # resolve files
+        if isinstance(files, (str, PathLike)):
+            paths = sorted(glob.glob(os.fspath(files), recursive=True))
+            if len(paths) == 0:
+                raise FileNotFoundError(f"No files match '{os.fspath(files)}'.")
+        else:
+            paths = [os.fspath(file) for file in files]
+            if len(paths) == 0:
+                raise ValueError("No files were passed to read data from.")
+
+        # the source file column is added after reading (so is not read from
+        # the files, but is always included when columns are explicit)
+        read_columns = _explicit_columns(columns)
+        if source_file and read_columns is not None:
+            if "source_file" not in read_columns:
+                columns = [*read_columns, "source_file"]
+            read_columns = [c for c in read_columns if c != "source_file"]
+
+        # read files in parallel (the arrow readers release the gil)
+        def read_table(path: str) -> pa.Table:
+            return _arrow_table(
+                nw.from_native(_read_file(path, columns=read_columns, filter=filter)[0])
+            )
+
+        with ThreadPoolExecutor() as executor:
+            tables = list(executor.map(read_table, paths))
+
+        # conform tables to a unified schema
+        schema = _unify_schemas(paths, [table.schema for table in tables])
+        tables = [_conform_table(table, schema) for table in tables]
+
+        # provide source file as a dictionary column (so the file names are
+        # stored only once)
+        if source_file:
+            dictionary = pa.array(paths, type=pa.string())
+            tables = [
+                table.append_column(
+                    "source_file",
+                    pa.DictionaryArray.from_arrays(
+                        np.full(table.num_rows, i, dtype=np.int32),
+                        dictionary,
+                    ),
+                )
+                for i, table in enumerate(tables)
+            ]
+
+        return Data(
+            pa.concat_tables(tables), columns=columns, max_rows=max_rows, sample=sample
+        )
 
-        # convert to pandas if its a path
+    def __init__(
+        self,
+        data: Union[IntoDataFrame, str, PathLike[str]],
+        columns: Sequence[str] | Literal["auto"] | None = None,
+        max_rows: int | None = None,
+        sample: str = "uniform",
+    ) -> None:
+        """Create a data source.
+
+        Args:
+           data: Data frame or path to data file.
+           columns: Columns to include (defaults to all columns). Pass "auto"
+              to send only the columns referenced by visualizations to the
+              browser (useful for wide tables where only a few columns are
+              plotted). Referenced columns are resolved when a visualization
+              is rendered, so if you filter this data with inputs on another
+              data source created later, list the columns explicitly instead.
+           max_rows: Maximum number of rows to include. Data with more rows
+              is downsampled using the `sample` strategy (which is noted when
+              the data is printed and in visualizations that use it).
+           sample: Strategy for downsampling data with more than `max_rows`:
+              "uniform" (random rows), "reservoir" (random rows sampled in a
+              single pass over record batches), or "stratified:<column>"
+              (random rows from each distinct value of `column` in proportion
+              to its frequency, with at least one row per value where
+              possible). Sampling is seeded so the same data always yields
+              the same sample.
+        """
+        # read the file if its a path (arrow files may also provide their
+        # ipc payload directly from the mapped file)
+        payload: pa.Buffer | None = None
         if isinstance(data, (str, PathLike)):
-            data = _read_df_from_file(data)
+            data, payload = _read_file(data, columns=_explicit_columns(columns))
 
         # convert to narwhals
-        self._ndf = nw.from_native(data)
+        ndf = nw.from_native(data)
+
+        # explicit columns are applied up front, auto columns are resolved
+        # against the specs that reference the data at render time
+        self._auto_columns = columns == "auto"
+        if columns is not None and columns != "auto":
+            ndf = ndf.select(*columns)
+        self._referenced_columns: set[str] = set()
+
+        # downsample to max_rows
+        _validate_sample(sample)
+        self._sampled: tuple[int, str] | None = None
+        if max_rows is not None and len(ndf) > max_rows:
+            self._sampled = (len(ndf), sample)
+            ndf = nw.from_native(_sample_table(_arrow_table(ndf), max_rows, sample))
+            payload = None
+
+        # arrow ipc payloads (created on demand by _get_data()). these are
+        # keyed by table name as auto columns produce projected tables
+        self._data: dict[str, pa.Buffer] = {}
+        self._projections: dict[str, list[str]] = {}
+
+        # track which tables we have collected
+        self._collected: set[str] = set()
+
+        # column statistics (computed on demand)
+        self._column_stats: dict[str, ColumnStats] = {}
+
+        # track appended rows and the widgets to send them to
+        self._version = 0
+        self._widgets: weakref.WeakSet["Component"] = weakref.WeakSet()
+
+        # address the table by its content. hashing the content requires
+        # a pass over the data so is deferred until the table is first used
+        # (see _resolve())
+        self._frame: nw.DataFrame[Any] = ndf
+        self._payload = payload
+        self._resolved = False
+        self._table = ""
+        self._selection = Selection(select="intersect")
+        self._registry = current_registry()
+        track_instance("data", self)
 
-        # create buffer
-        reader = pa.ipc.RecordBatchStreamReader.from_stream(self._ndf)
-        table = reader.read_all()
-        buffer = pa.BufferOutputStream()
-        with pa.RecordBatchStreamWriter(buffer, table.schema) as writer:
-            writer.write_table(table)
-        self._data: bytes = buffer.getvalue().to_pybytes()
+    def _resolve(self) -> None:
+        """Resolve the table name from the content of the data.
 
-        # track whether we have been collected
-        self._collected = False
+        Data with identical content shares the frame, table name, and
+        payload of the first instance resolved for it (so it is serialized
+        and sent once).
+        """
+        if self._resolved:
+            return
+        self._resolved = True
 
-        # track instances
-        track_instance("data", self)
+        content_hash = _content_hash(
+            _arrow_table(self._frame), b"auto" if self._auto_columns else b""
+        )
+        instances = cast(list[Data], self._registry.get("data"))
+        # data with rows appended retains its table name, so data created
+        # with its original content is given a distinct name
+        appended = {d._table for d in instances if d._version > 0}
+        while content_hash in appended:
+            content_hash = hashlib.blake2b(
+                content_hash.encode(), digest_size=16
+            ).hexdigest()
+        self._table = content_hash
+        source = next(
+            (d for d in instances if d is not self and d._table == content_hash), None
+        )
+        if source is not None:
+            # share the frame and payloads (and the state derived from them)
+            self._frame = source._frame
+            self._data = source._data
+            self._projections = source._projections
+            self._collected = source._collected
+            self._column_stats = source._column_stats
+            source._referenced_columns.update(self._referenced_columns)
+            self._referenced_columns = source._referenced_columns
+        elif self._payload is not None:
+            self._data[self._table] = self._payload
+        self._payload = None
+
+    def _sharing(self) -> list["Data"]:
+        """Data which shares the table of this data (including this data)."""
+        self._resolve()
+        instances = cast(list[Data], self._registry.get("data"))
+        return [d for d in instances if d._table == self._table]
+
+    @classmethod
+    def cache_stats(cls) -> DataCacheStats:
+        """Statistics for the data file cache (see `Options.data_cache`)."""
+        return cache_stats()
 
     @property
     def table(self) -> str:
+        self._resolve()
         return self._table
 
     @property
@@ -80,33 +315,225 @@ class Data:
         """Column names for data source."""
         return self._ndf.columns
 
+    def append(self, data: IntoDataFrame) -> None:
+        """Append rows to the data source.
+
+        Only the new rows are sent to widgets already displaying the data
+        (which then re-query the rows they display). Widgets displaying data
+        which shares its content with other data are not updated (as the
+        data is given a new table rather than modifying the shared one).
+
+        Args:
+           data: Data frame with rows to append (must have the same columns
+              as the data source).
+        """
+        # conform rows to the current schema
+        table = _arrow_table(self._ndf)
+        rows = _arrow_table(nw.from_native(data))
+        if set(rows.column_names) != set(table.column_names):
+            raise ValueError(
+                f"Appended data must have the same columns as the data source (expected {', '.join(table.column_names)})."
+            )
+        rows = rows.select(table.column_names).cast(table.schema)
+
+        # data with identical content shares its frame and payloads, so
+        # copy on write (resolving a new table for the appended content)
+        frame = nw.from_native(pa.concat_tables([table, rows]))
+        if len(self._sharing()) > 1:
+            self._frame = frame
+            self._data = {}
+            self._projections = {}
+            self._collected = set()
+            self._column_stats = {}
+            self._referenced_columns = set(self._referenced_columns)
+            self._widgets = weakref.WeakSet()
+            self._resolved = False
+            self._table = ""
+            self._resolve()
+            return
+
+        # update the frame (as an arrow table so subsequent appends don't
+        # copy existing rows) and invalidate payloads
+        self._frame = frame
+        self._data.clear()
+        self._column_stats.clear()
+        self._version += 1
+
+        # send rows to widgets displaying the data
+        payloads: dict[str, pa.Buffer] = {}
+        for widget in list(self._widgets):
+            # the kernel backend queries the updated table in the kernel
+            if widget.query_backend == "kernel":
+                widget._send_rows(self._table, self._version, None)
+                continue
+            payload_table = widget._spec_payload_tables().get(self._table)
+            if payload_table is None:
+                continue
+            if payload_table not in payloads:
+                projection = self._projections.get(payload_table)
+                payloads[payload_table] = _ipc_stream_buffer(
+                    rows.select(projection) if projection else rows
+                )
+            widget._send_rows(payload_table, self._version, payloads[payload_table])
+
+    def filtered(
+        self, selection: Selection | None = None, state: Sequence[str] | None = None
+    ) -> "Data":
+        """Data filtered by a selection.
+
+        Evaluates the SQL predicate of the selection (see
+        `Selection.predicate()`) against the data using DuckDB. Use this to
+        work with the rows selected by interactions, or to filter data before
+        rendering (e.g. when writing PNG or HTML) so only the selected rows
+        are sent.
+
+        Args:
+           selection: Selection to filter by (defaults to the data's
+              `selection`).
+           state: SQL predicates for the selection's clauses (defaults to the
+              current clauses of the selection).
+
+        Returns:
+           Data with the selected rows (or this data if the selection includes
+           all rows).
+        """
+        from ._query import kernel_table
+
+        predicate = (selection or self.selection).predicate(state)
+        if predicate is None:
+            return self
+        # query (and create the filtered data) in the session of the data
+        with registry_context(self._registry):
+            table = kernel_table(f'SELECT * FROM "{self.table}" WHERE {predicate}')
+            return Data(table, columns="auto" if self._auto_columns else None)
+
+    def column_stats(self, column: str) -> ColumnStats:
+        """Statistics for a column.
+
+        Statistics are computed once and then cached until rows are appended.
+
+        Args:
+           column: Column name.
+        """
+        return self.stats([column])[column]
+
+    def stats(self, columns: Sequence[str] | None = None) -> dict[str, ColumnStats]:
+        """Statistics for several columns.
+
+        Statistics not already cached are computed together (from one
+        selection of the missing columns) and then cached until rows are
+        appended.
+
+        Args:
+           columns: Column names (defaults to all columns).
+        """
+        columns = self.columns if columns is None else list(columns)
+        missing = [c for c in columns if c not in self._column_stats]
+        if missing:
+            ndf = self._ndf.select(*missing)
+            table = _arrow_table(ndf)
+            for column in missing:
+                self._column_stats[column] = _column_stats(
+                    table.column(column), str(ndf.schema[column])
+                )
+        return {column: self._column_stats[column] for column in columns}
+
     def column_unique(self, column: str) -> list[Any]:
-        return self._ndf[column].unique().to_list()
+        return self.column_stats(column)["unique"]
 
     def column_min(self, column: str) -> Any:
-        return self._ndf[column].min()
+        return self.column_stats(column)["min"]
 
     def column_max(self, column: str) -> Any:
-        return self._ndf[column].max()
+        return self.column_stats(column)["max"]
 
     def _plot_from(self, filter_by: Selection | None = None) -> dict[str, JsonValue]:
         return {"from": self.table, "filterBy": filter_by or f"${self.selection.id}"}
 
-    def _get_data(self) -> bytes:
-        return self._data
-
-    def _collect_data(self) -> bytes:
-        if not self._collected:
-            self._collected = True
-            return self._data
+    @property
+    def _ndf(self) -> nw.DataFrame[Any]:
+        return self._frame
+
+    def _add_widget(self, widget: "Component") -> None:
+        # widgets display the table, so receive rows appended to any data
+        # which shares it (data is only appended to while unshared)
+        for data in self._sharing():
+            data._widgets.add(widget)
+
+    def _payload_table(self) -> str:
+        """Name of the table to send to the browser.
+
+        This is the data's table unless columns are resolved automatically,
+        in which case it is a projection of the table onto the columns
+        referenced so far (each projection has its own name so that tables
+        already sent to the browser are never modified).
+        """
+        self._resolve()
+        if not self._auto_columns:
+            return self._table
+
+        # project onto referenced columns (keeping at least one column so
+        # that row counts are preserved)
+        columns = [c for c in self.columns if c in self._referenced_columns]
+        if len(columns) == len(self.columns):
+            return self._table
+        columns = columns or self.columns[:1]
+        projection = hashlib.blake2b(
+            "\0".join(columns).encode(), digest_size=4
+        ).hexdigest()
+        table = f"{self._table}_{projection}"
+        self._projections[table] = columns
+        return table
+
+    def _reference_columns(self, strings: set[str], tokens: set[str]) -> None:
+        """Record columns referenced by the strings of a component spec.
+
+        A column is referenced if it is one of the strings or appears as a
+        token within one (e.g. within a `sql()` expression). This may over
+        count (e.g. a label that matches a column name) which is harmless.
+        """
+        for column in self.columns:
+            if column in strings or column in tokens:
+                self._referenced_columns.add(column)
+            elif not column.isidentifier() and any(column in s for s in strings):
+                self._referenced_columns.add(column)
+
+    def _reference_all_columns(self) -> None:
+        self._referenced_columns.update(self.columns)
+
+    def _get_data(self, table: str | None = None) -> pa.Buffer:
+        self._resolve()
+
+        # serialize lazily so that data which is never rendered (e.g. only
+        # used for column lookups) never pays for the ipc payload
+        table = table or self._table
+        if table not in self._data:
+            self._data[table] = _ipc_stream_buffer(self._get_table(table))
+        return self._data[table]
+
+    def _get_table(self, table: str | None = None) -> pa.Table:
+        ndf = self._ndf
+        if table in self._projections:
+            ndf = ndf.select(*self._projections[table])
+        return _arrow_table(ndf)
+
+    def _collect_data(self, table: str | None = None) -> pa.Buffer:
+        self._resolve()
+        table = table or self._table
+        if table not in self._collected:
+            self._collected.add(table)
+            return self._get_data(table)
         else:
-            return bytes()
+            return pa.py_buffer(bytes())
 
     def __str__(self) -> str:
         lines = [
             f"Viz Data ({len(self._ndf):,} rows x {len(self._ndf.columns):,} columns)",
-            "-" * 80,
         ]
+        if self._sampled is not None:
+            rows, sample = self._sampled
+            lines.append(f"Downsampled from {rows:,} rows ({sample})")
+        lines.append("-" * 80)
         for col_name, dtype in self._ndf.schema.items():
             lines.append(f"{col_name:<40} {str(dtype):<40}")
         return "\n".join(lines)
@@ -117,26 +544,328 @@ class Data:
     def __len__(self) -> int:
         return self._ndf.__len__()
 
+    def _sample_warning(self) -> str | None:
+        if self._sampled is not None:
+            rows, sample = self._sampled
+            return (
+                f"Data downsampled from {rows:,} to {len(self._ndf):,} rows "
+                + f"({sample} sample)."
+            )
+        else:
+            return None
+
     @classmethod
     def _get_all(cls) -> list["Data"]:
         """Get all data."""
         return cast(list["Data"], get_instances("data"))
 
+    @classmethod
+    def _get_tables(cls) -> dict[str, "Data"]:
+        """Get data by table (for data which has resolved its table).
+
+        Data which shares a table shares its content, so only the first
+        data for each table is included.
+        """
+        tables: dict[str, Data] = {}
+        for data in cls._get_all():
+            if data._resolved:
+                tables.setdefault(data._table, data)
+        return tables
+
+
+def _arrow_table(ndf: nw.DataFrame[Any]) -> pa.Table:
+    return pa.ipc.RecordBatchStreamReader.from_stream(ndf).read_all()
+
+
+def _column_stats(column: "pa.ChunkedArray[Any]", dtype: str) -> ColumnStats:
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    try:
+        min_max = pc.min_max(column)
+        min, max = min_max["min"].as_py(), min_max["max"].as_py()
+    except pa.ArrowNotImplementedError:
+        min, max = None, None  # e.g. nested types
+    unique = pc.unique(column)
+
+    # NaN isn't valid JSON, so report it as None (as for nulls)
+    if pa.types.is_floating(column.type):
+        if min is not None and math.isnan(min):
+            min, max = None, None  # all values are NaN
+        unique = pc.unique(pc.if_else(pc.is_nan(unique), None, unique))
+
+    return ColumnStats(
+        dtype=dtype,
+        min=min,
+        max=max,
+        unique=unique.to_pylist(),
+        null_count=column.null_count,
+    )
+
+
+def _content_hash(table: pa.Table, salt: bytes = b"") -> str:
+    # hash the schema and the raw arrow buffers (no python level
+    # conversion of values is required)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(salt)
+    hasher.update(table.schema.serialize())
+    for column in table.columns:
+        for chunk in column.chunks:
+            _hash_array(hasher, chunk)
+    return hasher.hexdigest()
+
+
+def _hash_array(hasher: "hashlib.blake2b", array: "pa.Array[Any]") -> None:
+    hasher.update(f"{array.offset}:{len(array)}".encode())
+    for buffer in array.buffers():
+        if buffer is not None:
+            hasher.update(buffer)
+    if isinstance(array, pa.DictionaryArray):
+        _hash_array(hasher, array.dictionary)
+
+
+def _ipc_stream_buffer(table: pa.Table) -> pa.Buffer:
+    # measure the stream first (the mock stream only counts bytes) so that
+    # we can write the batches exactly once into a buffer allocated up front
+    # (this avoids growth re-allocations and the final copy into python bytes)
+    batches = table.to_batches()
+    mock = pa.MockOutputStream()
+    _write_ipc_stream(mock, table.schema, batches)
+    buffer = pa.allocate_buffer(mock.size())
+    _write_ipc_stream(pa.FixedSizeBufferWriter(buffer), table.schema, batches)
+    return buffer
+
+
+def _write_ipc_stream(
+    sink: pa.NativeFile, schema: pa.Schema, batches: list[pa.RecordBatch]
+) -> None:
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+SAMPLE_SEED = 42
+
+
+def _validate_sample(sample: str) -> None:
+    if sample not in ["uniform", "reservoir"] and not (
+        sample.startswith("stratified:") and len(sample) > len("stratified:")
+    ):
+        raise ValueError(
+            f"Invalid sample '{sample}' (expected 'uniform', 'reservoir', or 'stratified:<column>')."
+        )
+
+
+def _sample_table(table: pa.Table, max_rows: int, sample: str) -> pa.Table:
+    rng = np.random.default_rng(SAMPLE_SEED)
+    if sample == "uniform":
+        indices = rng.choice(table.num_rows, size=max_rows, replace=False)
+    elif sample == "reservoir":
+        indices = _reservoir_sample(table, max_rows, rng)
+    else:
+        column = sample.removeprefix("stratified:")
+        if column not in table.column_names:
+            raise ValueError(f"Column '{column}' (for stratified sample) not found.")
+        indices = _stratified_sample(table.column(column), max_rows, rng)
+
+    # take rows in their original order
+    return table.take(np.sort(indices))
+
+
+def _reservoir_sample(
+    table: pa.Table, max_rows: int, rng: np.random.Generator
+) -> np.ndarray:
+    # algorithm r over the record batches (vectorized within each batch):
+    # row i replaces a random reservoir slot with probability max_rows / (i + 1)
+    reservoir = np.arange(max_rows)
+    offset = 0
+    for batch in table.to_batches():
+        rows = np.arange(max(offset, max_rows), offset + batch.num_rows)
+        if len(rows) > 0:
+            slots = rng.integers(0, rows + 1)
+            replace = slots < max_rows
+            reservoir[slots[replace]] = rows[replace]
+        offset += batch.num_rows
+    return reservoir
+
+
+def _stratified_sample(
+    column: "pa.ChunkedArray[Any]", max_rows: int, rng: np.random.Generator
+) -> np.ndarray:
+    encoded = pc.dictionary_encode(column, null_encoding="encode").combine_chunks()
+    strata = cast("pa.DictionaryArray[Any, Any]", encoded).indices.to_numpy()
+    counts = np.bincount(strata)
+
+    # allocate rows in proportion to stratum size (at least one per stratum
+    # if that fits within max_rows)
+    allocation = np.floor(counts * max_rows / len(strata)).astype(np.int64)
+    if len(counts) <= max_rows:
+        allocation = np.maximum(allocation, 1)
+        excess = allocation.sum() - max_rows
+        if excess > 0:
+            allocation[np.argsort(-allocation, kind="stable")[:excess]] -= 1
+
+    # rank rows randomly within their stratum and take the top ranked rows
+    order = np.lexsort((rng.random(len(strata)), strata))
+    starts = np.cumsum(counts) - counts
+    rank = np.empty(len(strata), dtype=np.int64)
+    rank[order] = np.arange(len(strata)) - np.repeat(starts, counts)
+    return np.flatnonzero(rank < allocation[strata])
+
+
+def _explicit_columns(
+    columns: Sequence[str] | Literal["auto"] | None,
+) -> Sequence[str] | None:
+    return None if columns is None or columns == "auto" else columns
+
+
+def _read_file(
+    path: str | PathLike[str],
+    columns: Sequence[str] | None = None,
+    filter: pc.Expression | None = None,
+) -> tuple[IntoDataFrame, pa.Buffer | None]:
+    # returns the data read and (if available) its ipc stream payload mapped
+    # directly from disk
+    _, ext = os.path.splitext(path)
+    ext = ext.lower()
+
+    # memory map arrow ipc files
+    if ext == ".feather" or ext == ".arrow":
+        mapped = _map_ipc_file(path)
+        if mapped is not None:
+            table, payload = mapped
+            if columns is None and filter is None:
+                return table, payload
+            if columns is not None:
+                table = table.select(list(columns))
+            return (table.filter(filter) if filter is not None else table), None
+
+    # read through the data cache if its enabled
+    if options.data_cache is not None:
+        return cached_table(
+            path,
+            columns,
+            filter,
+            lambda: _arrow_table(
+                nw.from_native(_read_source_file(path, columns, filter))
+            ),
+        )
+    else:
+        return _read_source_file(path, columns, filter), None
+
+
+def _map_ipc_file(
+    path: str | PathLike[str],
+) -> tuple[pa.Table, pa.Buffer | None] | None:
+    # memory map the file and read its record batches (which reference the
+    # mapped file rather than being copied into memory)
+    file = pa.memory_map(os.fspath(path)).read_buffer()
+    try:
+        table = pa.ipc.open_file(file).read_all()
+    except pa.ArrowInvalid:
+        return None  # not an ipc file (e.g. feather v1)
+
+    # compressed batches are decompressed into memory so must be re-written
+    # to create the payload
+    for column in table.columns:
+        for chunk in column.chunks:
+            for buffer in chunk.buffers():
+                if buffer is not None and not (
+                    file.address <= buffer.address < file.address + file.size
+                ):
+                    return table, None
+
+    # an ipc file is magic (8 bytes), then an ipc stream, then the footer
+    # and its size (4 bytes) and magic (6 bytes), so the stream is a slice
+    footer_size = int.from_bytes(file[-10:-6].to_pybytes(), "little")
+    return table, file.slice(8, file.size - 10 - footer_size)
+
+
+def _read_source_file(
+    path: str | PathLike[str],
+    columns: Sequence[str] | None = None,
+    filter: pc.Expression | None = None,
+) -> IntoDataFrame:
+    _, ext = os.path.splitext(path)
+    ext = ext.lower()
+
+    # read parquet with a dataset scan, which streams record batches reading
+    # only the requested columns and skips row groups whose statistics don't
+    # match the filter
+    if ext == ".parquet":
+        dataset = ds.dataset(path, format="parquet")
+        if columns is None:
+            columns = _dataset_columns(dataset.schema)
+        return dataset.to_table(columns=list(columns), filter=filter)
+
+    # arrow files that can't be memory mapped as ipc (e.g. feather v1)
+    elif ext == ".feather" or ext == ".arrow":
+        table = feather.read_table(
+            path, columns=list(columns) if columns is not None else None
+        )
+        return table.filter(filter) if filter is not None else table
+
+    # read csv natively with arrow (the multi-threaded reader rather than a
+    # dataset scan so types are inferred from the whole file)
+    elif ext == ".csv":
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=list(columns) if columns is not None else None
+            ),
+        )
+        return table.filter(filter) if filter is not None else table
+
+    # other formats are read with pandas
+    else:
+        df = _read_df_from_file(path)
+        if filter is not None:
+            return pa.Table.from_pandas(df, preserve_index=False).filter(filter)
+        return df
+
+
+def _dataset_columns(schema: pa.Schema) -> list[str]:
+    # exclude index columns written by pandas (read_parquet would have
+    # restored these as the index)
+    pandas_metadata = schema.pandas_metadata or {}
+    index_columns = {
+        c for c in pandas_metadata.get("index_columns", []) if isinstance(c, str)
+    }
+    return [name for name in schema.names if name not in index_columns]
+
+
+def _unify_schemas(paths: list[str], schemas: list[pa.Schema]) -> pa.Schema:
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as ex:
+        # find the first file that isn't compatible with the files before it
+        for i in range(1, len(schemas)):
+            try:
+                pa.unify_schemas(schemas[: i + 1], promote_options="permissive")
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                raise ValueError(
+                    f"Schema of '{paths[i]}' is not compatible with previous files: {ex}"
+                ) from ex
+        raise
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    columns = [
+        table.column(field.name).cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
 
 def _read_df_from_file(path: str | PathLike[str]) -> pd.DataFrame:
     _, ext = os.path.splitext(path)
     ext = ext.lower()
 
-    if ext == ".csv":
-        return pd.read_csv(path)
-    elif ext == ".xlsx" or ext == ".xls":
+    if ext == ".xlsx" or ext == ".xls":
         return pd.read_excel(path)
     elif ext == ".json":
         return pd.read_json(path)
-    elif ext == ".parquet":
-        return pd.read_parquet(path)
-    elif ext == ".feather":
-        return pd.read_feather(path)
     elif ext == ".sas7bdat":
         return pd.read_sas(path)
     elif ext == ".dta":
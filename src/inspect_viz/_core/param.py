@@ -18,6 +18,7 @@ class Param(str):
 
     _id: str
     _default: ParamValue
+    _value: ParamValue
 
     def __new__(cls, default: ParamValue) -> "Param":
         # assign a unique id
@@ -29,6 +30,7 @@ class Param(str):
         # bind instance fars
         instance._id = id
         instance._default = default
+        instance._value = default
 
         # track and return instance
         track_instance("param", instance)
@@ -44,6 +46,17 @@ class Param(str):
         """Default value."""
         return self._default
 
+    @property
+    def value(self) -> ParamValue:
+        """Current value (as reported by rendered widgets as inputs change)."""
+        return self._value
+
+    def _record_value(self, value: ParamValue) -> None:
+        # dates are reported as iso strings
+        if self._is_datetime() and isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        self._value = value
+
     def _is_numeric(self) -> bool:
         """Is this a numeric parameter?"""
         return isinstance(self.default, (int | float))
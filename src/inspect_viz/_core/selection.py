@@ -1,4 +1,4 @@
-from typing import ClassVar, Literal, Union, cast
+from typing import ClassVar, Literal, Sequence, TypedDict, Union, cast
 
 from shortuuid import uuid
 
@@ -7,6 +7,19 @@ from .._util.instances import get_instances, track_instance
 SELECTION_PREFIX = "selection_"
 
 
+class SelectionStats(TypedDict):
+    """Query statistics for a selection."""
+
+    indexed: int
+    """Updates served by a pre-aggregated index."""
+
+    scanned: int
+    """Updates served by querying the full table."""
+
+    last_ms: float | None
+    """Duration of the most recent update (in milliseconds)."""
+
+
 class Selection(str):
     """Selection that can be filtered by inputs and other selections.
 
@@ -23,6 +36,9 @@ class Selection(str):
     _cross: bool | None
     _empty: bool | None
     _include: Union["Selection", list["Selection"] | None]
+    _preaggregate: bool
+    _stats: "SelectionStats"
+    _clauses: list[str]
 
     @classmethod
     def intersect(
@@ -30,6 +46,7 @@ class Selection(str):
         cross: bool = False,
         empty: bool = False,
         include: Union["Selection", list["Selection"]] | None = None,
+        preaggregate: bool = False,
     ) -> "Selection":
         """Create a new Selection instance with an intersect (conjunction) resolution strategy.
 
@@ -37,8 +54,15 @@ class Selection(str):
             cross: Boolean flag indicating cross-filtered resolution. If true, selection clauses will not be applied to the clients they are associated with.
             empty:  Boolean flag indicating if a lack of clauses should correspond to an empty selection with no records. This setting determines the default selection state.
             include: Upstream selections whose clauses should be included as part of the new selection. Any clauses published to upstream selections will be relayed to the new selection.
+            preaggregate: Build pre-aggregated indexes for the marks filtered by this selection when they are rendered (rather than when interaction with an interactor begins). This applies to every interactor which updates the selection (it can't be enabled for individual marks or interactors). Use `stats()` to check whether updates were served by an index.
         """
-        return Selection("intersect", cross=cross, empty=empty, include=include)
+        return Selection(
+            "intersect",
+            cross=cross,
+            empty=empty,
+            include=include,
+            preaggregate=preaggregate,
+        )
 
     @classmethod
     def union(
@@ -46,6 +70,7 @@ class Selection(str):
         cross: bool = False,
         empty: bool = False,
         include: Union["Selection", list["Selection"]] | None = None,
+        preaggregate: bool = False,
     ) -> "Selection":
         """Create a new Selection instance with a union (disjunction) resolution strategy.
 
@@ -53,8 +78,15 @@ class Selection(str):
             cross: Boolean flag indicating cross-filtered resolution. If true, selection clauses will not be applied to the clients they are associated with.
             empty: Boolean flag indicating if a lack of clauses should correspond to an empty selection with no records. This setting determines the default selection state.
             include: Upstream selections whose clauses should be included as part of the new selection. Any clauses published to upstream selections will be relayed to the new selection.
+            preaggregate: Build pre-aggregated indexes for the marks filtered by this selection when they are rendered (rather than when interaction with an interactor begins). This applies to every interactor which updates the selection (it can't be enabled for individual marks or interactors). Use `stats()` to check whether updates were served by an index.
         """
-        return Selection("union", cross=cross, empty=empty, include=include)
+        return Selection(
+            "union",
+            cross=cross,
+            empty=empty,
+            include=include,
+            preaggregate=preaggregate,
+        )
 
     @classmethod
     def single(
@@ -62,6 +94,7 @@ class Selection(str):
         cross: bool = False,
         empty: bool = False,
         include: Union["Selection", list["Selection"]] | None = None,
+        preaggregate: bool = False,
     ) -> "Selection":
         """Create a new Selection instance with a singular resolution strategy that keeps only the most recent selection clause.
 
@@ -69,22 +102,37 @@ class Selection(str):
             cross: Boolean flag indicating cross-filtered resolution. If true, selection clauses will not be applied to the clients they are associated with.
             empty: Boolean flag indicating if a lack of clauses should correspond to an empty selection with no records. This setting determines the default selection state.
             include: Upstream selections whose clauses should be included as part of the new selection. Any clauses published to upstream selections will be relayed to the new selection.
+            preaggregate: Build pre-aggregated indexes for the marks filtered by this selection when they are rendered (rather than when interaction with an interactor begins). This applies to every interactor which updates the selection (it can't be enabled for individual marks or interactors). Use `stats()` to check whether updates were served by an index.
         """
-        return Selection("single", cross=cross, empty=empty, include=include)
+        return Selection(
+            "single",
+            cross=cross,
+            empty=empty,
+            include=include,
+            preaggregate=preaggregate,
+        )
 
     @classmethod
     def crossfilter(
         cls,
         empty: bool = False,
         include: Union["Selection", list["Selection"]] | None = None,
+        preaggregate: bool = False,
     ) -> "Selection":
         """Create a new Selection instance with a cross-filtered intersect resolution strategy.
 
         Args:
             empty: Boolean flag indicating if a lack of clauses should correspond to an empty selection with no records. This setting determines the default selection state.
             include: Upstream selections whose clauses should be included as part of the new selection. Any clauses published to upstream selections will be relayed to the new selection.
+            preaggregate: Build pre-aggregated indexes for the marks filtered by this selection when they are rendered (rather than when interaction with an interactor begins). This applies to every interactor which updates the selection (it can't be enabled for individual marks or interactors). Use `stats()` to check whether updates were served by an index.
         """
-        return Selection("crossfilter", cross=True, empty=empty, include=include)
+        return Selection(
+            "crossfilter",
+            cross=True,
+            empty=empty,
+            include=include,
+            preaggregate=preaggregate,
+        )
 
     def __new__(
         cls,
@@ -94,6 +142,7 @@ class Selection(str):
         empty: bool | None = None,
         unique: str | None = None,
         include: Union["Selection", list["Selection"] | None] = None,
+        preaggregate: bool = False,
     ) -> "Selection":
         # assign a unique id
         id = f"{SELECTION_PREFIX}{unique or uuid()}"
@@ -107,6 +156,9 @@ class Selection(str):
         instance._cross = cross
         instance._empty = empty
         instance._include = include
+        instance._preaggregate = preaggregate
+        instance._stats = SelectionStats(indexed=0, scanned=0, last_ms=None)
+        instance._clauses = []
 
         # track and return instance
         track_instance("selection", instance)
@@ -132,6 +184,55 @@ class Selection(str):
     def include(self) -> Union["Selection", list["Selection"] | None]:
         return self._include
 
+    @property
+    def preaggregate(self) -> bool:
+        return self._preaggregate
+
+    def stats(self) -> "SelectionStats":
+        """Query statistics for updates to marks filtered by this selection.
+
+        Updates are either served by a pre-aggregated index (`indexed`) or
+        by querying the full table (`scanned`). Statistics are reported by
+        the widgets rendering the marks as interactions occur (they are
+        observed by instrumenting Mosaic's pre-aggregator, so are not
+        recorded if a Mosaic version doesn't provide it).
+        """
+        return SelectionStats(**self._stats)
+
+    def predicate(self, state: Sequence[str] | None = None) -> str | None:
+        """SQL predicate for the selection.
+
+        Combines the predicates of the selection's clauses using its
+        resolution strategy (the same predicate used to filter marks in the
+        browser). Cross-filtering is not applied as the predicate is not
+        evaluated for a particular mark.
+
+        Args:
+           state: SQL predicates for the selection's clauses. Defaults to
+              the current clauses (as reported by rendered widgets as
+              interactions occur).
+
+        Returns:
+           SQL predicate or `None` if the selection includes all rows.
+        """
+        clauses = list(self._clauses if state is None else state)
+        if len(clauses) == 0:
+            return "FALSE" if self._empty else None
+        if self._select == "single":
+            clauses = clauses[-1:]
+        operator = " OR " if self._select == "union" else " AND "
+        return operator.join(f"({clause})" for clause in clauses)
+
+    def _record_clauses(self, clauses: list[str]) -> None:
+        self._clauses = clauses
+
+    def _record_query(self, mode: Literal["index", "scan"], ms: float) -> None:
+        if mode == "index":
+            self._stats["indexed"] += 1
+        else:
+            self._stats["scanned"] += 1
+        self._stats["last_ms"] = ms
+
     def __repr__(self) -> str:
         # start with selection
         repr = f"Selection(select={self.select}"
@@ -152,6 +253,10 @@ class Selection(str):
             )
             repr = f"{repr},selection={','.join(include)}"
 
+        # include preaggregate if specified
+        if self._preaggregate:
+            repr = f"{repr},preaggregate=True"
+
         # close out and return
         return f"{repr})"
 
@@ -1,5 +1,11 @@
 # This is a file with vendored code from inspect_ai. If we ever can take a dependenchy on that, we should remove this code
-from typing import Callable, Mapping, Sequence, Union
+import warnings
+from typing import Any, Callable, Mapping, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 CORRECT = "C"
 """Value to assign for correct answers."""
@@ -80,3 +86,134 @@ def value_to_float(
         return 0.0
 
     return to_float
+
+
+def values_to_float(
+    values: "pd.Series[Any]",
+    correct: Value = CORRECT,
+    incorrect: Value = INCORRECT,
+    partial: Value = PARTIAL,
+    noanswer: Value = NOANSWER,
+) -> "pd.Series[float]":
+    """Convert a series of score values to floats.
+
+    Vectorized equivalent of applying `value_to_float()` to each value
+    (conversions are the same). Arrays and dictionaries can't be converted
+    so give a warning and are assigned 0.
+
+    Args:
+       values (pd.Series): Score values.
+       correct (Value): Value that represents a correct answer (1)
+       incorrect (Value): Value that represents an incorrect answer (0)
+       partial (Value): Value to assign partial credit for (0.5)
+       noanswer (Value): Value for refusals to answer (0)
+
+    Returns:
+        Series of floats (with the same index as `values`).
+    """
+    # numeric and boolean values just need a cast
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return values.astype(float)
+
+    # convert each distinct value once (score columns typically have few)
+    objects = values.to_numpy(dtype=object)
+    try:
+        codes, uniques = pd.factorize(objects)
+    except TypeError:
+        result = _objects_to_float(objects, correct, incorrect, partial, noanswer)
+    else:
+        converted = _objects_to_float(uniques, correct, incorrect, partial, noanswer)
+        result = np.append(converted, np.nan)[codes]
+        nulls = codes == -1
+        result[nulls] = _objects_to_float(
+            objects[nulls], correct, incorrect, partial, noanswer
+        )
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+def _objects_to_float(
+    objects: np.ndarray,
+    correct: Value,
+    incorrect: Value,
+    partial: Value,
+    noanswer: Value,
+) -> np.ndarray:
+    # classify values (strings and numbers are converted, nulls are nan
+    # except for None which is 0, and everything else is 0)
+    nulls = pd.isna(objects)
+    kind = pd.api.types.infer_dtype(objects, skipna=True)
+    if kind == "string":
+        strings, numbers = ~nulls, np.zeros(len(objects), dtype=bool)
+    elif kind in ["integer", "floating", "mixed-integer-float", "boolean"]:
+        strings, numbers = np.zeros(len(objects), dtype=bool), ~nulls
+    else:
+        strings = np.array([isinstance(v, str) for v in objects], dtype=bool)
+        numbers = ~nulls & np.array(
+            [isinstance(v, int | float | bool | np.number) for v in objects],
+            dtype=bool,
+        )
+        others = ~(strings | numbers | nulls)
+        if others.any():
+            warnings.warn(
+                f"{others.sum():,} score values could not be converted to a float "
+                + f"and were assigned 0 (e.g. {objects[others][0]!r}).",
+                stacklevel=3,
+            )
+
+    result = np.zeros(len(objects))
+    result[numbers] = objects[numbers].astype(float)
+    result[nulls] = [0.0 if v is None else np.nan for v in objects[nulls]]
+    if strings.any():
+        result[strings] = _strings_to_float(
+            pa.array(objects[strings], type=pa.string()),
+            correct,
+            incorrect,
+            partial,
+            noanswer,
+        )
+    return result
+
+
+def _strings_to_float(
+    strings: "pa.Array[Any]",
+    correct: Value,
+    incorrect: Value,
+    partial: Value,
+    noanswer: Value,
+) -> np.ndarray:
+    def equals(value: Value) -> np.ndarray:
+        if isinstance(value, str):
+            return np.asarray(pc.equal(strings, pa.scalar(value)))
+        else:
+            return np.zeros(len(strings), dtype=bool)
+
+    def isin(array: "pa.Array[Any]", values: list[str]) -> np.ndarray:
+        return np.asarray(pc.is_in(array, pa.array(values)))
+
+    # strings with only numbers (and periods) are parsed
+    lower = pc.utf8_lower(strings)
+    numeric = pc.utf8_is_numeric(pc.replace_substring(lower, ".", "")).to_numpy(
+        zero_copy_only=False
+    )
+    parsed = np.zeros(len(strings))
+    if numeric.any():
+        numeric_strings = strings.filter(pa.array(numeric))
+        try:
+            parsed[numeric] = pc.cast(numeric_strings, pa.float64()).to_numpy()
+        except pa.ArrowInvalid:
+            # e.g. non-ascii digits, which python parses but arrow doesn't
+            parsed[numeric] = [float(str(v)) for v in numeric_strings.to_pylist()]
+
+    # apply conversions in order of precedence
+    return np.select(
+        [
+            equals(correct),
+            equals(partial),
+            equals(incorrect) | equals(noanswer),
+            isin(lower, ["yes", "true"]),
+            isin(lower, ["no", "false"]),
+            numeric,
+        ],
+        [1.0, 0.5, 0.0, 1.0, 0.0, parsed],
+        default=0.0,
+    )
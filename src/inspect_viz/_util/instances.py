@@ -1,5 +1,8 @@
 import functools
-from typing import Any, Literal, TypeAlias, cast
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Literal, TypeAlias, cast
 
 InstanceType: TypeAlias = Literal["data", "param", "selection"]
 
@@ -7,22 +10,72 @@ InstanceType: TypeAlias = Literal["data", "param", "selection"]
 INSTANCES_VAR = "__inspect_viz_instances__"
 
 
+class InstanceRegistry:
+    """Data, params, and selections created within a session.
+
+    Data is weakly referenced (components hold references to the data they
+    display) so that it is released once no longer used. Params and
+    selections are small and may be referenced only by name (e.g. within
+    `sql()` expressions) so are held for the life of the session.
+    """
+
+    def __init__(self) -> None:
+        self._instances: dict[InstanceType, list[Any]] = {}
+
+    def track(self, type: InstanceType, o: object) -> None:
+        instances = self._instances.setdefault(type, [])
+        instances.append(weakref.ref(o) if type == "data" else o)
+
+    def get(self, type: InstanceType) -> list[object]:
+        instances = self._instances.setdefault(type, [])
+        if type != "data":
+            return list(instances)
+
+        # resolve weak references (pruning released data)
+        live: list[object] = []
+        refs: list[weakref.ref[object]] = []
+        for ref in instances:
+            o = ref()
+            if o is not None:
+                live.append(o)
+                refs.append(ref)
+        self._instances[type] = refs
+        return live
+
+
+_session: ContextVar[InstanceRegistry | None] = ContextVar(
+    "inspect_viz_session", default=None
+)
+
+
 def track_instance(type: InstanceType, o: object) -> None:
-    get_instances(type).append(o)
+    current_registry().track(type, o)
 
 
 def get_instances(type: InstanceType) -> list[object]:
-    instances = _instances()
-    if type not in instances:
-        instances[type] = list()
-    return instances[type]
+    return current_registry().get(type)
+
+
+def current_registry() -> InstanceRegistry:
+    """Registry for the current session (or the global registry)."""
+    return _session.get() or _global_registry()
+
+
+@contextmanager
+def registry_context(registry: InstanceRegistry) -> Iterator[None]:
+    """Track and lookup instances using a registry."""
+    token = _session.set(registry)
+    try:
+        yield
+    finally:
+        _session.reset(token)
 
 
-def _instances() -> dict[InstanceType, list[object]]:
+def _global_registry() -> InstanceRegistry:
     if INSTANCES_VAR not in globals():
-        globals()[INSTANCES_VAR] = {}
+        globals()[INSTANCES_VAR] = InstanceRegistry()
         _install_reset_hook()
-    return cast(dict[InstanceType, list[object]], globals()[INSTANCES_VAR])
+    return cast(InstanceRegistry, globals()[INSTANCES_VAR])
 
 
 # clear instances when %reset is called (this enables things to work
@@ -8,6 +8,9 @@ import { throttle as throttle3 } from "https://cdn.jsdelivr.net/npm/@uwdata/mosa
 import { wasmConnector } from "https://cdn.jsdelivr.net/npm/@uwdata/mosaic-core@0.16.2/+esm";
 import { InstantiateContext } from "https://cdn.jsdelivr.net/npm/@uwdata/mosaic-spec@0.16.2/+esm";
 
+// js/context/kernel.ts
+import { decodeIPC } from "https://cdn.jsdelivr.net/npm/@uwdata/mosaic-core@0.16.2/+esm";
+
 // js/inputs/choice.ts
 import {
   isParam,
@@ -52,6 +55,12 @@ function generateId() {
 }
 
 // js/inputs/util.ts
+import {
+  column as column3,
+  literal as literal2,
+  Query as Query5,
+  sql as sql2
+} from "https://cdn.jsdelivr.net/npm/@uwdata/mosaic-sql@0.16.2/+esm";
 function createFieldset(legend) {
   const fieldset = window.document.createElement("fieldset");
   if (legend) {
@@ -85,6 +94,14 @@ function createLabeledInput(type, label, name, value) {
   inputLabel.appendChild(window.document.createTextNode(` ${label || value}`));
   return { inputLabel, input: input2 };
 }
+function typeaheadQuery(from, name, text, typeahead, filter) {
+  const pattern = text.replace(/[!%_]/g, (c) => `!${c}`) + "%";
+  const query = Query5.from(from).select({ value: name }).where(
+    filter ?? [],
+    sql2`CAST(${column3(name)} AS VARCHAR) ILIKE ${literal2(pattern)} ESCAPE '!'`
+  ).orderby(name).limit(typeahead.limit);
+  return typeahead.index ? query : query.distinct();
+}
 function setupActivationListeners(input2, element) {
   element.addEventListener("pointerenter", (evt) => {
     if (!evt.buttons) input2.activate();
@@ -124,8 +141,8 @@ var ChoiceInput = class extends Input {
     }
   }
   query(filter = []) {
-    const { from, column: column2 } = this.options_;
-    if (!from) {
+    const { from, column: column2, typeahead } = this.options_;
+    if (!from || typeahead) {
       return null;
     }
     if (!column2) {
@@ -144,6 +161,16 @@ var ChoiceInput = class extends Input {
     const values = columns.columns.value;
     return values.map((v) => ({ value: v }));
   }
+  // query options that start with text (for typeahead inputs)
+  async typeaheadOptions(text) {
+    const { from, column: column2, typeahead } = this.options_;
+    if (!from || !column2 || !typeahead) {
+      return [];
+    }
+    const filter = this.filterBy?.predicate(this);
+    const query = typeaheadQuery(from, column2, text, typeahead, filter);
+    return this.queryResultOptions(await this.coordinator.query(query));
+  }
   setOptions(options) {
     this.setData(options.map((opt) => isObject(opt) ? opt : { value: opt }));
     this.update();
@@ -223,6 +250,7 @@ var RadioGroup = class extends ChoiceInput {
 // js/inputs/types.ts
 var kSidebarFullwidth = "sidebar-fullwidth";
 var kInputSearch = "input-search";
+var kTypeaheadDelay = 250;
 
 // js/inputs/select.ts
 import TomSelect from "https://cdn.jsdelivr.net/npm/tom-select@2.4.3/+esm";
@@ -266,10 +294,21 @@ var Select = class extends ChoiceInput {
     });
     this.setupParamListener();
     this.setupActivationListeners(this.select_);
+    if (options.typeahead) {
+      const initialValues = [this.initialValue_ ?? []].flat();
+      this.setData([
+        ...this.allowEmptyOption() ? [{ value: "", label: "All" }] : [],
+        ...initialValues.map((value) => ({ value }))
+      ]);
+      this.update();
+    }
+  }
+  allowEmptyOption() {
+    return !this.multiple_ && this.allowEmpty_;
   }
   queryResult(data) {
     if (this.options_.options === void 0) {
-      if (this.multiple_ || !this.allowEmpty_) {
+      if (!this.allowEmptyOption()) {
         this.setData(this.queryResultOptions(data));
         return this;
       } else {
@@ -296,7 +335,9 @@ var Select = class extends ChoiceInput {
       };
       if (!this.select_.multiple) {
         config.allowEmptyOption = this.allowEmpty_;
-        config.controlInput = null;
+        if (!this.options_.typeahead) {
+          config.controlInput = null;
+        }
       } else {
         config.plugins = {
           remove_button: {
@@ -304,6 +345,26 @@ var Select = class extends ChoiceInput {
           }
         };
       }
+      if (this.options_.typeahead) {
+        config.preload = "focus";
+        config.loadThrottle = kTypeaheadDelay;
+        config.shouldLoad = () => true;
+        config.load = (query, callback) => {
+          this.typeaheadOptions(query).then((options) => {
+            if (this.allowEmptyOption()) {
+              options = [{ value: "", label: "All" }, ...options];
+            }
+            this.tomSelect_?.clearOptions();
+            callback(
+              options.map((o) => ({ value: o.value, text: o.label || o.value })),
+              []
+            );
+          }).catch((error) => {
+            console.error(error);
+            callback([], []);
+          });
+        };
+      }
       this.tomSelect_ = new TomSelect(this.select_, config);
       if (this.multiple_) {
         this.tomSelect_.on("item_add", () => {
@@ -701,6 +762,7 @@ import * as d3Format from "https://cdn.jsdelivr.net/npm/d3-format@3.1.0/+esm";
 import * as d3TimeFormat from "https://cdn.jsdelivr.net/npm/d3-time-format@4.1.0/+esm";
 var kAutoRowCount = 12;
 var kAutoRowMaxHeight = 380;
+var kDefaultBlockSize = 100;
 var Table = class extends Input {
   constructor(options_) {
     super(options_.filter_by);
@@ -761,6 +823,9 @@ var Table = class extends Input {
     numRows: 0,
     columns: {}
   };
+  filter_ = [];
+  rowCount_ = -1;
+  countOnly_ = false;
   // contribute a selection clause back to the target selection
   clause(rows = []) {
     const fields = this.getDatabaseColumns().map((column2) => column2.column_id);
@@ -769,6 +834,17 @@ var Table = class extends Input {
     });
     return clausePoints2(fields, values, { source: this });
   }
+  // selection clause for rows loaded by the server row model (which
+  // aren't available in data_ so are read from the row nodes)
+  nodesClause(nodes = []) {
+    const columns = this.getDatabaseColumns();
+    const fields = columns.map((column2) => column2.column_id);
+    const values = nodes.map((node) => columns.map((column2) => node.data?.[column2.column_name]));
+    return clausePoints2(fields, values, { source: this });
+  }
+  serverRowModel() {
+    return this.options_.row_model === "server";
+  }
   // mosaic calls this and initialization to let us fetch the schema
   // and do related setup
   async prepare() {
@@ -813,6 +889,15 @@ var Table = class extends Input {
   // mosaic calls this every time it needs to show data to find
   // out what query we want to run
   query(filter = []) {
+    if (this.serverRowModel()) {
+      this.filter_ = filter;
+      return Query3.from(this.rowsQuery(filter, this.filterModel_, [])).select({
+        count: count()
+      });
+    }
+    return this.rowsQuery(filter, this.filterModel_, this.sortModel_);
+  }
+  rowsQuery(filter, filterModel, sortModel, range) {
     const selectItems = {};
     const groupBy = [];
     let has_aggregate = false;
@@ -833,11 +918,11 @@ var Table = class extends Input {
       query.groupby(groupBy);
     }
     query = query.where(...filter);
-    Object.keys(this.filterModel_).forEach((columnName) => {
+    Object.keys(filterModel).forEach((columnName) => {
       const col = this.columnsByName_[columnName] || {};
       if (col.type !== "literal") {
         const useHaving = col.type === "aggregate";
-        const filter2 = this.filterModel_[columnName];
+        const filter2 = filterModel[columnName];
         const expression = filterExpression(columnName, filter2, query);
         if (expression) {
           if (useHaving) {
@@ -848,45 +933,101 @@ var Table = class extends Input {
         }
       }
     });
-    if (this.sortModel_.length > 0) {
-      this.sortModel_.forEach((sort) => {
+    if (sortModel.length > 0) {
+      sortModel.forEach((sort) => {
         const col = this.columnsByName_[sort.colId] || {};
         if (col.type !== "literal") {
           query = query.orderby(sort.sort === "asc" ? asc(sort.colId) : desc(sort.colId));
         }
       });
     }
+    if (range) {
+      query = query.orderby(...groupBy.map((c) => asc(c)));
+      query = query.limit(range.limit).offset(range.offset);
+    }
     return query;
   }
   // mosaic returns the results of the query() in this function.
   queryResult(data) {
-    this.data_ = toDataColumns2(data);
+    if (this.serverRowModel()) {
+      this.rowCount_ = Number(toDataColumns2(data).columns.count[0]);
+    } else {
+      this.data_ = toDataColumns2(data);
+    }
     return this;
   }
   // requests a client UI update (e.g. to reflect results from a query)
   update() {
-    this.updateGrid(null);
+    if (this.serverRowModel()) {
+      this.updateServerGrid();
+    } else {
+      this.updateGrid(null);
+    }
     return this;
   }
-  updateGrid = throttle(async () => {
+  updateServerGrid() {
     if (!this.grid_) {
       return;
     }
+    if (!this.options_.auto_filling && typeof this.options_.height !== "number") {
+      this.element.style.height = `${kAutoRowMaxHeight}px`;
+    }
+    if (this.grid_.getGridOption("datasource") === void 0) {
+      this.grid_.setGridOption("datasource", this.createDatasource());
+    } else {
+      this.grid_.setRowCount(this.rowCount_, true);
+      if (!this.countOnly_) {
+        this.grid_.purgeInfiniteCache();
+      }
+    }
+    this.countOnly_ = false;
+  }
+  createDatasource() {
+    return {
+      getRows: async (params) => {
+        try {
+          const limit = params.endRow - params.startRow;
+          const query = this.rowsQuery(
+            this.filter_,
+            params.filterModel,
+            params.sortModel,
+            { offset: params.startRow, limit }
+          );
+          const data = toDataColumns2(await this.coordinator.query(query));
+          const rows = this.toRows(data, params.startRow);
+          const lastRow = rows.length < limit ? params.startRow + rows.length : this.rowCount_;
+          params.successCallback(rows, lastRow);
+        } catch (e) {
+          console.error(e);
+          params.failCallback();
+        }
+      }
+    };
+  }
+  // convert column-based data to row-based data for ag-grid
+  toRows(data, offset = 0) {
     const rowData = [];
-    for (let i = 0; i < this.data_.numRows; i++) {
+    for (let i = 0; i < data.numRows; i++) {
       const row = {};
       this.columns_.forEach(({ column_name, column: column2 }) => {
         if (Array.isArray(column2)) {
-          const index = i % column2.length;
+          const index = (offset + i) % column2.length;
           row[column_name] = column2[index];
         } else if (typeof column2 === "boolean" || typeof column2 === "number") {
           row[column_name] = column2;
         } else {
-          row[column_name] = this.data_.columns[column_name][i];
+          row[column_name] = data.columns[column_name][i];
         }
       });
       rowData.push(row);
     }
+    return rowData;
+  }
+  updateGrid = throttle(async () => {
+    if (!this.grid_) {
+      return;
+    }
+    const rowData = this.toRows(this.data_);
     this.grid_.setGridOption("rowData", rowData);
     if (this.data_.numRows < kAutoRowCount && this.options_.height === void 0) {
       this.grid_.setGridOption("domLayout", "autoHeight");
@@ -910,7 +1051,8 @@ var Table = class extends Input {
       borderRadius: this.options_.style?.border_radius,
       selectedRowBackgroundColor: this.options_.style?.selected_row_background_color
     });
-    const domLayout = this.options_.height === "auto" ? "autoHeight" : void 0;
+    const serverRowModel = this.serverRowModel();
+    const domLayout = this.options_.height === "auto" && !serverRowModel ? "autoHeight" : void 0;
     return {
       // always pass filter to allow server-side filtering
       pagination: !!options.pagination,
@@ -922,27 +1064,37 @@ var Table = class extends Input {
       rowHeight: options.row_height,
       domLayout,
       columnDefs: [],
-      rowData: [],
+      rowModelType: serverRowModel ? "infinite" : "clientSide",
+      cacheBlockSize: serverRowModel ? options.block_size || kDefaultBlockSize : void 0,
+      rowData: serverRowModel ? void 0 : [],
       rowSelection: explicitSelection,
       suppressCellFocus: true,
       enableCellTextSelection: true,
       theme: gridTheme,
       onFilterChanged: () => {
         this.filterModel_ = this.grid_?.getFilterModel() || {};
+        if (serverRowModel) {
+          this.countOnly_ = true;
+          this.rowCount_ = -1;
+        }
         this.requestQuery();
       },
       onSortChanged: () => {
         if (this.grid_) {
           const sortModel = this.grid_.getColumnState().filter((col) => col.sort).map((col) => ({ colId: col.colId, sort: col.sort }));
           this.sortModel_ = sortModel;
-          this.requestQuery();
+          if (!serverRowModel) {
+            this.requestQuery();
+          }
         }
       },
       onSelectionChanged: (event) => {
         if (explicitSelection !== void 0 && isSelection5(this.options_.as)) {
           if (event.selectedNodes) {
             const rowIndices = event.selectedNodes.map((n) => n.rowIndex).filter((n) => n !== null);
-            this.options_.as.update(this.clause(rowIndices));
+            this.options_.as.update(
+              serverRowModel ? this.nodesClause(event.selectedNodes) : this.clause(rowIndices)
+            );
           }
         }
       },
@@ -951,7 +1103,9 @@ var Table = class extends Input {
           const rowIndex = event.rowIndex;
           if (rowIndex !== void 0 && rowIndex !== null && rowIndex !== this.currentRow_) {
             this.currentRow_ = rowIndex;
-            this.options_.as.update(this.clause([rowIndex]));
+            this.options_.as.update(
+              serverRowModel ? this.nodesClause([event.node]) : this.clause([rowIndex])
+            );
           }
         }
       },
@@ -1368,7 +1522,8 @@ var isSetFilter = (filter) => {
 import {
   clauseMatch,
   isParam as isParam4,
-  isSelection as isSelection6
+  isSelection as isSelection6,
+  toDataColumns as toDataColumns3
 } from "https://cdn.jsdelivr.net/npm/@uwdata/mosaic-core@0.16.2/+esm";
 import { Query as Query4 } from "https://cdn.jsdelivr.net/npm/@uwdata/mosaic-sql@0.16.2/+esm";
 var Search = class extends Input {
@@ -1396,6 +1551,13 @@ var Search = class extends Input {
     this.element.appendChild(this.input_);
     this.input_.addEventListener("input", () => {
       this.publish(this.input_.value);
+      if (this.options_.typeahead) {
+        clearTimeout(this.typeaheadTimer_);
+        this.typeaheadTimer_ = setTimeout(
+          () => this.queryTypeahead(this.input_.value),
+          kTypeaheadDelay
+        );
+      }
     });
     if (!isSelection6(this.options_.as)) {
       this.options_.as.addEventListener("value", (value) => {
@@ -1411,6 +1573,8 @@ var Search = class extends Input {
   id_ = generateId();
   data_ = [];
   datalist_;
+  typeaheadTimer_;
+  typeaheadQueries_ = 0;
   reset() {
     this.input_.value = "";
   }
@@ -1431,12 +1595,34 @@ var Search = class extends Input {
     }
   }
   query(filter = []) {
+    if (this.options_.typeahead) {
+      return null;
+    }
     return Query4.from(this.options_.from).select({ list: this.options_.column }).distinct().where(...filter);
   }
   queryResult(data) {
     this.data_ = data;
     return this;
   }
+  // query autocomplete values that start with text (ignoring results
+  // for text that has since changed)
+  async queryTypeahead(text) {
+    const { from, column: column2, typeahead } = this.options_;
+    const id = ++this.typeaheadQueries_;
+    const filter = this.filterBy?.predicate(this);
+    try {
+      const data = await this.coordinator.query(
+        typeaheadQuery(from, column2, text, typeahead, filter)
+      );
+      if (id === this.typeaheadQueries_) {
+        const values = toDataColumns3(data).columns.value;
+        this.data_ = values.map((value) => ({ list: value }));
+        this.update();
+      }
+    } catch (error) {
+      console.error(error);
+    }
+  }
   update() {
     const list = document.createElement("datalist");
     const id = `${this.id_}_list`;
@@ -1729,6 +1915,54 @@ function isError(value) {
   return value instanceof Error;
 }
 
+// js/context/kernel.ts
+var KernelConnector = class {
+  models_ = [];
+  pending_ = /* @__PURE__ */ new Map();
+  nextId_ = 0;
+  addModel(model) {
+    const onCustomMessage = (msg, buffers) => {
+      if (msg.type === "query_result") {
+        this.handleResult(msg, buffers);
+      }
+    };
+    model.on("msg:custom", onCustomMessage);
+    this.models_.push(model);
+    return () => {
+      model.off("msg:custom", onCustomMessage);
+      this.models_.splice(this.models_.indexOf(model), 1);
+    };
+  }
+  query({ type = "arrow", sql }) {
+    const model = this.models_[this.models_.length - 1];
+    if (!model) {
+      return Promise.reject(new Error("No connection to the Python kernel."));
+    }
+    const id = this.nextId_++;
+    return new Promise((resolve, reject) => {
+      this.pending_.set(id, { type, resolve, reject });
+      model.send({ type: "query", id, sql, query_type: type });
+    });
+  }
+  handleResult(msg, buffers) {
+    const pending = this.pending_.get(msg.id);
+    if (!pending) {
+      return;
+    }
+    this.pending_.delete(msg.id);
+    if (msg.error !== void 0) {
+      pending.reject(new Error(msg.error));
+    } else if (pending.type === "arrow") {
+      const buffer = buffers[0];
+      pending.resolve(
+        decodeIPC(new Uint8Array(buffer.buffer, buffer.byteOffset, buffer.byteLength))
+      );
+    } else {
+      pending.resolve(msg.data);
+    }
+  }
+};
+
 // js/context/index.ts
 var VizContext = class extends InstantiateContext {
   constructor(conn_, plotDefaults) {
@@ -1736,22 +1970,169 @@ var VizContext = class extends InstantiateContext {
     this.conn_ = conn_;
     this.api = { ...this.api, ...INPUTS };
     this.coordinator.databaseConnector(wasmConnector({ connection: this.conn_ }));
+    this.instrumentPreaggregation();
   }
-  tables_ = /* @__PURE__ */ new Set();
+  tables_ = /* @__PURE__ */ new Map();
+  tableVersions_ = /* @__PURE__ */ new Map();
   unhandledErrors_ = [];
-  async insertTable(table, data) {
-    if (this.tables_.has(table)) {
-      await this.waitForTable(table);
+  kernelConnector_;
+  models_ = [];
+  queryModes_ = /* @__PURE__ */ new WeakMap();
+  clientModels_ = /* @__PURE__ */ new WeakMap();
+  reportedParams_ = /* @__PURE__ */ new WeakSet();
+  addModel(model) {
+    this.models_.push(model);
+    return () => {
+      this.models_.splice(this.models_.indexOf(model), 1);
+    };
+  }
+  addClients(model, el) {
+    for (const node of [el, ...Array.from(el.querySelectorAll("*"))]) {
+      const value = node.value;
+      if (Array.isArray(value?.marks)) {
+        for (const mark of value.marks) {
+          this.clientModels_.set(mark, model);
+        }
+      } else if (value && this.coordinator.clients.has(value)) {
+        this.clientModels_.set(value, model);
+      }
+    }
+  }
+  activatePreaggregation(el, selections) {
+    if (selections.length === 0) {
       return;
     }
-    this.tables_.add(table);
-    await this.conn_?.insertArrowFromIPCStream(data, {
+    for (const node of [el, ...Array.from(el.querySelectorAll("*"))]) {
+      const interactors = node.value?.interactors;
+      if (Array.isArray(interactors)) {
+        for (const interactor of interactors) {
+          const name = this.selectionName(interactor.selection);
+          if (name && selections.includes(name)) {
+            interactor.activate?.();
+          }
+        }
+      }
+    }
+  }
+  reportState() {
+    for (const [name, param] of this.activeParams ?? /* @__PURE__ */ new Map()) {
+      if (this.reportedParams_.has(param)) {
+        continue;
+      }
+      this.reportedParams_.add(param);
+      param.addEventListener("value", () => {
+        const model = this.models_[this.models_.length - 1];
+        if (Array.isArray(param.clauses)) {
+          model?.send({
+            type: "selection_state",
+            selection: name,
+            predicates: param.clauses.filter((clause) => clause.predicate != null).map((clause) => String(clause.predicate))
+          });
+        } else {
+          model?.send({ type: "param_value", param: name, value: param.value });
+        }
+      });
+    }
+  }
+  instrumentPreaggregation() {
+    const coordinator = this.coordinator;
+    const preaggregator = coordinator.preaggregator;
+    if (typeof preaggregator?.request !== "function") {
+      return;
+    }
+    const request = preaggregator.request.bind(preaggregator);
+    preaggregator.request = (client, selection, activeClause) => {
+      const info = request(client, selection, activeClause);
+      const name = this.selectionName(selection);
+      if (name) {
+        this.queryModes_.set(client, { selection: name, mode: info ? "index" : "scan" });
+      }
+      return info;
+    };
+    const updateClient = coordinator.updateClient.bind(coordinator);
+    coordinator.updateClient = async (client, query, priority) => {
+      const start = performance.now();
+      try {
+        return await updateClient(client, query, priority);
+      } finally {
+        const queryMode = this.queryModes_.get(client);
+        if (queryMode) {
+          this.queryModes_.delete(client);
+          this.clientModels_.get(client)?.send({
+            type: "selection_stats",
+            ...queryMode,
+            ms: performance.now() - start
+          });
+        }
+      }
+    };
+  }
+  selectionName(selection) {
+    for (const [name, param] of this.activeParams ?? /* @__PURE__ */ new Map()) {
+      if (param === selection) {
+        return name;
+      }
+    }
+    return void 0;
+  }
+  async insertTable(table, data, version = 0) {
+    const existing = this.tables_.get(table);
+    if (existing) {
+      await existing;
+      if ((this.tableVersions_.get(table) ?? 0) < version) {
+        this.tableVersions_.set(table, version);
+        const replace = (async () => {
+          await this.conn_.query(`DROP TABLE IF EXISTS "${table}"`);
+          await this.conn_.insertArrowFromIPCStream(data, { name: table, create: true });
+        })();
+        this.tables_.set(table, replace);
+        await replace;
+        this.requeryTable(table);
+      }
+      return;
+    }
+    this.tableVersions_.set(table, version);
+    const insert = this.conn_.insertArrowFromIPCStream(data, {
       name: table,
       create: true
     });
+    this.tables_.set(table, insert);
+    await insert;
   }
   async waitForTable(table) {
-    await waitForTable(this.conn_, table);
+    const existing = this.tables_.get(table);
+    if (existing) {
+      await existing;
+    } else {
+      await waitForTable(this.conn_, table);
+    }
+  }
+  async appendTable(table, version, data) {
+    await this.waitForTable(table);
+    if ((this.tableVersions_.get(table) ?? 0) >= version) {
+      return;
+    }
+    this.tableVersions_.set(table, version);
+    await this.conn_.insertArrowFromIPCStream(data, { name: table, create: false });
+    this.requeryTable(table);
+  }
+  requeryTable(table) {
+    this.coordinator.clear({ clients: false, cache: true });
+    for (const client of this.coordinator.clients) {
+      try {
+        if (String(client.query([])).includes(table)) {
+          client.requestQuery();
+        }
+      } catch {
+      }
+    }
+  }
+  useKernel(model) {
+    if (!this.kernelConnector_) {
+      this.kernelConnector_ = new KernelConnector();
+      this.coordinator.databaseConnector(this.kernelConnector_);
+    }
+    return this.kernelConnector_.addModel(model);
   }
   recordUnhandledError(error) {
     this.unhandledErrors_.push(error);
@@ -2768,8 +3149,10 @@ async function render({ model, el }) {
   const plotDefaultsAst = parseSpec(plotDefaultsSpec);
   const ctx = await vizContext(plotDefaultsAst.plotDefaults);
   applyTickFormatting(spec);
+  const removeModel = ctx.addModel(model);
+  const removeKernelModel = model.get("query_backend") === "kernel" ? ctx.useKernel(model) : void 0;
   const tables = model.get("tables") || {};
-  await syncTables(ctx, tables);
+  await syncTables(ctx, tables, model.get("table_versions") || {});
   el.classList.add("mosaic-widget");
   const renderOptions = renderSetup(el);
   const inputs = new Set(Object.keys(INPUTS));
@@ -2791,9 +3174,13 @@ async function render({ model, el }) {
       const specEl = await astToDOM(ast, ctx);
       el.innerHTML = "";
       el.appendChild(specEl);
+      displayWarnings(el, model.get("warnings") || []);
       replaceTooltipImpl(specEl);
       installTextCollisionHandler(specEl);
       installLegendHandler(specEl, !renderOptions.autoFill);
+      ctx.addClients(model, specEl);
+      ctx.activatePreaggregation(specEl, model.get("preaggregate") || []);
+      ctx.reportState();
       await displayUnhandledErrors(ctx, el);
     } catch (e) {
       console.error(e);
@@ -2802,10 +3189,21 @@ async function render({ model, el }) {
     }
   };
   await renderSpec();
+  const onCustomMessage = async (msg, buffers) => {
+    if (msg.type === "append") {
+      if (buffers.length > 0) {
+        await ctx.appendTable(msg.table, msg.version, tableBytes(buffers[0]));
+      } else {
+        ctx.requeryTable(msg.table);
+      }
+    }
+  };
+  model.on("msg:custom", onCustomMessage);
+  let resizeObserver;
   if (renderOptions.autoFill && !isInputSpec(spec)) {
     let lastContainerWidth = el.clientWidth;
     let lastContainerHeight = el.clientHeight;
-    const resizeObserver = new ResizeObserver(
+    resizeObserver = new ResizeObserver(
       throttle3(async () => {
         if (lastContainerWidth !== el.clientWidth || lastContainerHeight !== el.clientHeight) {
           lastContainerWidth = el.clientWidth;
@@ -2815,25 +3213,47 @@ async function render({ model, el }) {
       })
     );
     resizeObserver.observe(el);
-    return () => {
-      resizeObserver.disconnect();
-    };
   }
+  return () => {
+    model.off("msg:custom", onCustomMessage);
+    removeKernelModel?.();
+    removeModel();
+    resizeObserver?.disconnect();
+  };
 }
-async function syncTables(ctx, tables) {
-  for (const [tableName, base64Data] of Object.entries(tables)) {
-    if (base64Data) {
-      const binaryString = atob(base64Data);
-      const bytes = new Uint8Array(binaryString.length);
-      for (let i = 0; i < binaryString.length; i++) {
-        bytes[i] = binaryString.charCodeAt(i);
-      }
-      await ctx.insertTable(tableName, bytes);
+async function syncTables(ctx, tables, versions) {
+  for (const [tableName, tableData] of Object.entries(tables)) {
+    const bytes = tableBytes(tableData);
+    if (bytes.byteLength > 0) {
+      await ctx.insertTable(tableName, bytes, versions[tableName] ?? 0);
     } else {
       await ctx.waitForTable(tableName);
     }
   }
 }
+function tableBytes(tableData) {
+  if (typeof tableData === "string") {
+    return base64ToBytes(tableData);
+  } else if (tableData instanceof Uint8Array) {
+    return tableData;
+  } else if (ArrayBuffer.isView(tableData)) {
+    return new Uint8Array(tableData.buffer, tableData.byteOffset, tableData.byteLength);
+  } else {
+    return new Uint8Array(tableData);
+  }
+}
+function base64ToBytes(base64Data) {
+  const fromBase64 = Uint8Array.fromBase64;
+  if (typeof fromBase64 === "function") {
+    return fromBase64(base64Data);
+  }
+  const binaryString = atob(base64Data);
+  const bytes = new Uint8Array(binaryString.length);
+  for (let i = 0; i < binaryString.length; i++) {
+    bytes[i] = binaryString.charCodeAt(i);
+  }
+  return bytes;
+}
 function renderSetup(containerEl) {
   const widgetEl = containerEl.closest(".widget-subarea");
   if (widgetEl) {
@@ -2905,6 +3325,14 @@ async function astToDOM(ast, ctx) {
   }
   return ast.root.instantiate(ctx);
 }
+function displayWarnings(el, warnings) {
+  for (const warning of warnings) {
+    const warningEl = document.createElement("div");
+    warningEl.className = "viz-warning";
+    warningEl.textContent = warning;
+    el.insertBefore(warningEl, el.firstChild);
+  }
+}
 async function displayUnhandledErrors(ctx, widgetEl) {
   const emptyPlotDivs = widgetEl.querySelectorAll("div.plot:empty");
   for (const emptyDiv of emptyPlotDivs) {
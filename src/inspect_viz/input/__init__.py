@@ -4,6 +4,7 @@ from ._radio_group import radio_group
 from ._search import search
 from ._select import select
 from ._slider import slider
+from ._typeahead import Typeahead
 
 __all__ = [
     "checkbox",
@@ -12,4 +13,5 @@ __all__ = [
     "search",
     "select",
     "slider",
+    "Typeahead",
 ]
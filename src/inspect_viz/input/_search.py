@@ -4,6 +4,7 @@ from inspect_viz._core.param import Param
 
 from .._core import Component, Data, Selection
 from ._params import column_validated, label_param
+from ._typeahead import Typeahead, typeahead_params
 from ._util import input_component
 
 
@@ -18,6 +19,7 @@ def search(
     label: str | None = None,
     placeholder: str | None = None,
     width: float | None = None,
+    typeahead: bool | Typeahead | None = None,
 ) -> Component:
     """Text search input widget
 
@@ -35,6 +37,7 @@ def search(
        label: A text label for this input (optional).
        placeholder: Placeholder text for empty search box.
        width: Width in pixels (defaults to 150).
+       typeahead: Query autocomplete values as the user types rather than loading all of the unique column values (use for columns with many unique values). Pass `True` for default settings or a `Typeahead` for custom settings.
     """
     config: dict[str, Any] = {"input": "search"} | label_param(label)
 
@@ -65,5 +68,8 @@ def search(
     if width is not None:
         config["width"] = width
 
+    # set typeahead (which may query an index rather than the data table)
+    config = config | typeahead_params(typeahead, data, column, filter_by)
+
     # return widget
     return input_component(config=config)
@@ -4,6 +4,7 @@ from inspect_viz._util.marshall import dict_remove_none
 
 from .._core import Component, Data, Param, Selection
 from ._params import data_params, label_param, options_params
+from ._typeahead import Typeahead, typeahead_params
 from ._util import input_component
 
 
@@ -21,6 +22,7 @@ def select(
     field: str | None = None,
     label: str | None = None,
     width: float | None = None,
+    typeahead: bool | Typeahead | None = None,
 ) -> Component:
     """Select input.
 
@@ -46,7 +48,11 @@ def select(
        field: The data column name to use within generated selection clause predicates. Defaults to the `column` parameter.
        label: A text label for the input. If unspecified, the column name (if provided) will be used by default.
        width: Width in pixels (defaults to 150).
+       typeahead: Query options as the user types rather than loading all of the unique column values (use for columns with many unique values). Pass `True` for default settings or a `Typeahead` for custom settings.
     """
+    if typeahead and value == "auto":
+        raise ValueError("The 'auto' value can't be used along with `typeahead`")
+
     config: dict[str, Any] = dict_remove_none(
         {
             "input": "select",
@@ -61,6 +67,7 @@ def select(
         | label_param(label)
         | options_params(options, target)
         | data_params(data, column, target, field, filter_by)
+        | typeahead_params(typeahead, data, column, filter_by)
     )
 
     if "as" not in config:
@@ -0,0 +1,78 @@
+import weakref
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from pydantic import BaseModel
+
+from .._core.data import Data
+from .._core.selection import Selection
+
+
+class Typeahead(BaseModel):
+    """Typeahead option loading for inputs.
+
+    Rather than loading every distinct value of a column up front, options
+    are queried as the user types (matching values that start with the text
+    typed, ignoring case). Use this for columns with many distinct values
+    (e.g. sample ids).
+
+    Args:
+        limit: Maximum number of options to query for the text typed.
+            Defaults to 100.
+        index: Query options from an index of the sorted distinct values of
+            the column (built when the input is created) rather than from
+            the data source. This makes queries faster for columns with many
+            repeated values, but can't be used along with `filter_by`.
+    """
+
+    limit: int = 100
+    index: bool = False
+
+    def __init__(self, limit: int = 100, *, index: bool = False):
+        super().__init__(limit=limit, index=index)
+
+
+def typeahead_params(
+    typeahead: bool | Typeahead | None,
+    data: Data | None,
+    column: str | None,
+    filter_by: Selection | None,
+) -> dict[str, Any]:
+    if not typeahead:
+        return {}
+    elif typeahead is True:
+        typeahead = Typeahead()
+
+    if data is None or column is None:
+        raise ValueError("You must pass `data` and `column` values to use `typeahead`")
+    if typeahead.limit < 1:
+        raise ValueError("The typeahead `limit` must be a positive integer.")
+
+    config: dict[str, Any] = {"typeahead": typeahead}
+    if typeahead.index:
+        if filter_by is not None:
+            raise ValueError("A typeahead `index` can't be used along with `filter_by`")
+        config["from"] = distinct_index(data, column).table
+    return config
+
+
+# indexes are held for as long as the data they index (and rebuilt when
+# rows are appended to the data)
+_indexes: weakref.WeakKeyDictionary[Data, dict[str, tuple[tuple[str, int], Data]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def distinct_index(data: Data, column: str) -> Data:
+    """Data with the sorted distinct (non-null) values of a column."""
+    # (appending to data which shares its table gives it a new table)
+    version = (data.table, data._version)
+    indexes = _indexes.setdefault(data, {})
+    index_version, index = indexes.get(column, (None, None))
+    if index is None or index_version != version:
+        values = pc.drop_null(pc.unique(data._get_table().column(column)))
+        values = pc.take(values, pc.array_sort_indices(values))
+        index = Data(pa.table([values], names=[column]))
+        indexes[column] = (version, index)
+    return index
@@ -4,4 +4,6 @@ from inspect_viz._core.component import Component
 
 
 def input_component(config: dict[str, Any]) -> Component:
-    return Component(config=config, bind_spec=True, bind_tables="empty")
+    # bind the tables the input references (rather than waiting on another
+    # component to send them, as its data may never be displayed otherwise)
+    return Component(config=config, bind_spec=True, bind_tables=True)
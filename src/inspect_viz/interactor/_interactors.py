@@ -1,14 +1,16 @@
 from pydantic import JsonValue
 
-from .._core.component import Component
+from .._core.component import SpecNode
 from .._core.selection import Selection
 from .._util.marshall import dict_remove_none
 from ._brush import Brush, brush_as_camel
 
 
-class Interactor(Component):
+class Interactor(SpecNode):
     """Interactors imbue plots with interactive behavior, such as selecting or highlighting values, and panning or zooming the display."""
 
+    __slots__ = ()
+
     def __init__(self, select: str, config: dict[str, JsonValue]) -> None:
         interactor: dict[str, JsonValue] = {"select": select}
         super().__init__(interactor | config)
@@ -1,9 +1,10 @@
 from pydantic import JsonValue
 
 from .._core import Component
+from .._core.component import SpecNode
 
 
-def vconcat(*component: Component) -> Component:
+def vconcat(*component: Component | SpecNode) -> Component:
     """Vertically concatenate components in a column layout.
 
     Args:
@@ -13,7 +14,7 @@ def vconcat(*component: Component) -> Component:
     return Component(config=dict(vconcat=components), bind_spec=True, bind_tables=True)
 
 
-def hconcat(*component: Component) -> Component:
+def hconcat(*component: Component | SpecNode) -> Component:
     """Horizontally concatenate components in a row layout.
 
     Args:
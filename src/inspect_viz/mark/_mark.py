@@ -5,16 +5,18 @@ from pydantic import JsonValue
 
 from inspect_viz.mark._options import MarkOptions
 
-from .._core.component import Component
+from .._core.component import SpecNode
 from .._util.marshall import snake_to_camel
 
 HIDDEN_USER_CHANNEL = "_user_channels"
 HIDDEN_SHIFT_TEXT = "_shift_overlapping_text"
 
 
-class Mark(Component):
+class Mark(SpecNode):
     """Plot mark (create marks using mark functions, e.g. `dot()`, `bar_x()`, etc.)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         type: str,
@@ -8,6 +8,8 @@ from ._types import TextStyles
 class Title(Mark):
     """Plot title mark."""
 
+    __slots__ = ()
+
     def __init__(self, title: str, margin_top: int, styles: TextStyles) -> None:
         config: dict[str, Any] = dict(
             text=[title],
@@ -11,7 +11,14 @@ from ._attributes import (
 from ._defaults import PlotDefaults, plot_defaults
 from ._legend import Legend, legend
 from ._plot import plot
-from ._write import to_html, write_html, write_png, write_png_async
+from ._write import (
+    to_html,
+    write_html,
+    write_png,
+    write_png_async,
+    write_pngs,
+    write_pngs_async,
+)
 
 __all__ = [
     "plot",
@@ -21,6 +28,8 @@ __all__ = [
     "write_html",
     "write_png",
     "write_png_async",
+    "write_pngs",
+    "write_pngs_async",
     "PlotAttributes",
     "PlotDefaults",
     "plot_defaults",
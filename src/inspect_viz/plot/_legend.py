@@ -1,16 +1,18 @@
-from typing import cast
+from typing import Any, cast
 
 from pydantic import JsonValue
 from typing_extensions import Literal
 
-from .._core.component import Component
+from .._core.component import Component, SpecNode
 from .._core.selection import Selection
 from ..mark._types import FrameAnchor
 
 
-class Legend(Component):
+class Legend(SpecNode):
     """Plot legend (create legends using the `legend()` function)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         legend: Literal["color", "opacity", "symbol"],
@@ -50,6 +52,13 @@ class Legend(Component):
         """The frame anchor for the legend."""
         return cast(FrameAnchor, self.config["_frame_anchor"])
 
+    def _repr_mimebundle_(
+        self, **kwargs: Any
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        # standalone legends (e.g. `legend(..., for_plot="penguins")`) are
+        # displayed by a component of their own
+        return Component(self.config)._repr_mimebundle_(**kwargs)
+
 
 def legend(
     legend: Literal["color", "opacity", "symbol"],
@@ -7,6 +7,7 @@ from inspect_viz._util.notgiven import NOT_GIVEN, NotGiven
 from inspect_viz._util.platform import quarto_fig_size
 
 from .._core import Component
+from .._core.component import SpecNode
 from .._core.param import Param
 from ..interactor._interactors import Interactor
 from ..layout._concat import hconcat
@@ -135,7 +136,7 @@ def plot(
             leg.config["for"] = config["name"]
 
         # handle legend location
-        plot_component = Component(config=config)
+        plot_component = SpecNode(config)
         if leg.frame_anchor in [
             "left",
             "right",
@@ -149,4 +150,4 @@ def plot(
             return hconcat(plot_component, *legend_components)
 
     else:
-        return hconcat(Component(config=config))
+        return hconcat(SpecNode(config))
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import subprocess
 import sys
@@ -6,10 +7,10 @@ from contextlib import asynccontextmanager
 from io import BytesIO
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Sequence
 
 import ipywidgets  # type: ignore
-from ipywidgets.embed import embed_data, escape_script  # type: ignore
+from ipywidgets.embed import dependency_state, embed_data, escape_script  # type: ignore
 from PIL import Image, ImageChops, ImageOps
 from typing_extensions import overload
 
@@ -27,9 +28,17 @@ def to_html(component: Component, dependencies: bool = True) -> str:
           Dependencies should only be included once per web-page, so if you already have
           them on a page you might want to disable including them when generating HTML.
     """
-    # realize the widget data and state
-    component._mimebundle(collect=False)
-    widget_data = embed_data(views=[component], drop_defaults=False)
+    # realize the widget data and state (tables are embedded as base64
+    # as standalone html has no comm to carry binary buffers)
+    component._mimebundle(collect=False, binary=False)
+
+    # embed only the state of this component (and the widgets it depends on)
+    # rather than the state of every live widget
+    widget_data = embed_data(
+        views=[component],
+        drop_defaults=False,
+        state=dependency_state(component, drop_defaults=False),
+    )
     widget_state = escape_script(json.dumps(widget_data["manager_state"], indent=2))
 
     # create views
@@ -43,22 +52,8 @@ def to_html(component: Component, dependencies: bool = True) -> str:
         for view_spec in widget_data["view_specs"]
     )
 
-    # create runtime dependencies
-    html_manager_version = ipywidgets._version.__html_manager_version__
-    jupyter_dependencies = (
-        dedent(f"""
-
-    <!--[jupyter_widget_dependencies]-->
-    <script src="https://cdn.jsdelivr.net/npm/requirejs@2.3.6/require.min.js" crossorigin="anonymous"></script>
-    <script src="https://cdn.jsdelivr.net/npm/@jupyter-widgets/html-manager@{html_manager_version}/dist/embed-amd.js" crossorigin="anonymous"></script>
-    <!--[/jupyter_widget_dependencies]-->
-    """)
-        if dependencies
-        else ""
-    )
-
     return HTML_SNIPPET_TEMPLATE.format(
-        dependencies=jupyter_dependencies,
+        dependencies=_jupyter_dependencies() if dependencies else "",
         widget_state=widget_state,
         widget_views=widget_views,
     )
@@ -74,6 +69,17 @@ HTML_SNIPPET_TEMPLATE = """
 """
 
 
+def _jupyter_dependencies() -> str:
+    html_manager_version = ipywidgets._version.__html_manager_version__
+    return dedent(f"""
+
+    <!--[jupyter_widget_dependencies]-->
+    <script src="https://cdn.jsdelivr.net/npm/requirejs@2.3.6/require.min.js" crossorigin="anonymous"></script>
+    <script src="https://cdn.jsdelivr.net/npm/@jupyter-widgets/html-manager@{html_manager_version}/dist/embed-amd.js" crossorigin="anonymous"></script>
+    <!--[/jupyter_widget_dependencies]-->
+    """)
+
+
 def write_html(
     file: str | Path, component: Component, dependencies: bool = True
 ) -> None:
@@ -165,33 +171,192 @@ async def write_png_async(
             page = await ctx.new_page()
             file_uri = Path(temp_file.name).resolve().as_uri()
             await page.goto(file_uri, wait_until="networkidle")
-            await page.wait_for_function(
-                '() => !!window.document.querySelector("svg") || !!window.document.querySelector(".inspect-viz-table")',
-                polling=100,
-            )
+            await _wait_for_component(page)
+
+            # take screenshot
+            return await _capture_png(page, file, scale, padding)
+
+
+def write_pngs(
+    files: Sequence[str | Path],
+    components: Sequence[Component],
+    scale: int = 2,
+    padding: int = 8,
+    concurrency: int = 4,
+) -> list[tuple[int, int]] | None:
+    """Export several plots or tables to PNGs.
+
+    Uses a single browser for all of the components (rendering them
+    concurrently in a pool of pages that are reused), which is much faster
+    than calling `write_png()` for each component.
+
+    Args:
+       files: Target filenames (one for each component).
+       components: Components to export.
+       scale: Device scale to capture plots at. Use 2 (the default) for retina quality images suitable for high resolution displays or print output)
+       padding: Padding (in pixels) around plots.
+       concurrency: Number of components to render concurrently.
+
+    Returns:
+       List with (width, height) of each image. Returns `None` if no images were saved.
+    """
+    if current_async_backend() == "trio":
+        raise RuntimeError("Use write_pngs_async() when running under trio")
+
+    return run_coroutine(
+        write_pngs_async(files, components, scale, padding, concurrency)
+    )
+
+
+async def write_pngs_async(
+    files: Sequence[str | Path],
+    components: Sequence[Component],
+    scale: int = 2,
+    padding: int = 8,
+    concurrency: int = 4,
+) -> list[tuple[int, int]] | None:
+    """Export several plots or tables to PNGs.
+
+    Uses a single browser for all of the components (rendering them
+    concurrently in a pool of pages that are reused), which is much faster
+    than calling `write_png_async()` for each component.
 
-            # eliminate scrolling
-            w = await page.evaluate("document.documentElement.scrollWidth")
-            h = await page.evaluate("document.documentElement.scrollHeight")
-            await page.set_viewport_size({"width": w, "height": h})
+    Args:
+       files: Target filenames (one for each component).
+       components: Components to export.
+       scale: Device scale to capture plots at. Use 2 (the default) for retina quality images suitable for high resolution displays or print output)
+       padding: Padding (in pixels) around plots.
+       concurrency: Number of components to render concurrently.
+
+    Returns:
+       List with (width, height) of each image. Returns `None` if no images were saved.
+    """
+    if len(files) != len(components):
+        raise ValueError("write_pngs() requires one file for each component.")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    # realize html for the components (without the widget runtime, which
+    # is loaded once by each page)
+    snippets = [to_html(component, dependencies=False) for component in components]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        host_file = Path(temp_dir) / "host.html"
+        host_file.write_text(
+            HOST_PAGE_TEMPLATE.format(dependencies=_jupyter_dependencies())
+        )
+
+        # launch the browser
+        async with _with_browser() as b:
+            from playwright.async_api import Browser, Page
+
+            # browser can be None if playwright wasn't installed yet
+            if not isinstance(b, Browser):
+                return None
+
+            # create a pool of pages with the widget runtime loaded. the
+            # runtime (including duckdb) is initialized by the first component
+            # rendered in each page and then reused by subsequent components
+            ctx = await b.new_context(device_scale_factor=scale)
 
-            # take screenshot and crop image
-            background_color = "white"
-            image_bytes = await page.screenshot(
-                scale="device",
-                style="body { background-color: " + background_color + "; }",
+            async def new_page() -> Page:
+                page = await ctx.new_page()
+                await page.goto(host_file.resolve().as_uri(), wait_until="networkidle")
+                return page
+
+            pages: asyncio.Queue[Page] = asyncio.Queue()
+            for page in await asyncio.gather(
+                *(new_page() for _ in range(min(concurrency, len(components))))
+            ):
+                pages.put_nowait(page)
+
+            async def render(file: str | Path, snippet: str) -> tuple[int, int]:
+                page = await pages.get()
+                try:
+                    # reset the viewport (which _capture_png() resizes to the
+                    # previous component) then render and capture
+                    await page.set_viewport_size({"width": 1280, "height": 720})
+                    await page.evaluate(RENDER_COMPONENT_JS, snippet)
+                    await _wait_for_component(page)
+                    return await _capture_png(page, file, scale, padding)
+                finally:
+                    pages.put_nowait(page)
+
+            return list(
+                await asyncio.gather(
+                    *(
+                        render(file, snippet)
+                        for file, snippet in zip(files, snippets, strict=True)
+                    )
+                )
             )
-            img = _crop_image(image_bytes, padding, scale, background_color)
-            size = img.size
-            if file:
-                img.save(file, dpi=(scale * 96, scale * 96))
-                img.close()
-                return size
-            else:
-                image_buffer = BytesIO()
-                img.save(image_buffer, format="PNG")
-                img.close()
-                return (image_buffer.getvalue(), size[0], size[1])
+
+
+HOST_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>{dependencies}</head>
+<body><div id="inspect-viz-root"></div></body>
+</html>
+"""
+
+
+RENDER_COMPONENT_JS = """
+(html) => new Promise((resolve, reject) => {
+    const root = document.getElementById("inspect-viz-root");
+    root.innerHTML = html;
+    window.require(
+        ["@jupyter-widgets/html-manager/dist/libembed-amd"],
+        (embed) => Promise.resolve(embed.renderWidgets(root)).then(resolve, reject),
+        reject
+    );
+})
+"""
+
+
+async def _wait_for_component(page: Any) -> None:
+    await page.wait_for_function(
+        '() => !!window.document.querySelector("svg") || !!window.document.querySelector(".inspect-viz-table")',
+        polling=100,
+    )
+
+
+@overload
+async def _capture_png(
+    page: Any, file: None, scale: int, padding: int
+) -> tuple[bytes, int, int]: ...
+
+
+@overload
+async def _capture_png(
+    page: Any, file: str | Path, scale: int, padding: int
+) -> tuple[int, int]: ...
+
+
+async def _capture_png(
+    page: Any, file: str | Path | None, scale: int, padding: int
+) -> tuple[bytes, int, int] | tuple[int, int]:
+    # eliminate scrolling
+    w = await page.evaluate("document.documentElement.scrollWidth")
+    h = await page.evaluate("document.documentElement.scrollHeight")
+    await page.set_viewport_size({"width": w, "height": h})
+
+    # take screenshot and crop image
+    background_color = "white"
+    image_bytes = await page.screenshot(
+        scale="device",
+        style="body { background-color: " + background_color + "; }",
+    )
+    img = _crop_image(image_bytes, padding, scale, background_color)
+    size = img.size
+    if file:
+        img.save(file, dpi=(scale * 96, scale * 96))
+        img.close()
+        return size
+    else:
+        image_buffer = BytesIO()
+        img.save(image_buffer, format="PNG")
+        img.close()
+        return (image_buffer.getvalue(), size[0], size[1])
 
 
 @asynccontextmanager
@@ -263,6 +263,8 @@ def table(
     sorting: bool | None = None,
     filtering: bool | Literal["header", "row"] | None = None,
     pagination: bool | Pagination | None = None,
+    row_model: Literal["client", "server"] | None = None,
+    block_size: int | None = None,
     style: TableStyle | None = None,
 ) -> Component:
     """Tabular display of data.
@@ -289,8 +291,21 @@ def table(
         pagination: Enable pagination. If set to True, default pagination settings
             are used. If set to a Pagination object, custom pagination settings are
             used.
+        row_model: Where rows are loaded. "client" (the default) queries all
+            rows and sorts and filters them in the table. "server" queries only
+            the rows currently being viewed (in blocks of `block_size` rows),
+            pushing sorting and filtering down into the database. Use "server"
+            for tables with many rows.
+        block_size: Number of rows to query at a time when `row_model` is
+            "server". Defaults to 100.
         style: The style configuration for the table display.
     """
+    if block_size is not None:
+        if row_model != "server":
+            raise ValueError("The 'block_size' option requires row_model='server'.")
+        if block_size < 1:
+            raise ValueError("The 'block_size' option must be a positive integer.")
+
     config: dict[str, JsonValue] = dict_remove_none(
         {
             "input": "table",
@@ -304,6 +319,8 @@ def table(
             "sorting": sorting,
             "filtering": filtering,
             "pagination": resolve_pagination(pagination),
+            "row_model": row_model,
+            "block_size": block_size,
             "header_height": header_height,
             "row_height": row_height,
             "select": select,
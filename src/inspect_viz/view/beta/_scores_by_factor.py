@@ -5,7 +5,8 @@ from inspect_viz._util.channels import resolve_log_viewer_channel
 from inspect_viz._util.color import lighten_color_hsl
 from inspect_viz._util.notgiven import NOT_GIVEN, NotGiven
 from inspect_viz.mark import frame, rule_y
-from inspect_viz.mark._mark import Mark, Marks
+from inspect_viz.mark._mark import Marks
+from inspect_viz.mark._title import Title
 from inspect_viz.mark._util import flatten_marks
 from inspect_viz.plot import PlotAttributes, plot
 from inspect_viz.plot import legend as create_legend
@@ -24,7 +25,7 @@ def scores_by_factor(
     model_label: str = "Model",
     ci: bool | float = 0.95,
     color: str | tuple[str, str] = "#3266ae",
-    title: str | Mark | None = None,
+    title: str | Title | None = None,
     marks: Marks | None = None,
     width: float | Param | None = None,
     height: float | Param | None = None,
@@ -1,5 +1,5 @@
 import json
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
@@ -9,12 +9,12 @@ from inspect_viz._core.component import Component
 from inspect_viz._core.data import Data
 from inspect_viz._core.selection import Selection
 from inspect_viz._util.channels import resolve_log_viewer_channel
-from inspect_viz._util.inspect import value_to_float
+from inspect_viz._util.inspect import values_to_float
 from inspect_viz._util.notgiven import NOT_GIVEN, NotGiven
 from inspect_viz._util.stats import z_score
-from inspect_viz.interactor._interactors import highlight, nearest_x
+from inspect_viz.interactor._interactors import Interactor, highlight, nearest_x
 from inspect_viz.mark import area_y, line
-from inspect_viz.mark._mark import Marks
+from inspect_viz.mark._mark import Mark, Marks
 from inspect_viz.mark._title import Title
 from inspect_viz.mark._util import flatten_marks
 from inspect_viz.plot import plot
@@ -71,18 +71,15 @@ def scores_by_limit_df(
 
     # compute the total tokens
     if limit == "total_tokens":
-        df["total_tokens"] = df.apply(
-            lambda x: json.loads(x["model_usage"])
-            .get(x["model"], {})
-            .get("total_tokens", {})
-            if pd.notnull(x["model_usage"])
-            else None,
-            axis=1,
-        )
+        df["total_tokens"] = [
+            json.loads(usage).get(model, {}).get("total_tokens", {})
+            if pd.notnull(usage)
+            else None
+            for usage, model in zip(df["model_usage"], df["model"], strict=True)
+        ]
 
     # coerce the score to a float
-    to_float = value_to_float()
-    df[score] = df[score].apply(to_float)
+    df[score] = values_to_float(df[score])
 
     # determine the bin resolution for the the resource given the range
     # (if there are 2 or more orders of magnitude, use log spacing)
@@ -93,65 +90,98 @@ def scores_by_limit_df(
     else:
         limits = np.linspace(min_tokens, max_tokens, steps)
 
-    # Prepare the new data structure to represent the success
-    # rate at a given limit (for each model)
-    data_dict: dict[str, list[str | float | int]] = {
-        limit: [],
-        "model": [],
-        "success_rate": [],
-        "standard_error": [],
-        "other_termination_rate": [],
-        "count": [],
+    # compute the success rate, standard error, and other termination rate
+    # at every limit for each model (in a single sorted sweep per model)
+    models: list[Any] = []
+    stats: list[dict[str, np.ndarray]] = []
+    for model, model_df in df.groupby("model"):
+        model_stats = _limit_sweep(
+            model_df[limit].to_numpy(dtype=float),
+            model_df[score].to_numpy(dtype=float),
+            model_df["task_id"],
+            limits,
+        )
+        if model_stats is not None:
+            models.append(model)
+            stats.append(model_stats)
+
+    # rows are ordered by limit and then model
+    def by_limit(column: str) -> np.ndarray:
+        if len(stats) == 0:
+            return np.array([], dtype=float)
+        return np.stack([model_stats[column] for model_stats in stats]).T.ravel()
+
+    data_dict: dict[str, list[Any] | np.ndarray] = {
+        limit: np.repeat(limits, len(models)),
+        "model": models * len(limits),
+        "success_rate": by_limit("success_rate"),
+        "standard_error": by_limit("standard_error"),
+        "other_termination_rate": by_limit("other_termination_rate"),
+        "count": np.tile(
+            np.array([model_stats["count"] for model_stats in stats], dtype=np.int64),
+            len(limits),
+        ),
     }
 
-    # Add log column support if it exists
-    has_log_column = "log" in df.columns
-    if has_log_column:
-        data_dict["log"] = []
-        # Get the first log value for each model
+    # Add log column support if it exists (first log value for each model)
+    if "log" in df.columns:
         log_by_model = df.groupby("model")["log"].first().to_dict()
+        data_dict["log"] = [log_by_model[model] for model in models] * len(limits)
 
-    # For each limit, compute the success rate and standard error
-    for current_limit in limits:
-        df_limit = df.copy()
-        df_limit["other_termination_condition"] = (df_limit[limit] < current_limit) & (
-            df_limit[score] == 0
-        )
-        df_limit.loc[df_limit[limit] > current_limit, score] = 0
-
-        by_task = df_limit.groupby(["model", "task_id"]).agg(
-            success_rate=(score, "mean"),
-            other_termination_rate=("other_termination_condition", "mean"),
-        )
-
-        # For standard error, go back to the original samples
-        by_model_stats = df_limit.groupby(["model"]).agg(
-            success_rate=(score, "mean"),
-            standard_error=(score, "sem"),  # From individual samples
-            count=(score, "count"),
-        )
-
-        # Combine with task-level other_termination_rate
-        by_model = (
-            by_task.groupby(["model"])
-            .agg(
-                other_termination_rate=("other_termination_rate", "mean"),
-            )
-            .join(by_model_stats)
-            .reset_index()
-        )
+    return pd.DataFrame(data_dict)
 
-        for _, row in by_model.iterrows():
-            data_dict[limit].append(current_limit)
-            data_dict["model"].append(row["model"])
-            data_dict["success_rate"].append(row["success_rate"])
-            data_dict["standard_error"].append(row["standard_error"])
-            data_dict["other_termination_rate"].append(row["other_termination_rate"])
-            data_dict["count"].append(row["count"])
-            if has_log_column:
-                data_dict["log"].append(log_by_model[row["model"]])
 
-    return pd.DataFrame(data_dict)
+def _limit_sweep(
+    limit_values: np.ndarray,
+    scores: np.ndarray,
+    task_ids: pd.Series,
+    limits: np.ndarray,
+) -> dict[str, np.ndarray] | None:
+    # other termination rate is the mean (over tasks) of the rate of samples
+    # that failed within the limit, so weight each sample by its task's share
+    task_codes, _ = pd.factorize(task_ids)
+    tasks = task_codes.max() + 1
+    if tasks <= 0:
+        return None  # no tasks to compute an other termination rate for
+    task_sizes = np.bincount(task_codes[task_codes >= 0], minlength=tasks)
+
+    # samples exceeding a limit are scored as 0 at that limit (samples with
+    # no value for the limit always keep their score)
+    no_limit = np.isnan(limit_values)
+    order = np.argsort(limit_values[~no_limit], kind="stable")
+    sorted_limits = limit_values[~no_limit][order]
+    sorted_scores = scores[~no_limit][order]
+    within = np.searchsorted(sorted_limits, limits, side="right")
+    score_sums = np.concatenate(([0.0], np.cumsum(sorted_scores)))[within]
+    square_sums = np.concatenate(([0.0], np.cumsum(sorted_scores**2)))[within]
+    score_sums += scores[no_limit].sum()
+    square_sums += (scores[no_limit] ** 2).sum()
+
+    # mean and standard error of the mean
+    count = len(scores)
+    success_rate = score_sums / count
+    if count > 1:
+        variance = np.maximum(square_sums - count * success_rate**2, 0) / (count - 1)
+        standard_error = np.sqrt(variance) / np.sqrt(count)
+    else:
+        standard_error = np.full(len(limits), np.nan)
+
+    # failed samples (with a task) below each limit
+    failed = (scores == 0) & ~no_limit & (task_codes >= 0)
+    failed_order = np.argsort(limit_values[failed], kind="stable")
+    failed_limits = limit_values[failed][failed_order]
+    failed_weights = 1 / (task_sizes[task_codes[failed]] * tasks)
+    below = np.searchsorted(failed_limits, limits, side="left")
+    other_termination_rate = np.concatenate(
+        ([0.0], np.cumsum(failed_weights[failed_order]))
+    )[below]
+
+    return {
+        "count": np.array(count),
+        "success_rate": success_rate,
+        "standard_error": standard_error,
+        "other_termination_rate": other_termination_rate,
+    }
 
 
 def scores_by_limit(
@@ -259,7 +289,7 @@ def scores_by_limit(
     use_log = scale == "log" or (scale == "auto" and resource_max / resource_min >= 100)
 
     # Lines for the the model performance
-    components = [
+    components: list[Mark | Interactor] = [
         line(
             data,
             x=limit,
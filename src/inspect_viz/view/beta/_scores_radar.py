@@ -78,56 +78,46 @@ def scores_radar_df(
 
     data = data[columns_to_keep]
 
+    if data.empty:
+        raise ValueError("No valid model data found after processing.")
+
     # calculate angles for radar chart coordinates
     num_axes = len(metrics)
     angles = compute_angles(num_axes, endpoint=False)
-    # close polygon angles by repeating first point
-    angles_closed = np.append(angles, angles[0])
+    # close polygons by repeating first point
+    closed = np.append(np.arange(num_axes), 0)
+    angles_closed = angles[closed]
 
     # calculate percentile ranks for each metric across all models
-    metric_percentile_ranks = {}
-    for metric_name, metric_col in zip(metrics, metric_cols, strict=True):
-        # handle metrics where lower is better
-        if invert and metric_name in invert:
-            max_val = data[metric_col].astype(float).max()
-            values = max_val - data[metric_col].astype(float)
-        else:
-            values = data[metric_col].astype(float)
-
-        metric_percentile_ranks[metric_name] = values.rank(method="average", pct=True)
-
-    all_rows = []
-    for i, model in enumerate(data["model"].tolist()):
-        model_data = data[data["model"] == model]
-        values_raw = model_data[metric_cols].values[0].astype(float).tolist()
-        values_scaled = [metric_percentile_ranks[metric].iloc[i] for metric in metrics]
-
-        # close polygon values by repeating first point
-        values_scaled_closed = values_scaled + [values_scaled[0]]
-
-        # get task_id and log for this model
-        task_id_value = model_data["task_id"].item()
-        log_value = model_data["log"].item() if "log" in model_data.columns else ""
-
-        model_rows = pd.DataFrame(
-            {
-                "task_id": [task_id_value] * (num_axes + 1),
-                "model": [model] * (num_axes + 1),
-                "log": [log_value] * (num_axes + 1),
-                "metric": metrics + [metrics[0]],
-                "value": values_raw + [values_raw[0]],
-                # polygon coordinates
-                "x": np.array(values_scaled_closed) * np.cos(angles_closed),
-                "y": np.array(values_scaled_closed) * np.sin(angles_closed),
-            }
-        )
-
-        all_rows.append(model_rows)
-
-    if not all_rows:
-        raise ValueError("No valid model data found after processing.")
-
-    return pd.concat(all_rows, ignore_index=True)
+    # (handling metrics where lower is better)
+    scores = data[metric_cols].astype(float)
+    if invert:
+        invert_cols = [
+            col
+            for metric_name, col in zip(metrics, metric_cols, strict=True)
+            if metric_name in invert
+        ]
+        scores[invert_cols] = scores[invert_cols].max() - scores[invert_cols]
+    percentile_ranks = scores.rank(method="average", pct=True).to_numpy()
+
+    # build the polygons for all models (one row per model and point)
+    values_raw = data[metric_cols].to_numpy(dtype=float)[:, closed]
+    values_scaled = percentile_ranks[:, closed]
+    num_points = num_axes + 1
+    return pd.DataFrame(
+        {
+            "task_id": np.repeat(data["task_id"].to_numpy(), num_points),
+            "model": np.repeat(data["model"].to_numpy(), num_points),
+            "log": np.repeat(data["log"].to_numpy(), num_points)
+            if "log" in data.columns
+            else "",
+            "metric": np.tile(np.array(metrics, dtype=object)[closed], len(data)),
+            "value": values_raw.ravel(),
+            # polygon coordinates
+            "x": (values_scaled * np.cos(angles_closed)).ravel(),
+            "y": (values_scaled * np.sin(angles_closed)).ravel(),
+        }
+    )
 
 
 def compute_angles(num_axes: int, endpoint: bool = True) -> NDArray[np.floating[Any]]:
@@ -0,0 +1,264 @@
+import base64
+import json
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from inspect_viz import Data, Param, Selection
+from inspect_viz._core.component import spec_data, spec_tables
+from inspect_viz.input import select
+from inspect_viz.interactor import interval_x
+from inspect_viz.layout import vconcat
+from inspect_viz.mark import dot
+from inspect_viz.plot import plot
+from inspect_viz.table import table as table_component
+from inspect_viz.transform import sql
+from ipywidgets.widgets.widget import _remove_buffers  # type: ignore
+
+
+def _data(rows: int) -> Data:
+    return Data.from_dataframe(
+        pd.DataFrame({"x": range(rows), "y": range(rows), "z": ["a"] * rows})
+    )
+
+
+def test_spec_tables_only_referenced() -> None:
+    data1, data2, _ = _data(10), _data(100), _data(1000)
+
+    component = plot(dot(data1, x="x", y="y"))
+    assert spec_data(component.config) == [data1]
+
+    component = vconcat(
+        plot(dot(data1, x="x", y="y")), select(data2, column="z", label="z")
+    )
+    assert spec_data(component.config) == [data1, data2]
+
+
+def test_spec_tables_bytes_per_widget() -> None:
+    small, _, large = _data(10), _data(100_000), _data(500_000)
+
+    # a widget sends only the payload of the table it references
+    component = plot(dot(small, x="x", y="y"))
+    component._mimebundle(collect=False)
+    sent = sum(len(v) for v in component.tables.values())
+    assert list(component.tables.keys()) == [small.table]
+    assert sent == small._get_data().size
+    assert sent < large._get_data().size
+
+
+def test_spec_tables_collect_once() -> None:
+    data = _data(17)
+
+    tables = spec_tables(plot(dot(data, x="x", y="y")).config, collect=True)
+    assert tables[data.table] == data._get_data()
+
+    tables = spec_tables(plot(dot(data, x="x", y="y")).config, collect=True)
+    assert len(tables[data.table]) == 0
+
+
+def test_spec_tables_shared_content() -> None:
+    data1, data2 = _data(23), _data(23)
+
+    component = vconcat(plot(dot(data1, x="x", y="y")), plot(dot(data2, x="x", y="y")))
+    tables = spec_tables(component.config, collect=False)
+    assert list(tables.keys()) == [data1.table]
+
+
+def test_spec_tables_auto_columns() -> None:
+    df = pd.DataFrame({f"score_{i}": range(1000) for i in range(100)})
+    df["model"] = "m"
+    data = Data.from_dataframe(df, columns="auto")
+
+    component = plot(
+        dot(data, x="score_1", y=sql("score_2 * 2"), fill="model"),
+    )
+    component._mimebundle(collect=False)
+
+    # only referenced columns are sent, under a projected table name
+    ((name, payload),) = component.tables.items()
+    assert name != data.table and name.startswith(data.table)
+    assert isinstance(payload, memoryview)
+    table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+    assert table.column_names == ["score_1", "score_2", "model"]
+    assert table.num_rows == 1000
+    assert f'"from":"{name}"' in component.spec
+    assert len(payload) < data._get_data().size / 10
+
+    # a table displays all columns so requires the full table
+    component = vconcat(component, table_component(data))
+    component._mimebundle(collect=False)
+    assert list(component.tables.keys()) == [data.table]
+
+
+def test_data_append_sends_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = _data(29)
+    component = plot(dot(data, x="x", y="y"))
+    component._mimebundle(collect=False)
+
+    sent: list[tuple[Any, Any]] = []
+    monkeypatch.setattr(
+        component, "send", lambda content, buffers: sent.append((content, buffers))
+    )
+    data.append(pd.DataFrame({"x": [100, 101], "y": [100, 101], "z": ["b", "b"]}))
+
+    # only the appended rows are sent
+    ((content, buffers),) = sent
+    assert content == {"type": "append", "table": data.table, "version": 1}
+    rows = pa.ipc.open_stream(buffers[0]).read_all()
+    assert rows.num_rows == 2
+    assert rows.column("x").to_pylist() == [100, 101]
+
+    # widgets displayed after the append send the table version (so that
+    # contexts with the table inserted before the append replace it)
+    assert component.table_versions == {data.table: 0}
+    later = plot(dot(data, x="x", y="y"))
+    later._mimebundle(collect=False)
+    assert later.table_versions == {data.table: 1}
+
+
+def test_selection_preaggregate() -> None:
+    data = _data(43)
+    brush = Selection.crossfilter(preaggregate=True)
+    component = plot(dot(data, x="x", y="y", filter_by=brush), interval_x(target=brush))
+    component._mimebundle(collect=False)
+    assert brush.id in component.preaggregate
+
+    # widgets report whether updates were served by the index
+    for mode, ms in [("scan", 40.0), ("index", 2.5), ("index", 1.5)]:
+        component._handle_message(
+            component,
+            {"type": "selection_stats", "selection": brush.id, "mode": mode, "ms": ms},
+            [],
+        )
+    assert brush.stats() == {"indexed": 2, "scanned": 1, "last_ms": 1.5}
+
+
+def test_selection_and_param_state() -> None:
+    data = _data(47)
+    brush = Selection.intersect()
+    size = Param(3)
+    component = plot(
+        dot(data, x="x", y="y", r=size, filter_by=brush), interval_x(target=brush)
+    )
+    component._mimebundle(collect=False)
+
+    # widgets report selection clauses and param values as they change
+    component._handle_message(
+        component,
+        {"type": "selection_state", "selection": brush.id, "predicates": ['"x" < 5']},
+        [],
+    )
+    component._handle_message(
+        component, {"type": "param_value", "param": size.id, "value": 6}, []
+    )
+    assert brush.predicate() == '("x" < 5)'
+    assert size.value == 6
+
+
+def test_spec_params_referenced_only() -> None:
+    data = _data(53)
+    upstream = Selection.intersect()
+    brush = Selection.intersect(include=Selection.union(include=upstream))
+    offset = Param(2)
+    unused_param, unused_selection = Param(5), Selection.single()
+
+    component = plot(
+        dot(data, x="x", y=sql(f"y + {offset}"), filter_by=brush),
+        interval_x(target=brush),
+    )
+    component._mimebundle(collect=False)
+    params = json.loads(component.spec)["params"]
+
+    # direct, embedded, and transitively included references
+    assert offset.id in params
+    assert brush.id in params and upstream.id in params
+    assert len(params) == 4
+    assert data.selection.id not in params
+    assert unused_param.id not in params and unused_selection.id not in params
+
+
+def test_sampled_data_warning() -> None:
+    df = pd.DataFrame({"x": range(2_000), "y": range(2_000)})
+    data = Data.from_dataframe(df, max_rows=200)
+    component = plot(dot(data, x="x", y="y"))
+    component._mimebundle(collect=False)
+    assert component.warnings == [
+        "Data downsampled from 2,000 to 200 rows (uniform sample)."
+    ]
+
+
+def test_tables_transport_size() -> None:
+    data = _data(200_000)
+    payload_size = data._get_data().size
+
+    def measure(binary: bool) -> int:
+        # bytes on the wire (json state + binary buffers)
+        component = plot(dot(data, x="x", y="y"))
+        component._mimebundle(collect=False, binary=binary)
+        state, _, buffers = _remove_buffers(component.get_state())
+        message = json.dumps(state).encode()
+        return len(message) + sum(len(b) for b in buffers)
+
+    # binary sends the payload as-is, base64 adds ~33%
+    assert measure(binary=True) < payload_size * 1.05
+    assert measure(binary=False) > payload_size * 1.3
+
+
+def _chromium_available() -> bool:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return False
+    with sync_playwright() as p:
+        return Path(p.chromium.executable_path).exists()
+
+
+# decode a table as the widget does (base64 strings are decoded, binary
+# buffers arrive as a DataView which is viewed without copying)
+_DECODE_TABLE_JS = """
+(base64) => {
+    const decode = () => {
+        if (typeof Uint8Array.fromBase64 === 'function') {
+            return Uint8Array.fromBase64(base64);
+        }
+        const binaryString = atob(base64);
+        const bytes = new Uint8Array(binaryString.length);
+        for (let i = 0; i < binaryString.length; i++) {
+            bytes[i] = binaryString.charCodeAt(i);
+        }
+        return bytes;
+    };
+    let start = performance.now();
+    const decoded = decode();
+    const base64Ms = performance.now() - start;
+
+    const view = new DataView(decoded.buffer);
+    start = performance.now();
+    const viewed = new Uint8Array(view.buffer, view.byteOffset, view.byteLength);
+    const binaryMs = performance.now() - start;
+
+    return { base64Size: decoded.length, binarySize: viewed.length, base64Ms, binaryMs };
+}
+"""
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not _chromium_available(), reason="requires playwright chromium")
+def test_tables_decode_benchmark() -> None:
+    from playwright.sync_api import sync_playwright
+
+    payload = _data(200_000)._get_data().to_pybytes()
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        try:
+            page = browser.new_page()
+            timings = page.evaluate(
+                _DECODE_TABLE_JS, base64.b64encode(payload).decode()
+            )
+        finally:
+            browser.close()
+
+    assert timings["base64Size"] == timings["binarySize"] == len(payload)
+    assert timings["binaryMs"] < timings["base64Ms"]
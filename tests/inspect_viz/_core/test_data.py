@@ -0,0 +1,382 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+from textwrap import dedent
+from typing import Any, Callable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+from inspect_viz import Data, options
+from inspect_viz._core import data as data_module
+from inspect_viz.mark import dot
+from inspect_viz.plot import plot
+
+
+def _count_calls(monkeypatch: pytest.MonkeyPatch, name: str) -> Callable[[], int]:
+    # patch a data module function to count calls to it
+    calls = 0
+    fn = getattr(data_module, name)
+
+    def counting(*args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr(data_module, name, counting)
+    return lambda: calls
+
+
+def test_data_ipc_round_trip() -> None:
+    df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+    data = Data.from_dataframe(df)
+
+    payload = data._get_data()
+    assert isinstance(payload, pa.Buffer)
+
+    table = pa.ipc.open_stream(payload).read_all()
+    assert table.column_names == ["x", "y"]
+    assert table.num_rows == 3
+
+
+def test_data_serialized_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_calls(monkeypatch, "_ipc_stream_buffer")
+
+    data = Data.from_dataframe(pd.DataFrame({"x": [3, 1, 2]}))
+    assert data.column_min("x") == 1
+    assert data.column_unique("x") == [3, 1, 2]
+    assert calls() == 0
+
+    payload = data._get_data()
+    assert data._get_data() is payload
+    assert calls() == 1
+
+
+def test_data_column_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_calls(monkeypatch, "_column_stats")
+
+    data = Data.from_dataframe(
+        pd.DataFrame({"score": [0.5, None, 0.25], "model": ["m2", "m1", "m2"]})
+    )
+    assert data.column_stats("score") == {
+        "dtype": "Float64",
+        "min": 0.25,
+        "max": 0.5,
+        "unique": [0.5, None, 0.25],
+        "null_count": 1,
+    }
+    assert data.column_min("score") == 0.25
+    assert calls() == 1
+
+    # remaining columns computed together, then cached until rows are appended
+    assert data.stats()["model"]["unique"] == ["m2", "m1"]
+    assert data.column_unique("model") == ["m2", "m1"]
+    assert calls() == 2
+    data.append(pd.DataFrame({"score": [0.75], "model": ["m3"]}))
+    assert data.column_max("score") == 0.75
+    assert data.column_unique("model") == ["m2", "m1", "m3"]
+    assert calls() == 4
+
+
+def test_data_column_stats_nan() -> None:
+    # nan (which arrow distinguishes from null) isn't valid json
+    data = Data.from_dataframe(
+        pa.table(
+            {
+                "x": pa.array([0.5, float("nan"), None, 0.25]),
+                "y": pa.array([float("nan")] * 4),
+            }
+        )
+    )
+    assert data.column_unique("x") == [0.5, None, 0.25]
+    assert (data.column_min("x"), data.column_max("x")) == (0.25, 0.5)
+    assert data.column_stats("y")["unique"] == [None]
+    assert data.column_min("y") is None and data.column_max("y") is None
+
+
+def test_data_content_addressed() -> None:
+    df = pd.DataFrame({"x": [1, 2, 3], "y": ["d", "e", "f"]})
+    data1 = Data.from_dataframe(df)
+    data2 = Data.from_dataframe(df.copy())
+    data3 = Data.from_dataframe(df.assign(x=[1, 2, 4]))
+
+    # identical content shares table and payload (but not selection)
+    assert data1.table == data2.table
+    assert data1.selection is not data2.selection
+    assert data1._get_data() is data2._get_data()
+    assert Data._get_tables()[data1.table] is data1
+
+    # different content gets its own table
+    assert data3.table != data1.table
+
+
+def test_data_content_hashed_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_calls(monkeypatch, "_content_hash")
+
+    # columns and stats don't require the table name
+    data = Data.from_dataframe(pd.DataFrame({"x": [5, 3, 8], "y": ["p", "q", "r"]}))
+    assert data.columns == ["x", "y"]
+    assert data.column_max("x") == 8
+    assert calls() == 0
+
+    # hashed once when the table is first used
+    assert data.table == data.table
+    assert calls() == 1
+
+    # building components only resolves the data they reference
+    other = Data.from_dataframe(pd.DataFrame({"x": [1, 9], "y": ["s", "t"]}))
+    plot(dot(data, x="x", y="x"))
+    assert calls() == 1
+    assert not other._resolved
+
+
+def test_data_explicit_columns() -> None:
+    df = pd.DataFrame({"x": [1, 2], "y": [3, 4], "z": [5, 6]})
+    data = Data.from_dataframe(df, columns=["x", "z"])
+    assert data.columns == ["x", "z"]
+    table = pa.ipc.open_stream(data._get_data()).read_all()
+    assert table.column_names == ["x", "z"]
+
+
+def test_data_collect_data_once() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [4, 5, 6]}))
+    assert data._collect_data().size == data._get_data().size
+    assert data._collect_data().size == 0
+
+
+def test_data_append() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [7, 8], "y": ["g", "h"]}))
+    payload = data._get_data()
+
+    data.append(pd.DataFrame({"y": ["i"], "x": [9]}))
+    assert len(data) == 3
+    assert data._get_data() is not payload
+    table = pa.ipc.open_stream(data._get_data()).read_all()
+    assert table.column("x").to_pylist() == [7, 8, 9]
+    assert table.column("y").to_pylist() == ["g", "h", "i"]
+
+    # appended data no longer matches new data with the original content
+    data2 = Data.from_dataframe(pd.DataFrame({"x": [7, 8], "y": ["g", "h"]}))
+    assert data2.table != data.table
+
+    with pytest.raises(ValueError):
+        data.append(pd.DataFrame({"x": [10]}))
+
+
+def test_data_append_copy_on_write() -> None:
+    df = pd.DataFrame({"x": [1, 2, 3], "y": ["u", "v", "w"]})
+    data1 = Data.from_dataframe(df)
+    data2 = Data.from_dataframe(df.copy())
+    payload = data1._get_data()
+    assert data1.table == data2.table
+
+    # appending to data which shares its table leaves the other data as is
+    data2.append(pd.DataFrame({"x": [4], "y": ["z"]}))
+    assert len(data1) == 3 and len(data2) == 4
+    assert data2.table != data1.table
+    assert data1._get_data() is payload
+    table = pa.ipc.open_stream(data2._get_data()).read_all()
+    assert table.column("x").to_pylist() == [1, 2, 3, 4]
+
+
+def test_data_from_file_filter(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # files are read with arrow (not pandas)
+    monkeypatch.setattr(pd, "read_parquet", None)
+    monkeypatch.setattr(pd, "read_csv", None)
+
+    df = pd.DataFrame(
+        {"x": range(1000), "y": [f"v{i}" for i in range(1000)], "z": 1.5},
+        index=[f"r{i}" for i in range(1000)],
+    )
+    parquet = tmp_path / "data.parquet"
+    df.to_parquet(parquet, row_group_size=100)
+    csv = tmp_path / "data.csv"
+    df.to_csv(csv, index=False)
+
+    for file in [parquet, csv]:
+        data = Data.from_file(file, columns=["x", "y"], filter=pc.field("x") >= 990)
+        assert data.columns == ["x", "y"]
+        assert len(data) == 10
+        assert data.column_min("x") == 990
+
+    # pandas index columns are not included
+    assert Data.from_file(parquet).columns == ["x", "y", "z"]
+
+
+def test_data_from_files(tmp_path: Path) -> None:
+    for i in range(3):
+        df = pd.DataFrame({"x": range(i * 10, i * 10 + 10), "run": f"run-{i}"})
+        df.to_parquet(tmp_path / f"shard-{i}.parquet")
+    # a shard with wider types and a missing column
+    pd.DataFrame({"x": [30.5]}).to_parquet(tmp_path / "shard-3.parquet")
+
+    data = Data.from_files(tmp_path / "shard-*.parquet", source_file=True)
+    assert data.columns == ["x", "run", "source_file"]
+    assert len(data) == 31
+    table = pa.ipc.open_stream(data._get_data()).read_all()
+    assert table.schema.field("x").type == pa.float64()
+    assert table.column("run").to_pylist()[-1] is None
+    sources = table.column("source_file").to_pylist()
+    assert str(sources[0]).endswith("shard-0.parquet")
+    assert str(sources[-1]).endswith("shard-3.parquet")
+
+    # source file is added to explicit columns
+    data = Data.from_files(tmp_path / "shard-*.parquet", ["x"], source_file=True)
+    assert data.columns == ["x", "source_file"]
+    data = Data.from_files(
+        tmp_path / "shard-*.parquet", ["source_file", "x"], source_file=True
+    )
+    assert data.columns == ["source_file", "x"]
+
+    with pytest.raises(ValueError, match="No files"):
+        Data.from_files([])
+
+    # incompatible schemas are reported with the file
+    pd.DataFrame({"x": ["a"]}).to_parquet(tmp_path / "shard-4.parquet")
+    with pytest.raises(ValueError, match="shard-4.parquet"):
+        Data.from_files(tmp_path / "shard-*.parquet")
+
+
+@pytest.mark.benchmark
+def test_data_from_files_benchmark(tmp_path: Path) -> None:
+    files = []
+    for i in range(200):
+        df = pd.DataFrame({"x": range(i * 500, i * 500 + 500), "run": f"run-{i}"})
+        files.append(tmp_path / f"log-{i}.parquet")
+        df.to_parquet(files[-1])
+
+    start = time.perf_counter()
+    Data.from_dataframe(pd.concat([pd.read_parquet(file) for file in files]))
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = Data.from_files(files)
+    files_time = time.perf_counter() - start
+
+    assert len(data) == 100_000
+    assert files_time < loop_time
+
+
+def test_data_file_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(options, "data_cache", str(tmp_path / "cache"))
+    file = tmp_path / "scores.parquet"
+    pd.DataFrame({"x": range(47), "y": "cached"}).to_parquet(file)
+
+    stats = Data.cache_stats()
+    data1 = Data.from_file(file, columns=["x"])
+    assert Data.cache_stats()["misses"] == stats["misses"] + 1
+
+    # second read is memory mapped from the cache
+    monkeypatch.setattr(data_module, "_read_source_file", None)
+    data2 = Data.from_file(file, columns=["x"])
+    assert Data.cache_stats()["hits"] == stats["hits"] + 1
+    assert data2.table == data1.table
+    assert Data.cache_stats()["entries"] == 1
+    monkeypatch.undo()
+
+    # least recently used files are evicted
+    monkeypatch.setattr(options, "data_cache", str(tmp_path / "cache"))
+    monkeypatch.setattr(options, "data_cache_size", Data.cache_stats()["bytes"])
+    Data.from_file(file, columns=["x"], filter=pc.field("x") > 0)
+    assert Data.cache_stats()["entries"] == 1
+
+
+def test_data_memory_mapped_payload(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    df = pd.DataFrame({"x": range(53), "y": [f"m{i}" for i in range(53)]})
+    uncompressed = tmp_path / "uncompressed.feather"
+    df.to_feather(uncompressed, compression="uncompressed")
+    compressed = tmp_path / "compressed.arrow"
+    df.to_feather(compressed, compression="zstd")
+
+    # the payload is a slice of the mapped file (no ipc serialization)
+    def ipc_stream_buffer(table: pa.Table) -> pa.Buffer:
+        raise AssertionError("payload should not be serialized")
+
+    monkeypatch.setattr(data_module, "_ipc_stream_buffer", ipc_stream_buffer)
+    data = Data.from_file(uncompressed)
+    table = pa.ipc.open_stream(data._get_data()).read_all()
+    assert table.column("y").to_pylist() == df["y"].tolist()
+    monkeypatch.undo()
+
+    # compressed files are decompressed then serialized
+    data = Data.from_file(compressed, columns=["x"])
+    table = pa.ipc.open_stream(data._get_data()).read_all()
+    assert table.column_names == ["x"]
+    assert table.num_rows == 53
+
+
+def test_data_sample() -> None:
+    df = pd.DataFrame(
+        {"x": range(10_000), "model": ["a"] * 9_000 + ["b"] * 990 + ["c"] * 10}
+    )
+
+    for sample in ["uniform", "reservoir"]:
+        data = Data.from_dataframe(df, max_rows=500, sample=sample)
+        assert len(data) == 500
+        assert data.column_max("x") > 9_000
+        assert "Downsampled from 10,000 rows" in str(data)
+
+    # stratified samples are proportional and include small strata
+    data = Data.from_dataframe(df, max_rows=100, sample="stratified:model")
+    table = pa.ipc.open_stream(data._get_data()).read_all()
+    counts = pc.value_counts(table.column("model"))
+    assert dict(
+        zip(
+            counts.field("values").to_pylist(),
+            counts.field("counts").to_pylist(),
+            strict=True,
+        )
+    ) == {"a": 90, "b": 9, "c": 1}
+
+    # data within max_rows is not sampled
+    assert "Downsampled" not in str(Data.from_dataframe(df.head(50), max_rows=100))
+
+    with pytest.raises(ValueError):
+        Data.from_dataframe(df, max_rows=100, sample="stratified:missing")
+    with pytest.raises(ValueError):
+        Data.from_dataframe(df, max_rows=100, sample="systematic")
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="requires /proc peak rss"
+)
+def test_data_peak_rss_benchmark() -> None:
+    # measure in a fresh interpreter, resetting the rss high-water mark
+    # after the data is created so it reflects only serialization
+    script = dedent("""
+        import numpy as np
+        import pandas as pd
+        from inspect_viz import Data
+
+        def status(key):
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith(key):
+                        return int(line.split()[1]) * 1024
+
+        df = pd.DataFrame({f"c{i}": np.random.rand(2_000_000) for i in range(16)})
+        table_size = int(df.memory_usage().sum())
+
+        data = Data.from_dataframe(df)
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        before = status("VmRSS:")
+        payload = data._get_data()
+        peak_growth = status("VmHWM:") - before
+
+        print(table_size, peak_growth, payload.size)
+    """)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    table_size, peak_growth, payload_size = (int(v) for v in result.stdout.split())
+
+    # payload is a single copy of the table, and building it costs
+    # roughly one table's worth of memory (previously ~3x)
+    assert payload_size >= table_size
+    assert peak_growth < 1.5 * table_size
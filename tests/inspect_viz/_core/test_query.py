@@ -0,0 +1,157 @@
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from inspect_viz import Data, Selection, session
+from inspect_viz._core._query import kernel_query
+from inspect_viz.mark import dot
+from inspect_viz.plot import plot
+from pydantic import JsonValue
+
+
+def _data(rows: int) -> Data:
+    return Data.from_dataframe(
+        pd.DataFrame({"x": range(rows), "g": [f"g{i % 3}" for i in range(rows)]})
+    )
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("duckdb") is not None, reason="duckdb is installed"
+)
+def test_kernel_query_requires_duckdb() -> None:
+    component = plot(dot(_data(31), x="x", y="x"))
+    with pytest.raises(ModuleNotFoundError, match="pip install duckdb"):
+        component._mimebundle(collect=False, query_backend="kernel")
+
+
+def test_kernel_query() -> None:
+    pytest.importorskip("duckdb")
+    data = _data(37)
+
+    # aggregated results are returned as arrow
+    result = kernel_query(
+        f'SELECT g, COUNT(*) AS n FROM "{data.table}" GROUP BY g ORDER BY g',
+        "arrow",
+    )
+    assert isinstance(result, pa.Buffer)
+    table = pa.ipc.open_stream(result).read_all()
+    assert table.column("n").to_pylist() == [13, 12, 12]
+
+    # appended rows are visible to subsequent queries
+    data.append(pd.DataFrame({"x": [100], "g": ["g0"]}))
+    result = kernel_query(f'SELECT MAX(x) AS x FROM "{data.table}"', "json")
+    assert result == [{"x": 100}]
+
+
+def test_kernel_query_projection() -> None:
+    pytest.importorskip("duckdb")
+    data = Data.from_dataframe(
+        pd.DataFrame({"x": range(47), "y": range(47), "z": "c"}), columns="auto"
+    )
+    component = plot(dot(data, x="x", y="y"))
+    component._mimebundle(collect=False)
+    (name,) = component.tables.keys()
+    assert name != data.table
+
+    # projections sent to browser widgets can be queried in the kernel
+    result = kernel_query(f'SELECT COUNT(*) AS n FROM "{name}"', "json")
+    assert result == [{"n": 47}]
+
+
+def test_kernel_query_concurrent_sessions() -> None:
+    pytest.importorskip("duckdb")
+
+    def run(i: int) -> pa.Buffer | JsonValue:
+        with session():
+            data = _data(50 + i)
+            return kernel_query(f'SELECT COUNT(*) AS n FROM "{data.table}"', "json")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, range(16)))
+
+    # each session queries its own data
+    assert results == [[{"n": 50 + i}] for i in range(16)]
+
+
+def test_kernel_query_session_isolated() -> None:
+    pytest.importorskip("duckdb")
+    with session():
+        data = _data(53)
+        assert data.selection in Selection._get_all()
+        assert kernel_query(f'SELECT COUNT(*) AS n FROM "{data.table}"', "json")
+
+    # other sessions can't query the data
+    with session(), pytest.raises(Exception, match=data.table):
+        kernel_query(f'SELECT COUNT(*) AS n FROM "{data.table}"', "json")
+
+    # data is filtered in its own session
+    filtered = data.filtered(Selection.intersect(), ['"x" < 3'])
+    assert len(filtered) == 3
+    assert data.selection not in Selection._get_all()
+
+
+def test_kernel_query_widget(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("duckdb")
+    data = _data(41)
+    component = plot(dot(data, x="x", y="x"))
+    component._mimebundle(collect=False, query_backend="kernel")
+
+    # tables are not sent to the browser
+    assert component.tables == {}
+    assert component.query_backend == "kernel"
+
+    # queries from the widget are answered over the comm
+    sent: list[tuple[Any, Any]] = []
+    monkeypatch.setattr(
+        component,
+        "send",
+        lambda content, buffers=None: sent.append((content, buffers)),
+    )
+    component._handle_message(
+        component,
+        {
+            "type": "query",
+            "id": 7,
+            "sql": f'SELECT COUNT(*) AS n FROM "{data.table}"',
+            "query_type": "json",
+        },
+        [],
+    )
+    component._handle_message(
+        component,
+        {
+            "type": "query",
+            "id": 8,
+            "sql": "SELECT * FROM missing",
+            "query_type": "arrow",
+        },
+        [],
+    )
+    assert sent[0] == ({"type": "query_result", "id": 7, "data": [{"n": 41}]}, None)
+    assert sent[1][0]["id"] == 8 and "error" in sent[1][0]
+
+
+def test_selection_predicate() -> None:
+    clauses = ['"x" > 2', "\"g\" = 'g1'"]
+    assert Selection.intersect().predicate(clauses) == '("x" > 2) AND ("g" = \'g1\')'
+    assert Selection.union().predicate(clauses) == '("x" > 2) OR ("g" = \'g1\')'
+    assert Selection.single().predicate(clauses) == "(\"g\" = 'g1')"
+    assert Selection.intersect().predicate() is None
+    assert Selection.intersect(empty=True).predicate() == "FALSE"
+
+
+def test_data_filtered() -> None:
+    pytest.importorskip("duckdb")
+    data = _data(43)
+    selection = Selection.union()
+
+    filtered = data.filtered(selection, ['"x" < 2', '"x" >= 40'])
+    assert filtered.column_unique("x") == [0, 1, 40, 41, 42]
+    assert data.filtered(selection) is data
+
+    # the current state of the selection is used by default
+    data.selection._record_clauses(["\"g\" = 'g2'", '"x" < 10'])
+    assert data.filtered().column_unique("x") == [2, 5, 8]
@@ -0,0 +1,61 @@
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from inspect_viz import Data, Param, Selection, session
+from inspect_viz.mark import dot
+from inspect_viz.plot import plot
+
+
+def test_data_released() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [1, 2, 3, 5, 8]}))
+    data._get_data()
+    ref = weakref.ref(data)
+    table = data.table
+
+    del data
+    gc.collect()
+    assert ref() is None
+    assert table not in {d.table for d in Data._get_all()}
+
+
+def test_data_held_by_components() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [13, 21], "y": [1, 2]}))
+    component = plot(dot(data, x="x", y="y"))
+    del data
+    gc.collect()
+    component._mimebundle(collect=False)
+    assert len(component.tables) == 1
+
+
+def test_session_scope() -> None:
+    with session():
+        data = Data.from_dataframe(pd.DataFrame({"x": [34, 55, 89], "y": [1, 2, 3]}))
+        param = Param(144)
+        component = plot(dot(data, x="x", y="y", r=param))
+        assert data in Data._get_all()
+        assert param in Param._get_all()
+
+    # not visible outside of the session
+    assert not any(d is data for d in Data._get_all())
+    assert param not in Param._get_all()
+
+    # components use their session when rendered
+    component._mimebundle(collect=False)
+    assert list(component.tables) == [data.table]
+    assert param.id in component.spec
+
+
+def test_session_concurrent() -> None:
+    def run(i: int) -> list[Selection]:
+        with session():
+            Selection.intersect()
+            Data.from_dataframe(pd.DataFrame({"x": [i, i + 1]}))
+            return Selection._get_all()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, range(8)))
+
+    # each session sees only its own selections (one for the data)
+    assert all(len(selections) == 2 for selections in results)
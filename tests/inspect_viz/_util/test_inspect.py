@@ -0,0 +1,77 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from inspect_viz._util.inspect import value_to_float, values_to_float
+
+SCORES = [
+    "C",
+    "I",
+    "P",
+    "N",
+    "c",
+    "yes",
+    "No",
+    "TRUE",
+    "false",
+    "1.5",
+    "2",
+    ".5",
+    "٣",
+    "-1",
+    "",
+    "unknown",
+    None,
+    np.nan,
+    1,
+    0.25,
+    True,
+    False,
+]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series(SCORES, dtype=object),
+        pd.Series([s for s in SCORES if isinstance(s, str)]),
+        pd.Series([0.0, 0.5, 1.0, np.nan]),
+        pd.Series([True, False, True]),
+        pd.Series([1, 2, 3]),
+    ],
+)
+def test_values_to_float(values: pd.Series) -> None:
+    to_float = value_to_float()
+    expected = pd.Series([to_float(v) for v in values], index=values.index, dtype=float)
+    pd.testing.assert_series_equal(values_to_float(values), expected)
+
+
+def test_values_to_float_custom_values() -> None:
+    values = pd.Series(["A", "B", "skip", "maybe"], index=[3, 4, 5, 6], name="score")
+    result = values_to_float(values, correct="A", incorrect="B", partial="maybe")
+    assert result.tolist() == [1.0, 0.0, 0.0, 0.5]
+    assert result.index.tolist() == [3, 4, 5, 6]
+    assert result.name == "score"
+
+
+def test_values_to_float_unconvertible() -> None:
+    values = pd.Series(["C", {"value": 1}, [1, 2]], dtype=object)
+    with pytest.warns(UserWarning, match="2 score values"):
+        result = values_to_float(values)
+    assert result.tolist() == [1.0, 0.0, 0.0]
+
+
+@pytest.mark.benchmark
+def test_values_to_float_benchmark() -> None:
+    values = pd.Series(np.random.default_rng(0).choice(["C", "I", "P", "N"], 1_000_000))
+
+    start = time.perf_counter()
+    values.apply(value_to_float())
+    apply_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values_to_float(values)
+    vectorized_time = time.perf_counter() - start
+
+    assert vectorized_time < apply_time / 5
@@ -0,0 +1,16 @@
+import pandas as pd
+import pytest
+from inspect_viz import Data
+from inspect_viz._core import component as component_module
+from inspect_viz.input import select
+
+
+def test_input_binds_own_tables(monkeypatch: pytest.MonkeyPatch) -> None:
+    # inputs are bound eagerly in colab (where they may be the only
+    # component displaying their data)
+    monkeypatch.setattr(component_module, "running_in_colab", lambda: True)
+    data = Data.from_dataframe(pd.DataFrame({"model": ["a", "b", "a"]}))
+    component = select(data, column="model")
+    ((name, payload),) = component.tables.items()
+    assert name == data.table
+    assert len(payload) > 0
@@ -0,0 +1,66 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+from inspect_viz import Data, Selection
+from inspect_viz.input import Typeahead, search, select
+
+
+def samples() -> Data:
+    ids = [f"sample-{i % 500:03d}" for i in range(5000)]
+    return Data.from_dataframe(pd.DataFrame({"id": ids, "score": range(5000)}))
+
+
+def typeahead_limit(typeahead: object) -> int:
+    assert isinstance(typeahead, Typeahead)
+    return typeahead.limit
+
+
+def test_select_typeahead() -> None:
+    data = samples()
+    config = select(data, column="id", typeahead=True).config
+    assert config["from"] == data.table
+    assert typeahead_limit(config["typeahead"]) == 100
+
+    config = search(data, column="id", typeahead=Typeahead(20)).config
+    assert config["from"] == data.table
+    assert typeahead_limit(config["typeahead"]) == 20
+
+
+def test_typeahead_index() -> None:
+    data = samples()
+    component = select(data, column="id", typeahead=Typeahead(index=True))
+
+    # options are queried from an index of sorted distinct values (which
+    # is the only table the input sends)
+    index = component.config["from"]
+    assert index != data.table
+    component._mimebundle(collect=False)
+    ((name, payload),) = component.tables.items()
+    assert name == index
+    assert isinstance(payload, memoryview)
+    table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+    assert table.column("id").to_pylist() == sorted(set(data.column_unique("id")))
+
+    # the index is shared by inputs and rebuilt when rows are appended
+    config = search(data, column="id", typeahead=Typeahead(index=True)).config
+    assert config["from"] == index
+    data.append(pd.DataFrame({"id": ["sample-new"], "score": [0]}))
+    config = search(data, column="id", typeahead=Typeahead(index=True)).config
+    assert config["from"] != index
+
+
+def test_typeahead_invalid() -> None:
+    data = samples()
+    with pytest.raises(ValueError, match="filter_by"):
+        select(
+            data,
+            column="id",
+            filter_by=Selection.intersect(),
+            typeahead=Typeahead(index=True),
+        )
+    with pytest.raises(ValueError, match="auto"):
+        select(data, column="id", value="auto", typeahead=True)
+    with pytest.raises(ValueError, match="data"):
+        select(options=["a", "b"], typeahead=True)
+    with pytest.raises(ValueError, match="positive"):
+        search(data, column="id", typeahead=Typeahead(0))
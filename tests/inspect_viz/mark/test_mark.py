@@ -0,0 +1,53 @@
+import time
+import tracemalloc
+
+import pandas as pd
+import pytest
+from inspect_viz import Component, Data
+from inspect_viz.interactor import nearest_x
+from inspect_viz.mark import dot
+from inspect_viz.plot import legend, plot
+
+
+def test_marks_are_spec_nodes() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [1, 2, 5], "y": [3, 4, 5]}))
+    mark = dot(data, x="x", y="y")
+    for node in [mark, nearest_x(target=data.selection), legend("color")]:
+        assert not isinstance(node, Component)
+        assert not hasattr(node, "__dict__")
+
+    # only the displayed component is a widget
+    component = plot(mark, legend="color")
+    assert isinstance(component, Component)
+    assert component.config["hconcat"][0]["plot"][0] == mark.config  # type: ignore[index,call-overload]
+
+
+def test_standalone_legend_displays() -> None:
+    bundle = legend("color", for_plot="scores")._repr_mimebundle_()
+    assert bundle is not None
+    data, _ = bundle
+    assert "application/vnd.jupyter.widget-view+json" in data
+
+
+def test_plot_marks_memory() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": range(10), "y": range(10, 20)}))
+
+    tracemalloc.start()
+    plot([dot(data, x="x", y="y") for _ in range(1_000)])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # (mark widgets took ~16MB)
+    assert peak < 4_000_000
+
+
+@pytest.mark.benchmark
+def test_plot_marks_benchmark() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": range(11), "y": range(11, 22)}))
+
+    start = time.perf_counter()
+    plot([dot(data, x="x", y="y") for _ in range(1_000)])
+    elapsed = time.perf_counter() - start
+
+    # (mark widgets took ~7s)
+    assert elapsed < 1.0
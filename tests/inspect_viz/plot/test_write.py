@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from inspect_viz import Data
+from inspect_viz.mark import dot
+from inspect_viz.plot import plot, to_html, write_pngs
+from PIL import Image
+
+
+def test_write_pngs_requires_file_per_component() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 7]}))
+    components = [plot(dot(data, x="x", y="y")), plot(dot(data, x="y", y="x"))]
+    with pytest.raises(ValueError, match="one file for each component"):
+        write_pngs(["plot.png"], components)
+    with pytest.raises(ValueError, match="concurrency"):
+        write_pngs(["x.png", "y.png"], components, concurrency=0)
+
+
+def test_to_html_without_dependencies() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [1, 2, 4], "y": [4, 5, 8]}))
+    html = to_html(plot(dot(data, x="x", y="y")), dependencies=False)
+    assert "application/vnd.jupyter.widget-state+json" in html
+    assert "require.min.js" not in html
+
+
+def test_to_html_embeds_only_component_state() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [1, 2, 5], "y": [4, 5, 9]}))
+    sizes = [len(to_html(plot(dot(data, x="x", y="y")))) for _ in range(3)]
+    assert len(set(sizes)) == 1
+
+
+def _chromium_available() -> bool:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return False
+    with sync_playwright() as p:
+        return Path(p.chromium.executable_path).exists()
+
+
+@pytest.mark.skipif(not _chromium_available(), reason="requires playwright chromium")
+def test_write_pngs_renders_images(tmp_path: Path) -> None:
+    data = Data.from_dataframe(pd.DataFrame({"x": [1, 2, 6], "y": [4, 5, 3]}))
+    components = [plot(dot(data, x="x", y="y")), plot(dot(data, x="y", y="x"))]
+    files = [tmp_path / "xy.png", tmp_path / "yx.png"]
+    sizes = write_pngs(files, components, concurrency=1)
+    assert sizes is not None and len(sizes) == 2
+    for file, (width, height) in zip(files, sizes, strict=True):
+        with Image.open(file) as img:
+            assert img.format == "PNG"
+            assert img.size == (width, height)
+            assert width > 0 and height > 0
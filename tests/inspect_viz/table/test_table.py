@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+from inspect_viz import Data
+from inspect_viz.table import table
+
+
+def test_table_server_row_model() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"id": range(10_000), "value": 0.5}))
+    config = table(data, row_model="server", block_size=250).config
+    assert config["row_model"] == "server"
+    assert config["block_size"] == 250
+
+    # client row model is the default (and isn't written to the spec)
+    config = table(data).config
+    assert "row_model" not in config and "block_size" not in config
+
+
+def test_table_block_size_invalid() -> None:
+    data = Data.from_dataframe(pd.DataFrame({"id": [1, 2, 3]}))
+    with pytest.raises(ValueError, match="row_model='server'"):
+        table(data, block_size=100)
+    with pytest.raises(ValueError, match="positive integer"):
+        table(data, row_model="server", block_size=0)
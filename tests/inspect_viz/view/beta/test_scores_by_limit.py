@@ -0,0 +1,131 @@
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from inspect_viz._util.inspect import value_to_float
+from inspect_viz.view.beta import scores_by_limit_df
+
+
+def _samples(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    model = rng.choice([f"model{i}" for i in range(5)], rows)
+    tokens = rng.integers(100, 1_000_000, rows)
+    return pd.DataFrame(
+        {
+            "model": model,
+            "task_id": rng.choice(["task1", "task2", "task3"], rows),
+            "sample_id": np.arange(rows),
+            "score": rng.choice(np.array(["C", "I", "P", 1.0, 0], dtype=object), rows),
+            "model_usage": [
+                json.dumps({m: {"total_tokens": int(t)}})
+                for m, t in zip(model, tokens, strict=True)
+            ],
+            "total_time": rng.random(rows) * 100,
+            "working_time": rng.random(rows) * 50,
+            "log": [f"{m}.eval" for m in model],
+        }
+    )
+
+
+def _scores_by_limit_df_loop(
+    df: pd.DataFrame, score: str, limit: str, steps: int
+) -> pd.DataFrame:
+    # previous (per-limit loop) implementation, used as the reference
+    df = df.dropna(
+        subset=["model", "model_usage", "total_time", "working_time", score]
+    ).copy()
+    if limit == "total_tokens":
+        df["total_tokens"] = df.apply(
+            lambda x: (
+                json.loads(x["model_usage"]).get(x["model"], {}).get("total_tokens", {})
+            ),
+            axis=1,
+        )
+    df[score] = df[score].apply(value_to_float())
+    max_limit, min_limit = df[limit].max(), df[limit].min()
+    if max_limit / min_limit >= 100:
+        limits = np.logspace(np.log10(min_limit), np.log10(max_limit), steps)
+    else:
+        limits = np.linspace(min_limit, max_limit, steps)
+
+    rows: list[dict[str, object]] = []
+    log_by_model = df.groupby("model")["log"].first().to_dict()
+    for current_limit in limits:
+        df_limit = df.copy()
+        df_limit["other_termination_condition"] = (df_limit[limit] < current_limit) & (
+            df_limit[score] == 0
+        )
+        df_limit.loc[df_limit[limit] > current_limit, score] = 0
+        by_task = df_limit.groupby(["model", "task_id"]).agg(
+            success_rate=(score, "mean"),
+            other_termination_rate=("other_termination_condition", "mean"),
+        )
+        by_model_stats = df_limit.groupby(["model"]).agg(
+            success_rate=(score, "mean"),
+            standard_error=(score, "sem"),
+            count=(score, "count"),
+        )
+        by_model = (
+            by_task.groupby(["model"])
+            .agg(other_termination_rate=("other_termination_rate", "mean"))
+            .join(by_model_stats)
+            .reset_index()
+        )
+        for _, row in by_model.iterrows():
+            rows.append(
+                {
+                    limit: current_limit,
+                    "model": row["model"],
+                    "success_rate": row["success_rate"],
+                    "standard_error": row["standard_error"],
+                    "other_termination_rate": row["other_termination_rate"],
+                    "count": row["count"],
+                    "log": log_by_model[row["model"]],
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("limit", ["total_tokens", "total_time", "working_time"])
+def test_scores_by_limit_df(limit: str) -> None:
+    df = _samples(2_000)
+    expected = _scores_by_limit_df_loop(df, "score", limit, steps=25)
+    result = scores_by_limit_df(df.copy(), "score", limit=limit, steps=25)  # type: ignore[arg-type]
+    pd.testing.assert_frame_equal(
+        result, expected, check_exact=False, rtol=1e-12, atol=1e-12
+    )
+
+
+def test_scores_by_limit_df_model_keys() -> None:
+    # non-string models keep their values and dtype (the reference widens
+    # them to float as it reads rows with iterrows)
+    df = _samples(500)
+    df["model"] = df["model"].str.removeprefix("model").astype(int)
+    expected = _scores_by_limit_df_loop(df, "score", "total_time", steps=10)
+    result = scores_by_limit_df(df.copy(), "score", limit="total_time", steps=10)
+    assert result["model"].dtype == df["model"].dtype
+    pd.testing.assert_frame_equal(
+        result,
+        expected,
+        check_dtype=False,
+        check_exact=False,
+        rtol=1e-12,
+        atol=1e-12,
+    )
+
+
+@pytest.mark.benchmark
+def test_scores_by_limit_df_benchmark() -> None:
+    df = _samples(20_000)
+
+    start = time.perf_counter()
+    _scores_by_limit_df_loop(df, "score", "total_time", steps=100)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores_by_limit_df(df.copy(), "score", limit="total_time", steps=100)
+    sweep_time = time.perf_counter() - start
+
+    assert sweep_time < loop_time / 10
@@ -1,4 +1,8 @@
+import time
+
+import numpy as np
 import pandas as pd
+import pytest
 from inspect_viz.view.beta import scores_radar_df
 
 
@@ -41,3 +45,44 @@ def test_scores_radar_df() -> None:
     pd.testing.assert_frame_equal(
         result, expected_df, check_exact=False, rtol=1e-10, atol=1e-10
     )
+
+
+def test_scores_radar_df_invert() -> None:
+    evals_df = pd.DataFrame(
+        {
+            "model": ["model1", "model2", "model3"],
+            "task_id": ["task1", "task1", "task1"],
+            "score_myscorer_accuracy": [0.2, 0.6, 0.4],
+            "score_myscorer_cost": [3.0, 1.0, 2.0],
+        }
+    )
+
+    result = scores_radar_df(evals_df, "myscorer", invert=["cost"])
+
+    # values are raw but ranks (the x coordinate of the second point) are inverted
+    assert result["value"].tolist() == [0.2, 3.0, 0.2, 0.6, 1.0, 0.6, 0.4, 2.0, 0.4]
+    assert result["log"].tolist() == [""] * 9
+    np.testing.assert_allclose(
+        -result["x"].to_numpy()[1::3], [1 / 3, 1.0, 2 / 3], atol=1e-10
+    )
+
+
+@pytest.mark.benchmark
+def test_scores_radar_df_benchmark() -> None:
+    rng = np.random.default_rng(0)
+    models = 1_000
+    evals_df = pd.DataFrame(
+        {
+            "model": [f"model{i}" for i in range(models)],
+            "task_id": ["task"] * models,
+            "log": [f"log{i}" for i in range(models)],
+        }
+        | {f"score_myscorer_metric{j}": rng.random(models) for j in range(50)}
+    )
+
+    start = time.perf_counter()
+    result = scores_radar_df(evals_df, "myscorer")
+    elapsed = time.perf_counter() - start
+
+    assert len(result) == models * 51
+    assert elapsed < 1.0
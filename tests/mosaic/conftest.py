@@ -1,7 +1,8 @@
 from pathlib import Path
 
 import pytest
-from inspect_viz import Component, Data
+from inspect_viz import Data
+from inspect_viz.mark import Mark
 
 
 @pytest.fixture
@@ -10,7 +11,7 @@ def penguins() -> Data:
 
 
 @pytest.fixture
-def dot_mark(penguins: Data) -> Component:
+def dot_mark(penguins: Data) -> Mark:
     from inspect_viz.mark import dot
 
     return dot(
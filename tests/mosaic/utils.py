@@ -1,12 +1,13 @@
 from typing import Any, Type
 
 from inspect_viz import Component, Selection
+from inspect_viz._core.component import SpecNode
 from inspect_viz.interactor import Brush
 from inspect_viz.mark._types import TextStyles
 from pydantic import BaseModel
 
 
-def check_component(component: Component, type: Type[BaseModel]) -> None:
+def check_component(component: Component | SpecNode, type: Type[BaseModel]) -> None:
     model = type.model_validate(component.config)
     assert model.model_dump(exclude_none=True, by_alias=True) == component.config
 